@@ -12,6 +12,10 @@ COMENTARIOS:    Grafica seccion usando el codigo de OPSVIS adaptado para GUI
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import Circle, Polygon, Wedge, Patch
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.transforms import AffineDeltaTransform
 import shutil
 import os
 
@@ -67,9 +71,9 @@ def plot_fiber_section(fib_sec_list, xlabel_x, ylabel_x, fillflag=1, mat_tag_col
                     '#FA8072', '#00FFFF', '#FFFACD', '#C8A2C8',
                     '#AFEEEE', '#F08080', '#87CEEB', '#D8BFD8',
                     '#FFA07A', '#B0E0E6', '#FFEFD5']
-        # Initialize an empty dictionary to store matTag as keys and their 
-        # corresponding colors as values. To see legend of colors.
-        matTag_colors = {}
+    # Initialize an empty dictionary to store matTag as keys and their 
+    # corresponding colors as values. To see legend of colors.
+    matTag_colors = {}
     
     # Create figure with the size that I want
     desired_width_px = 635
@@ -94,160 +98,227 @@ def plot_fiber_section(fib_sec_list, xlabel_x, ylabel_x, fillflag=1, mat_tag_col
     ax.grid(False)
 
     for item in fib_sec_list:
+        if item[0] == 'instance':
+            plot_instance(ax, item, fillflag, mat_tag_color, matcolor, matTag_colors, fibers)
+        else:
+            plot_element(ax, item, fillflag, mat_tag_color, matcolor, matTag_colors, fibers)
+    ax.axis('equal')
+    
+    # Legend of colors
+    if mat_tag_color:
+        # Create a list of patches for the legend
+        patches = [Patch(color=color, label=f'MatTag {matTag}') for matTag, color in matTag_colors.items()]
+        # Add the legend to the plot
+        ax.legend(handles=patches, loc='upper left', bbox_to_anchor=(0.80, 1.02)) # 1.16
+        
+    # Add labels and grid
+    ax.set_xlabel(xlabel_x)
+    ax.set_ylabel(ylabel_x)
 
-        if item[0] == 'layer':
-            matTag = item[2]
-            if item[1] == 'straight':
-                n_bars = item[3]
-                As = item[4]
-                Iy, Iz, Jy, Jz = item[5], item[6], item[7], item[8]
-                r = np.sqrt(As / np.pi)
-                Y = np.linspace(Iy, Jy, n_bars)
-                Z = np.linspace(Iz, Jz, n_bars)
-                for zi, yi in zip(Z, Y):
-                    # To higlight the fibers
-                    if matTag == 21 and mat_tag_color == False:
-                        bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
-                    elif mat_tag_color == True:
-                        bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
-                        matTag_colors[matTag] = matcolor[matTag - 1]
-                    else:
-                        bar = Circle((zi, yi), r, ec='k', fc='k', zorder=10)
-                    ax.add_patch(bar)
-            if item[1] == 'circ':
-                n_bars, As = item[3], item[4]
-                yC, zC, arc_radius = item[5], item[6], item[7]
-                if len(item) > 8:
-                    a0_deg, a1_deg = item[8], item[9]
-                    if (a1_deg - a0_deg) >= 360. and n_bars > 0:
-                        a1_deg = a0_deg + 360. - 360. / n_bars
-                else:
-                    a0_deg, a1_deg = 0., 360. - 360. / n_bars
-
-                a0_rad, a1_rad = np.pi * a0_deg / 180., np.pi * a1_deg / 180.
-                r_bar = np.sqrt(As / np.pi)
-                thetas = np.linspace(a0_rad, a1_rad, n_bars)
-                Y = yC + arc_radius * np.cos(thetas)
-                Z = zC + arc_radius * np.sin(thetas)
-                for zi, yi in zip(Z, Y):
-                    # To higlight the fibers
-                    if matTag == 21 and mat_tag_color == False:
-                        bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
-                    elif mat_tag_color == True:
-                        bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
-                        matTag_colors[matTag] = matcolor[matTag - 1]
-                    else:
-                        bar = Circle((zi, yi), r_bar, ec='k', fc='k', zorder=10)
-                    ax.add_patch(bar)
-
-        if (item[0] == 'patch' and (item[1] == 'quad' or item[1] == 'quadr' or
-                                    item[1] == 'rect')):
-            matTag, nIJ, nJK = item[2], item[3], item[4]
 
-            if item[1] == 'quad' or item[1] == 'quadr':
-                Iy, Iz, Jy, Jz = item[5], item[6], item[7], item[8]
-                Ky, Kz, Ly, Lz = item[9], item[10], item[11], item[12]
+# Function to plot one patch or layer of the section in the axes
+def plot_element(ax, item, fillflag, mat_tag_color, matcolor, matTag_colors, fibers=True):
+    if item[0] == 'layer':
+        matTag = item[2]
+        if item[1] == 'straight':
+            n_bars = item[3]
+            As = item[4]
+            Iy, Iz, Jy, Jz = item[5], item[6], item[7], item[8]
+            r = np.sqrt(As / np.pi)
+            Y = np.linspace(Iy, Jy, n_bars)
+            Z = np.linspace(Iz, Jz, n_bars)
+            for zi, yi in zip(Z, Y):
+                # To higlight the fibers
+                if matTag == 21 and mat_tag_color == False:
+                    bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
+                elif mat_tag_color == True:
+                    bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
+                    matTag_colors[matTag] = matcolor[matTag - 1]
+                else:
+                    bar = Circle((zi, yi), r, ec='k', fc='k', zorder=10)
+                ax.add_patch(bar)
+        if item[1] == 'circ':
+            n_bars, As = item[3], item[4]
+            yC, zC, arc_radius = item[5], item[6], item[7]
+            if len(item) > 8:
+                a0_deg, a1_deg = item[8], item[9]
+                if (a1_deg - a0_deg) >= 360. and n_bars > 0:
+                    a1_deg = a0_deg + 360. - 360. / n_bars
+            else:
+                a0_deg, a1_deg = 0., 360. - 360. / n_bars
+
+            a0_rad, a1_rad = np.pi * a0_deg / 180., np.pi * a1_deg / 180.
+            r_bar = np.sqrt(As / np.pi)
+            thetas = np.linspace(a0_rad, a1_rad, n_bars)
+            Y = yC + arc_radius * np.cos(thetas)
+            Z = zC + arc_radius * np.sin(thetas)
+            for zi, yi in zip(Z, Y):
+                # To higlight the fibers
+                if matTag == 21 and mat_tag_color == False:
+                    bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
+                elif mat_tag_color == True:
+                    bar = Circle((zi, yi), r, ec='k', fc=matcolor[matTag - 1], zorder=10)
+                    matTag_colors[matTag] = matcolor[matTag - 1]
+                else:
+                    bar = Circle((zi, yi), r_bar, ec='k', fc='k', zorder=10)
+                ax.add_patch(bar)
+
+    if (item[0] == 'patch' and (item[1] == 'quad' or item[1] == 'quadr' or
+                                item[1] == 'rect')):
+        matTag, nIJ, nJK = item[2], item[3], item[4]
+
+        if item[1] == 'quad' or item[1] == 'quadr':
+            Iy, Iz, Jy, Jz = item[5], item[6], item[7], item[8]
+            Ky, Kz, Ly, Lz = item[9], item[10], item[11], item[12]
+
+        if item[1] == 'rect':
+            Iy, Iz, Ky, Kz = item[5], item[6], item[7], item[8]
+            Jy, Jz, Ly, Lz = Ky, Iz, Iy, Kz
+
+        # check for convexity (vector products)
+        outIJxIK = (Jy - Iy) * (Kz - Iz) - (Ky - Iy) * (Jz - Iz)
+        outIKxIL = (Ky - Iy) * (Lz - Iz) - (Ly - Iy) * (Kz - Iz)
+        # check if I, J, L points are colinear
+        outIJxIL = (Jy - Iy) * (Lz - Iz) - (Ly - Iy) * (Jz - Iz)
+        # outJKxJL = (Ky-Jy)*(Lz-Jz) - (Ly-Jy)*(Kz-Jz)
+
+        if outIJxIK <= 0 or outIKxIL <= 0 or outIJxIL <= 0:
+            print(
+                '\nWarning! Patch quad is non-convex or counter-clockwise defined or has at least 3 colinear points in line')  # noqa: E501
+
+        IJz, IJy = np.linspace(Iz, Jz, nIJ + 1), np.linspace(Iy, Jy, nIJ + 1)
+        JKz, JKy = np.linspace(Jz, Kz, nJK + 1), np.linspace(Jy, Ky, nJK + 1)
+        LKz, LKy = np.linspace(Lz, Kz, nIJ + 1), np.linspace(Ly, Ky, nIJ + 1)
+        ILz, ILy = np.linspace(Iz, Lz, nJK + 1), np.linspace(Iy, Ly, nJK + 1)
+
+        if fillflag:
+            Z = np.zeros((nIJ + 1, nJK + 1))
+            Y = np.zeros((nIJ + 1, nJK + 1))
+
+            for j in range(nIJ + 1):
+                Z[j, :] = np.linspace(IJz[j], LKz[j], nJK + 1)
+                Y[j, :] = np.linspace(IJy[j], LKy[j], nJK + 1)
+            
+            # Only if the fibers are going to be plotted
+            if fibers:
+                for j in range(nIJ):
+                    for k in range(nJK):
+                        zy = np.array([[Z[j, k], Y[j, k]],
+                                    [Z[j, k + 1], Y[j, k + 1]],
+                                    [Z[j + 1, k + 1], Y[j + 1, k + 1]],
+                                    [Z[j + 1, k], Y[j + 1, k]]])
+                        poly = Polygon(zy, closed=True, ec='k', fc=matcolor[matTag - 1])
+                        ax.add_patch(poly)
+                        if mat_tag_color == True:
+                            matTag_colors[matTag] = matcolor[matTag - 1]  # Save color to legend
+            # If the fibers are not going to be plotted
+            else:
+                zy = np.array([[Iz, Iy], [Jz, Jy], [Kz, Ky], [Lz, Ly]])
+                poly = Polygon(zy, closed=True, ec='k', fc=matcolor[matTag - 1])
+                ax.add_patch(poly)
+                if mat_tag_color == True:
+                    matTag_colors[matTag] = matcolor[matTag - 1]  # Save color to legend
+        else:
+            # horizontal lines
+            for az, bz, ay, by in zip(IJz, LKz, IJy, LKy):
+                plt.plot([az, bz], [ay, by], 'b-', zorder=1)
 
-            if item[1] == 'rect':
-                Iy, Iz, Ky, Kz = item[5], item[6], item[7], item[8]
-                Jy, Jz, Ly, Lz = Ky, Iz, Iy, Kz
+            # vertical lines
+            for az, bz, ay, by in zip(JKz, ILz, JKy, ILy):
+                plt.plot([az, bz], [ay, by], 'b-', zorder=1)
 
-            # check for convexity (vector products)
-            outIJxIK = (Jy - Iy) * (Kz - Iz) - (Ky - Iy) * (Jz - Iz)
-            outIKxIL = (Ky - Iy) * (Lz - Iz) - (Ly - Iy) * (Kz - Iz)
-            # check if I, J, L points are colinear
-            outIJxIL = (Jy - Iy) * (Lz - Iz) - (Ly - Iy) * (Jz - Iz)
-            # outJKxJL = (Ky-Jy)*(Lz-Jz) - (Ly-Jy)*(Kz-Jz)
+    if item[0] == 'patch' and item[1] == 'circ':
+        matTag, nc, nr = item[2], item[3], item[4]
 
-            if outIJxIK <= 0 or outIKxIL <= 0 or outIJxIL <= 0:
-                print(
-                    '\nWarning! Patch quad is non-convex or counter-clockwise defined or has at least 3 colinear points in line')  # noqa: E501
+        yC, zC, ri, re = item[5], item[6], item[7], item[8]
+        a0, a1 = item[9], item[10]
 
-            IJz, IJy = np.linspace(Iz, Jz, nIJ + 1), np.linspace(Iy, Jy, nIJ + 1)
-            JKz, JKy = np.linspace(Jz, Kz, nJK + 1), np.linspace(Jy, Ky, nJK + 1)
-            LKz, LKy = np.linspace(Lz, Kz, nIJ + 1), np.linspace(Ly, Ky, nIJ + 1)
-            ILz, ILy = np.linspace(Iz, Lz, nJK + 1), np.linspace(Iy, Ly, nJK + 1)
+        dr = (re - ri) / nr
+        dth = (a1 - a0) / nc
 
-            if fillflag:
-                Z = np.zeros((nIJ + 1, nJK + 1))
-                Y = np.zeros((nIJ + 1, nJK + 1))
+        # If the fibers are going to be plotted
+        if fibers:
+            for j in range(nr):
+                rj = ri + j * dr
+                rj1 = rj + dr
 
-                for j in range(nIJ + 1):
-                    Z[j, :] = np.linspace(IJz[j], LKz[j], nJK + 1)
-                    Y[j, :] = np.linspace(IJy[j], LKy[j], nJK + 1)
-                
-                # Only if the fibers are going to be plotted
-                if fibers:
-                    for j in range(nIJ):
-                        for k in range(nJK):
-                            zy = np.array([[Z[j, k], Y[j, k]],
-                                        [Z[j, k + 1], Y[j, k + 1]],
-                                        [Z[j + 1, k + 1], Y[j + 1, k + 1]],
-                                        [Z[j + 1, k], Y[j + 1, k]]])
-                            poly = Polygon(zy, closed=True, ec='k', fc=matcolor[matTag - 1])
-                            ax.add_patch(poly)
-                            if mat_tag_color == True:
-                                matTag_colors[matTag] = matcolor[matTag - 1]  # Save color to legend
-                # If the fibers are not going to be plotted
-                else:
-                    zy = np.array([[Iz, Iy], [Jz, Jy], [Kz, Ky], [Lz, Ly]])
-                    poly = Polygon(zy, closed=True, ec='k', fc=matcolor[matTag - 1])
-                    ax.add_patch(poly)
+                for i in range(nc):
+                    thi = a0 + i * dth
+                    thi1 = thi + dth
+                    wedge = Wedge((zC, yC), rj1, thi, thi1, width=dr, ec='k',
+                                lw=1, fc=matcolor[matTag - 1])
+                    ax.add_patch(wedge)
                     if mat_tag_color == True:
                         matTag_colors[matTag] = matcolor[matTag - 1]  # Save color to legend
-            else:
-                # horizontal lines
-                for az, bz, ay, by in zip(IJz, LKz, IJy, LKy):
-                    plt.plot([az, bz], [ay, by], 'b-', zorder=1)
-
-                # vertical lines
-                for az, bz, ay, by in zip(JKz, ILz, JKy, ILy):
-                    plt.plot([az, bz], [ay, by], 'b-', zorder=1)
+        
+        # If the fibers are not going to be plotted
+        else:
+            wedge = Wedge((zC, yC), re, a0, a1, width=re-ri, ec='k', lw=1, fc=matcolor[matTag - 1])
+            ax.add_patch(wedge)
+            if mat_tag_color == True:
+                matTag_colors[matTag] = matcolor[matTag - 1] # Save color to legend
 
-        if item[0] == 'patch' and item[1] == 'circ':
-            matTag, nc, nr = item[2], item[3], item[4]
+        ax.axis('equal')
 
-            yC, zC, ri, re = item[5], item[6], item[7], item[8]
-            a0, a1 = item[9], item[10]
 
-            dr = (re - ri) / nr
-            dth = (a1 - a0) / nc
-
-            # If the fibers are going to be plotted
-            if fibers:
-                for j in range(nr):
-                    rj = ri + j * dr
-                    rj1 = rj + dr
-
-                    for i in range(nc):
-                        thi = a0 + i * dth
-                        thi1 = thi + dth
-                        wedge = Wedge((zC, yC), rj1, thi, thi1, width=dr, ec='k',
-                                    lw=1, fc=matcolor[matTag - 1])
-                        ax.add_patch(wedge)
-                        if mat_tag_color == True:
-                            matTag_colors[matTag] = matcolor[matTag - 1]  # Save color to legend
-            
-            # If the fibers are not going to be plotted
-            else:
-                wedge = Wedge((zC, yC), re, a0, a1, width=re-ri, ec='k', lw=1, fc=matcolor[matTag - 1])
-                ax.add_patch(wedge)
-                if mat_tag_color == True:
-                    matTag_colors[matTag] = matcolor[matTag - 1] # Save color to legend
+# Function to plot an instance: the base element is drawn once, and its patches are repeated in the copies
+def plot_instance(ax, item, fillflag, mat_tag_color, matcolor, matTag_colors, fibers=True):
+    """
+    The copies that are only displaced use one collection for each patch of the base element, with the
+    displacements as offsets (the geometry is not repeated). The rotated copies use the rotated vertices.
 
-            ax.axis('equal')
-    ax.axis('equal')
-    
-    # Legend of colors
-    if mat_tag_color:
-        # Create a list of patches for the legend
-        patches = [Patch(color=color, label=f'MatTag {matTag}') for matTag, color in matTag_colors.items()]
-        # Add the legend to the plot
-        ax.legend(handles=patches, loc='upper left', bbox_to_anchor=(0.80, 1.02)) # 1.16
-        
-    # Add labels and grid
-    ax.set_xlabel(xlabel_x)
-    ax.set_ylabel(ylabel_x)
+    Args:
+        item (list): ['instance', base, transforms, center_y, center_z] (see S01_GUI01_A13_Core.py).
+    """
+    base, transforms = item[1], np.asarray(item[2], dtype=float).reshape(-1, 3)
+    center_y, center_z = item[3], item[4]
+    if len(transforms) == 0:
+        return
+
+    # Draw the base element and take its patches and lines from the axes
+    n_patches, n_lines = len(ax.patches), len(ax.lines)
+    plot_element(ax, base, fillflag, mat_tag_color, matcolor, matTag_colors, fibers)
+    artists = ax.patches[n_patches:] + ax.lines[n_lines:]
+    for artist in artists:
+        artist.remove()
+
+    # Paths of the base in data coordinates (horizontal axis z, vertical axis y)
+    paths = []
+    for artist in artists:
+        if isinstance(artist, Line2D):
+            paths.append(Path(artist.get_xydata()))
+        else:
+            paths.append(artist.get_path().transformed(artist.get_patch_transform()))
+    vertices = np.concatenate([path.vertices for path in paths])
+    if np.any(transforms[:, 2] != 0.0):
+        offsets = None
+    else:
+        offsets = transforms[:, [1, 0]]
+        ax.update_datalim(np.concatenate([vertices.min(axis=0) + offsets, vertices.max(axis=0) + offsets]))
+
+    for artist, path in zip(artists, paths):
+        if isinstance(artist, Line2D):
+            style = {'facecolors': 'none', 'edgecolors': artist.get_color(), 'linewidths': artist.get_linewidth()}
+        else:
+            style = {'facecolors': [artist.get_facecolor()], 'edgecolors': [artist.get_edgecolor()],
+                     'linewidths': artist.get_linewidth()}
+        if offsets is not None:
+            # Same path in all the copies, displaced in data coordinates
+            collection = PathCollection([path], offsets=offsets, offset_transform=ax.transData,
+                                        transform=AffineDeltaTransform(ax.transData), zorder=artist.get_zorder(),
+                                        **style)
+            ax.add_collection(collection, autolim=False)
+        else:
+            # Rotation of the vertices from y to z around the center (all the copies together)
+            z_copies, y_copies = path.vertices[:, 0], path.vertices[:, 1]
+            theta = np.deg2rad(transforms[:, 2])[:, None]
+            y_local, z_local = y_copies[None, :] - center_y, z_copies[None, :] - center_z
+            y_copies = np.cos(theta) * y_local - np.sin(theta) * z_local + center_y + transforms[:, 0:1]
+            z_copies = np.sin(theta) * y_local + np.cos(theta) * z_local + center_z + transforms[:, 1:2]
+            copies = [Path(np.column_stack([z_k, y_k]), path.codes) for z_k, y_k in zip(z_copies, y_copies)]
+            collection = PathCollection(copies, zorder=artist.get_zorder(), **style)
+            ax.add_collection(collection)
+    ax.autoscale_view()
 
 
 # plot_fiber_section is inspired by plotSection matlab function
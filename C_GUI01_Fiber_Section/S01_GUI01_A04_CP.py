@@ -35,6 +35,8 @@ COMENTARIOS:    Recibe una seccion, y la redibuja disponiendo su centro en el CP
 # %%  [01] LIBRERIAS
 import numpy as np
 
+import S01_GUI01_A06_FiberTable as FT
+
 
 # %%  [02] FUNCIONES
 # Function to calculate the centroid of a quadrilateral patch
@@ -158,7 +160,7 @@ def circ_patch_centroid(number_fibers_theta, number_fibers_radius, yC, zC, radiu
     plastic_centroid_x = cx_weighted_sum / total_area_weighted_sum
     plastic_centroid_y = cy_weighted_sum / total_area_weighted_sum
 
-    return plastic_centroid_y, plastic_centroid_x
+    return plastic_centroid_x, plastic_centroid_y
 
 
 # Function to calculate the centroid of a circular layer
@@ -188,22 +190,25 @@ def circ_layer_centroid(number_bars, yC, zC, radius, angle_beginning, angle_end)
     return cx, cy
 
 
-def Seccion_CP(fib_sec, materials):
-    # Define number of decimals for rounding
-    num_decimals = 4
-    
-    # Initialize variables for centroid calculation
-    total_weighted_area = 0.0
-    cx_weighted_sum = 0.0
-    cy_weighted_sum = 0.0
+# Function to calculate the area, centroid and matTag of each patch and layer of the section
+def element_properties(fib_sec):
+    """
+    Area and centroid of each patch and layer. It is calculated once for the section, and then it can be
+    used to calculate the plastic centroid for any number of material strength sets.
 
-    # Loop over fibers
-    for fiber in fib_sec:
+    Args:
+        fib_sec (list): Section list in the OPSVIS format with numeric values.
+
+    Returns:
+        dict: Arrays 'area', 'cy', 'cz', 'matTag' and 'element' (index of the element in fib_sec).
+    """
+    area_list, cy_list, cz_list, mat_list, element_list = [], [], [], [], []
+    for index, fiber in enumerate(fib_sec):
         if fiber[0] == 'patch':
-            mat_id = fiber[2]
             if fiber[1] == 'quad':
                 coords = fiber[5:]
                 cx, cy, area = quad_centroid_area(coords)
+                area = abs(area)
             elif fiber[1] == 'rect':
                 coords = fiber[5:]
                 area = rect_area(coords)
@@ -216,33 +221,115 @@ def Seccion_CP(fib_sec, materials):
                 ang_beg, ang_end = fiber[9], fiber[10]
                 area = area_circ_wedge(ri, re, ang_beg, ang_end)
                 cx, cy = circ_patch_centroid(n_fib_th, n_fib_r, yC, zC, ri, re, ang_beg, ang_end)
-            total_weighted_area += area * materials[str(mat_id)]
-            cx_weighted_sum += area * cx * materials[str(mat_id)]
-            cy_weighted_sum += area * cy * materials[str(mat_id)]
+            else:
+                continue
         elif fiber[0] == 'layer':
-            mat_id = fiber[2]
             num_bars = fiber[3]
             As = fiber[4]
             area = As * num_bars
             if fiber[1] == 'straight':
                 y1, z1, y2, z2 = fiber[5:]
                 cx, cy = (y1 + y2) / 2.0, (z1 + z2) / 2.0
-            elif fiber[0] == 'layer' and fiber[1] == 'circ':
+            elif fiber[1] == 'circ':
                 yC = fiber[5]
                 zC = fiber[6]
                 r = fiber[7]
                 a_beg = fiber[8]
                 a_end = fiber[9]
                 cx, cy = circ_layer_centroid(num_bars, yC, zC, r, a_beg, a_end)
-            total_weighted_area += area * materials[str(mat_id)]
-            cx_weighted_sum += area * cx * materials[str(mat_id)]
-            cy_weighted_sum += area * cy * materials[str(mat_id)]
+            else:
+                continue
+        elif fiber[0] == 'instance':
+            # The centroid of the base element is moved to each copy
+            base = element_properties([fiber[1]])
+            base_cy, base_cz = FT.instance_points(base['cy'], base['cz'], *fiber[2:5])
+            area_list.extend(np.tile(base['area'], len(base_cy)))
+            cy_list.extend(base_cy.ravel())
+            cz_list.extend(base_cz.ravel())
+            mat_list.extend(np.tile(base['matTag'], len(base_cy)))
+            element_list.extend([index] * base_cy.size)
+            continue
+        else:
+            continue
+        area_list.append(area)
+        cy_list.append(cx)
+        cz_list.append(cy)
+        mat_list.append(int(fiber[2]))
+        element_list.append(index)
+
+    return {'area': np.array(area_list, dtype=float),
+            'cy': np.array(cy_list, dtype=float),
+            'cz': np.array(cz_list, dtype=float),
+            'matTag': np.array(mat_list, dtype=int),
+            'element': np.array(element_list, dtype=int)}
+
+
+# Function to calculate the plastic centroid for many material strength sets
+def batch_plastic_centroid(properties, strengths, tags):
+    """
+    Plastic centroid of the section for many material strength sets (e.g. variability of f'c and fy).
 
-    # Calculate plastic centroid coordinates
-    plastic_centroid_x = cx_weighted_sum / total_weighted_area  # round(, 6)
-    plastic_centroid_y = cy_weighted_sum / total_weighted_area  # round(, 6)
+    The area and first moments of the elements are added by matTag, so each set costs one row of a matrix
+    product: [sum(f*A), sum(f*A*y), sum(f*A*z)] = strengths @ [A_tag, Sy_tag, Sz_tag].
+
+    Args:
+        properties (dict): Element properties, see element_properties.
+        strengths (numpy.ndarray): Strength of each matTag in each set, shape (n_sets, len(tags)).
+        tags (list): matTag of each column of strengths. Elements with other matTags don't contribute.
+
+    Returns:
+        numpy.ndarray: Plastic centroid (y, z) of each set, shape (n_sets, 2). A ValueError is raised if the total
+            weighted area of a set is zero.
+    """
+    tags = np.asarray(tags, dtype=int)
+    # Matrix (n_elements x n_tags) with the matTag of each element
+    one_hot = (properties['matTag'][:, None] == tags[None, :]).astype(float)
+    area = properties['area']
+    moments = one_hot.T @ np.column_stack([area, area * properties['cy'], area * properties['cz']])
+    weighted = np.atleast_2d(np.asarray(strengths, dtype=float)) @ moments
+    if np.any(weighted[:, 0] == 0.0):
+        raise ValueError("The total weighted area of the section is zero: check the strength of the materials.")
+    return weighted[:, 1:] / weighted[:, :1]
+
+
+# Function to create the matrix of strengths from dictionaries like 'Material_Strength.txt'
+def strength_matrix(materials_list, tags=None):
+    """
+    Args:
+        materials_list (list): Dictionaries with the strength of each matTag, e.g. [{'1': 300.0, '3': 4200.0}].
+        tags (list): matTags of the columns (e.g. the matTags of the section in element_properties). None uses all
+            the matTags in the dictionaries.
+
+    Returns:
+        tuple: (strengths, tags) with strengths of shape (len(materials_list), len(tags)). A ValueError is raised if
+            a matTag doesn't have strength in a dictionary.
+    """
+    if tags is None:
+        tags = sorted({int(tag) for materials in materials_list for tag in materials})
+    tags = [int(tag) for tag in tags]
+    for materials in materials_list:
+        undefined = [tag for tag in tags if str(tag) not in materials]
+        if undefined:
+            raise ValueError(f"The strength of the matTags {undefined} is not defined.")
+    strengths = np.array([[float(materials[str(tag)]) for tag in tags] for materials in materials_list],
+                         dtype=float).reshape(len(materials_list), len(tags))
+    return strengths, tags
+
+
+def Seccion_CP(fib_sec, materials, plastic_centroid=None, verbose=True):
+    # Define number of decimals for rounding
+    num_decimals = 4
+
+    # Calculate the plastic centroid with the strength of the materials (if it was not calculated before, e.g.
+    # with the incremental state of S01_GUI01_A10_SectionState.py)
+    if plastic_centroid is None:
+        properties = element_properties(fib_sec)
+        strengths, tags = strength_matrix([materials], np.unique(properties['matTag']).tolist())
+        plastic_centroid = batch_plastic_centroid(properties, strengths, tags)[0]
+    plastic_centroid_x, plastic_centroid_y = float(plastic_centroid[0]), float(plastic_centroid[1])
 
-    print(f"Plastic Centroid: ({plastic_centroid_x}, {plastic_centroid_y})")
+    if verbose:
+        print(f"Plastic Centroid: ({plastic_centroid_x}, {plastic_centroid_y})")
 
     # Adjust coordinates to the plastic centroid
     adjusted_fib_sec = []
@@ -290,5 +377,11 @@ def Seccion_CP(fib_sec, materials):
                 adjusted_fib_sec.append(
                     ['layer', 'circ', mat_id, fiber[3], fiber[4], adjusted_cx, adjusted_cy, fiber[7], fiber[8],
                      fiber[9]])
+        elif fiber[0] == 'instance':
+            # The base element and the center of the rotations are moved, the displacements of the copies don't
+            # change
+            base = Seccion_CP([fiber[1]], materials, (plastic_centroid_x, plastic_centroid_y), verbose=False)
+            adjusted_cx, adjusted_cy = round(fiber[3] - plastic_centroid_x, num_decimals), round(fiber[4] - plastic_centroid_y, num_decimals)
+            adjusted_fib_sec.append(['instance', base[0] if base else fiber[1], fiber[2], adjusted_cx, adjusted_cy])
 
     return adjusted_fib_sec
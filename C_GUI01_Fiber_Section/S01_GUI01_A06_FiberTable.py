@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A06_FiberTable.py
+COMENTARIOS:    Discretiza una seccion (lista de patch/layer) en una tabla de fibras con arrays de NumPy.
+                La tabla es la base de los calculos de seccion (diagramas de interaccion, M-phi, etc.).
+"""
+
+# %% [00] INTRODUCTION
+# The fiber table is a dictionary of 1-D arrays with one entry per fiber:
+#
+#   fibers = {'y': ..., 'z': ..., 'area': ..., 'matTag': ..., 'element': ...}
+#
+# 'element' is the index of the patch/layer in the section list that generated the fiber, so the
+# results can be traced back to the section definition.
+# The discretization follows the OpenSees commands:
+#   - patch rect/quad: isoparametric grid of nIJ x nJK cells (same grid used in the plots).
+#   - patch circ: annular sectors, y = yC + r*cos(theta), z = zC + r*sin(theta).
+#   - layer straight: nBars equally spaced between I and J (midpoint if nBars = 1).
+#   - layer circ: nBars equally spaced in the arc (full circles do not repeat the first bar).
+#   - instance: ['instance', base, transforms, center_y, center_z], copies of the base element (patch or layer).
+#     Each transform [dy, dz, angle] moves the points p of the base to R(angle) (p - center) + center + (dy, dz),
+#     with the rotation from y to z. Only the base is discretized, and its fibers are moved to all the copies.
+# The section must be numeric, i.e. the unit strings ('40.0*cm') must be converted before.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+
+# %%  [02] FUNCIONES
+# Function to obtain the fibers of a quadrilateral patch (rect or quad)
+def quad_fibers(nIJ, nJK, Iy, Iz, Jy, Jz, Ky, Kz, Ly, Lz):
+    """
+    Fibers of a quadrilateral patch defined by the points I, J, K, L.
+
+    Returns:
+        tuple: (y, z, area) arrays with nIJ * nJK fibers.
+    """
+    # Grid of (nIJ + 1) x (nJK + 1) points, equal to the grid in plot_fiber_section
+    s = np.linspace(0.0, 1.0, nIJ + 1)[:, None]
+    t = np.linspace(0.0, 1.0, nJK + 1)[None, :]
+    IJy, IJz = Iy + (Jy - Iy) * s, Iz + (Jz - Iz) * s
+    LKy, LKz = Ly + (Ky - Ly) * s, Lz + (Kz - Lz) * s
+    Y = IJy + (LKy - IJy) * t
+    Z = IJz + (LKz - IJz) * t
+
+    # Vertices of each cell (counter-clockwise in the grid)
+    vy = np.stack([Y[:-1, :-1], Y[:-1, 1:], Y[1:, 1:], Y[1:, :-1]], axis=-1).reshape(-1, 4)
+    vz = np.stack([Z[:-1, :-1], Z[:-1, 1:], Z[1:, 1:], Z[1:, :-1]], axis=-1).reshape(-1, 4)
+
+    # Shoelace formula for all the cells at once
+    vy_next, vz_next = np.roll(vy, -1, axis=1), np.roll(vz, -1, axis=1)
+    cross = vy * vz_next - vy_next * vz
+    area = 0.5 * cross.sum(axis=1)
+    y = ((vy + vy_next) * cross).sum(axis=1) / (6.0 * area)
+    z = ((vz + vz_next) * cross).sum(axis=1) / (6.0 * area)
+    return y, z, np.abs(area)
+
+
+# Function to obtain the fibers of a circular patch
+def circ_patch_fibers(nc, nr, yC, zC, ri, re, a0, a1):
+    """
+    Fibers of a circular patch. The angles a0 and a1 are in degrees.
+
+    Returns:
+        tuple: (y, z, area) arrays with nc * nr fibers.
+    """
+    r = np.linspace(ri, re, nr + 1)
+    th = np.deg2rad(np.linspace(a0, a1, nc + 1))
+    dth = th[1] - th[0]
+    r0, r1 = r[:-1, None], r[1:, None]
+    th_mid = 0.5 * (th[:-1] + th[1:])[None, :]
+
+    # Area and centroid of each annular sector
+    area = 0.5 * (r1 ** 2 - r0 ** 2) * abs(dth) * np.ones_like(th_mid)
+    r_cen = (2.0 / 3.0) * (r1 ** 3 - r0 ** 3) / (r1 ** 2 - r0 ** 2) * np.sinc(dth / (2.0 * np.pi))
+    y = yC + r_cen * np.cos(th_mid)
+    z = zC + r_cen * np.sin(th_mid)
+    return y.ravel(), z.ravel(), area.ravel()
+
+
+# Function to obtain the fibers of a straight layer
+def straight_layer_fibers(n_bars, As, Iy, Iz, Jy, Jz):
+    if n_bars == 1:
+        y, z = np.array([(Iy + Jy) / 2.0]), np.array([(Iz + Jz) / 2.0])
+    else:
+        y, z = np.linspace(Iy, Jy, n_bars), np.linspace(Iz, Jz, n_bars)
+    return y, z, np.full(n_bars, float(As))
+
+
+# Function to obtain the fibers of a circular layer
+def circ_layer_fibers(n_bars, As, yC, zC, radius, a0=0.0, a1=None):
+    if a1 is None:
+        a1 = 360.0 - 360.0 / n_bars
+    elif (a1 - a0) >= 360.0:
+        a1 = a0 + 360.0 - 360.0 / n_bars
+    th = np.deg2rad(np.linspace(a0, a1, n_bars))
+    y = yC + radius * np.cos(th)
+    z = zC + radius * np.sin(th)
+    return y, z, np.full(n_bars, float(As))
+
+
+# Function to move points to the position of each copy of an instance
+def instance_points(y, z, transforms, center_y=0.0, center_z=0.0):
+    """
+    Args:
+        y, z (array): Points of the base element.
+        transforms (list): [dy, dz, angle] of each copy, angle in degrees around (center_y, center_z).
+
+    Returns:
+        tuple: (y, z) arrays of shape (n_copies, n_points).
+    """
+    transforms = np.asarray(transforms, dtype=float).reshape(-1, 3)
+    theta = np.deg2rad(transforms[:, 2])[:, None]
+    cos, sin = np.cos(theta), np.sin(theta)
+    y_local = np.asarray(y, dtype=float)[None, :] - center_y
+    z_local = np.asarray(z, dtype=float)[None, :] - center_z
+    return (cos * y_local - sin * z_local + center_y + transforms[:, 0:1],
+            sin * y_local + cos * z_local + center_z + transforms[:, 1:2])
+
+
+# Function to obtain the material tag of an element (the base element of an instance)
+def element_mat_tag(item):
+    return int(item[1][2]) if item[0] == 'instance' else int(item[2])
+
+
+# Function to obtain the fibers of one element of the section
+def element_fibers(item):
+    """
+    Fibers of one patch or layer of the section list.
+
+    Args:
+        item (list): Element in the OPSVIS format, e.g. ['patch', 'rect', 1, 5, 2, 0, 0, 40, 40], or an instance.
+
+    Returns:
+        tuple: (y, z, area) arrays. Empty arrays for the 'section' definition.
+    """
+    if item[0] == 'patch':
+        if item[1] == 'rect':
+            Iy, Iz, Ky, Kz = item[5:9]
+            return quad_fibers(item[3], item[4], Iy, Iz, Ky, Iz, Ky, Kz, Iy, Kz)
+        elif item[1] in ['quad', 'quadr']:
+            return quad_fibers(item[3], item[4], *item[5:13])
+        elif item[1] == 'circ':
+            return circ_patch_fibers(*item[3:11])
+    elif item[0] == 'layer':
+        if item[1] == 'straight':
+            return straight_layer_fibers(*item[3:9])
+        elif item[1] == 'circ':
+            return circ_layer_fibers(*item[3:10])
+    elif item[0] == 'instance':
+        y, z, area = element_fibers(item[1])
+        y, z = instance_points(y, z, *item[2:5])
+        return y.ravel(), z.ravel(), np.tile(area, len(y))
+    empty = np.zeros(0)
+    return empty, empty, empty
+
+
+# Function to count the fibers of one element without discretizing it
+def element_fiber_count(item):
+    """
+    Returns:
+        int: nIJ * nJK (rect and quad patches), nc * nr (circ patches), nBars (layers), multiplied by the number of
+            copies in an instance. The values can have units (only the subdivisions are read).
+    """
+    if item[0] == 'patch' and item[1] in ['rect', 'quad', 'quadr', 'circ']:
+        return int(item[3]) * int(item[4])
+    elif item[0] == 'layer' and item[1] in ['straight', 'circ']:
+        return int(item[3])
+    elif item[0] == 'instance':
+        return element_fiber_count(item[1]) * len(item[2])
+    return 0
+
+
+# Function to count the fibers of the section
+def fiber_count(fib_sec):
+    return sum(element_fiber_count(item) for item in fib_sec)
+
+
+# Function to create the fiber table of the section
+def fiber_table(fib_sec):
+    """
+    Discretize a section in fibers.
+
+    Args:
+        fib_sec (list): Section list in the OPSVIS format with numeric values.
+
+    Returns:
+        dict: Arrays 'y', 'z', 'area', 'matTag' and 'element' (index of the element in fib_sec).
+    """
+    y_list, z_list, area_list, mat_list, element_list = [], [], [], [], []
+    for index, item in enumerate(fib_sec):
+        if item[0] not in ['patch', 'layer', 'instance']:
+            continue
+        y, z, area = element_fibers(item)
+        y_list.append(y)
+        z_list.append(z)
+        area_list.append(area)
+        mat_list.append(np.full(len(y), element_mat_tag(item)))
+        element_list.append(np.full(len(y), index))
+
+    if not y_list:
+        empty = np.zeros(0)
+        return {'y': empty, 'z': empty, 'area': empty, 'matTag': empty.astype(int), 'element': empty.astype(int)}
+
+    return {'y': np.concatenate(y_list),
+            'z': np.concatenate(z_list),
+            'area': np.concatenate(area_list),
+            'matTag': np.concatenate(mat_list),
+            'element': np.concatenate(element_list)}
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    # Rectangular column 40x60 with 3 + 3 bars
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 10, 6, -30.0, -20.0, 30.0, 20.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 15.0]]
+    fibers_1 = fiber_table(fib_sec_1)
+    print(f"Number of fibers: {len(fibers_1['y'])} (counted without the table: {fiber_count(fib_sec_1)})")
+    print(f"Total area: {fibers_1['area'].sum()} (expected {40 * 60 + 6 * 5.07})")
+
+    # Instance: 4 copies of a bar every 10 cm
+    bar_1 = ['instance', ['layer', 'straight', 3, 1, 5.07, 0.0, 0.0, 0.0, 0.0],
+             [[0.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 20.0, 0.0], [0.0, 30.0, 0.0]], 0.0, 0.0]
+    print(f"Bars of the instance (z): {element_fibers(bar_1)[1]}")
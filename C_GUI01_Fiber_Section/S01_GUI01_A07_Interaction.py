@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A07_Interaction.py
+COMENTARIOS:    Calcula el diagrama de interaccion P-M de una seccion en base a su tabla de fibras.
+                Todas las posiciones del eje neutro se evaluan en un solo calculo matricial de NumPy.
+"""
+
+# %% [00] INTRODUCTION
+# The section must be drawn with respect to its plastic centroid (see S01_GUI01_A04_CP.py), so the moments
+# are calculated around the origin (ref) without undesired eccentricity.
+#
+#   Strain field (n_points x n_fibers)  -->  Stress (n_points x n_fibers)  -->  P = S @ A,  M = S @ (A * u)
+#
+# Sign convention: compression is positive for strains, stresses and P. The moment is positive when the
+# compression is on the positive side of the coordinate u, where u = y for bending about the z axis and
+# u = z for bending about the y axis.
+# For the biaxial surface, the compression side is rotated an angle alpha from the y axis towards the z axis,
+# u = y*cos(alpha) + z*sin(alpha), and the moments are My = sum(S * A * z) and Mz = sum(S * A * y).
+# The stresses are evaluated with a material library (see S01_GUI01_A08_Materials.py). The library can be
+# created from the strengths of the GUI ('Material_Strength.txt') with MT.strength_library(materials, steel_tags).
+# The fibers with a matTag that is not in the library don't contribute to the section.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import S01_GUI01_A08_Materials as MT
+
+
+# %%  [02] FUNCIONES
+# Function to create the strain fields of the neutral axis positions
+def strain_profiles(u, n_points, eps_cu=0.003, eps_su=0.05):
+    """
+    Linear strain fields with eps_cu in the fiber with maximum u.
+
+    The strain in the opposite extreme fiber goes from eps_cu (uniform compression) to -eps_su. A quadratic
+    spacing gives more points near the balanced failure.
+
+    Returns:
+        numpy.ndarray: Strains with shape (n_points, len(u)).
+    """
+    t = np.linspace(0.0, 1.0, n_points) ** 2
+    eps_opp = eps_cu - (eps_cu + eps_su) * t
+    u_max, u_min = u.max(), u.min()
+    ratio = (u - u_min) / max(u_max - u_min, np.finfo(float).tiny)
+    return eps_opp[:, None] + (eps_cu - eps_opp)[:, None] * ratio[None, :]
+
+
+# Function to calculate the points of the interaction diagram
+def interaction_diagram(fibers, library, axis='z', n_points=50, ref=(0.0, 0.0), eps_cu=0.003, eps_su=0.05):
+    """
+    Interaction diagram P-M of the section for a bending axis.
+
+    Args:
+        fibers (dict): Fiber table, see S01_GUI01_A06_FiberTable.fiber_table.
+        library (dict): Material library, see S01_GUI01_A08_Materials.py.
+        axis (str): Bending axis, 'z' (strains vary with y) or 'y' (strains vary with z).
+        n_points (int): Number of neutral axis positions for each side of the diagram.
+        ref (tuple): Point (y, z) used to calculate the moments. The plastic centroid is (0, 0) for a section
+            drawn with respect to it.
+        eps_cu (float): Strain in the extreme compression fiber.
+        eps_su (float): Maximum tensile strain in the extreme tension fiber.
+
+    Returns:
+        tuple: (P, M) arrays that define the closed interaction diagram, starting in pure compression.
+    """
+    if axis == 'z':
+        u = fibers['y'] - ref[0]
+    elif axis == 'y':
+        u = fibers['z'] - ref[1]
+    else:
+        raise ValueError("The bending axis must be 'y' or 'z'.")
+
+    # Strain fields for positive (compression in u_max) and negative (compression in u_min) bending
+    strain_pos = strain_profiles(u, n_points, eps_cu, eps_su)
+    strain_neg = strain_profiles(-u, n_points, eps_cu, eps_su)[::-1]
+    strain_ten = np.full((1, len(u)), -eps_su)
+    strain = np.vstack([strain_pos, strain_ten, strain_neg])
+
+    # Section forces for all the strain fields at once
+    stress = MT.fiber_response(library, fibers['matTag'], strain)[0]
+    P = stress @ fibers['area']
+    M = stress @ (fibers['area'] * u)
+    return P, M
+
+
+# Fiber arrays shared with the workers of the process pool
+_shared_fibers = {}
+
+
+# Function to attach the worker to the fiber arrays in shared memory
+def _init_surface_worker(shm_name, n_fibers, library, options):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _shared_fibers['shm'] = shm  # Keep the reference, the array uses its buffer
+    _shared_fibers['data'] = np.ndarray((4, n_fibers), dtype=np.float64, buffer=shm.buf)
+    _shared_fibers['library'] = library
+    _shared_fibers['options'] = options
+
+
+# Function to calculate the forces of all the neutral axis depths for one angle
+def _surface_angle(data, alpha, library, n_points, ref, eps_cu, eps_su):
+    y, z = data[0] - ref[0], data[1] - ref[1]
+    area, mat_tags = data[2], data[3].astype(int)
+    u = y * np.cos(alpha) + z * np.sin(alpha)
+    strain = np.vstack([strain_profiles(u, n_points, eps_cu, eps_su), np.full((1, len(u)), -eps_su)])
+    stress = MT.fiber_response(library, mat_tags, strain)[0]
+    return stress @ area, stress @ (area * z), stress @ (area * y)
+
+
+# Function executed by the workers of the process pool
+def _surface_angle_worker(alpha):
+    return _surface_angle(_shared_fibers['data'], alpha, _shared_fibers['library'], **_shared_fibers['options'])
+
+
+# Function to calculate the biaxial interaction surface
+def interaction_surface(fibers, library, n_angles=36, n_points=30, ref=(0.0, 0.0), eps_cu=0.003, eps_su=0.05,
+                        n_workers=None):
+    """
+    Biaxial interaction surface P-My-Mz of the section.
+
+    For each angle of the neutral axis, all the depths are evaluated in one matrix product (see
+    interaction_diagram). The angles are distributed in a process pool; the fiber arrays are placed once in
+    shared memory, so they are not copied to each task.
+
+    Args:
+        fibers (dict): Fiber table, see S01_GUI01_A06_FiberTable.fiber_table.
+        library (dict): Material library, see S01_GUI01_A08_Materials.py.
+        n_angles (int): Number of angles of the neutral axis in [0, 360).
+        n_points (int): Number of neutral axis depths for each angle.
+        n_workers (int): Number of processes. None uses os.cpu_count(); 1 calculates in this process.
+        Other arguments as in interaction_diagram.
+
+    Returns:
+        dict: Arrays 'P', 'My', 'Mz' with shape (n_angles, n_points + 1), from pure compression to pure
+            tension for each angle, and 'alpha' with the angles in degrees.
+    """
+    alphas = np.deg2rad(np.arange(n_angles) * 360.0 / n_angles)
+    options = {'n_points': n_points, 'ref': tuple(ref), 'eps_cu': eps_cu, 'eps_su': eps_su}
+    n_fibers = len(fibers['y'])
+    data = np.vstack([fibers['y'], fibers['z'], fibers['area'], fibers['matTag']]).astype(np.float64)
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, n_angles)
+
+    if n_workers <= 1:
+        results = [_surface_angle(data, alpha, library, **options) for alpha in alphas]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+        try:
+            np.ndarray(data.shape, dtype=np.float64, buffer=shm.buf)[:] = data
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_surface_worker,
+                                     initargs=(shm.name, n_fibers, library, options)) as pool:
+                results = list(pool.map(_surface_angle_worker, alphas))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    P, My, Mz = (np.array(values) for values in zip(*results))
+    return {'P': P, 'My': My, 'Mz': Mz, 'alpha': np.rad2deg(alphas)}
+
+
+# Function to plot the interaction diagram
+def plot_interaction_diagram(P, M, xlabel_x='M', ylabel_x='P', ax=None):
+    import matplotlib.pyplot as plt
+    if ax is None:
+        fig, ax = plt.subplots()
+    ax.plot(M, P, 'b-', zorder=10)
+    ax.axhline(0.0, color='k', lw=0.8)
+    ax.axvline(0.0, color='k', lw=0.8)
+    ax.set_xlabel(xlabel_x)
+    ax.set_ylabel(ylabel_x)
+    ax.grid(True)
+    return ax
+
+
+# Function to plot the biaxial interaction surface
+def plot_interaction_surface(surface, ax=None):
+    import matplotlib.pyplot as plt
+    if ax is None:
+        fig = plt.figure()
+        ax = fig.add_subplot(projection='3d')
+    # Close the mesh in the angle direction
+    My, Mz, P = (np.vstack([surface[key], surface[key][:1]]) for key in ['My', 'Mz', 'P'])
+    ax.plot_surface(My, Mz, P, color='lightblue', edgecolor='k', lw=0.3, alpha=0.8)
+    ax.set_xlabel('My')
+    ax.set_ylabel('Mz')
+    ax.set_zlabel('P')
+    return ax
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import S01_GUI01_A06_FiberTable as FT
+
+    # Rectangular column 40x60 [cm] with 3 + 3 bars, strength in [kgf/cm2]
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 30, 10, -30.0, -20.0, 30.0, 20.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 15.0]]
+    library_1 = MT.strength_library({'1': 300.0, '3': 4200.0}, steel_tags=[3])
+    P_1, M_1 = interaction_diagram(FT.fiber_table(fib_sec_1), library_1)
+    print(f"Pure compression: {P_1[0]:.1f} (expected {300.0 * 2400 + 4200.0 * 6 * 5.07:.1f})")
+    print(f"Pure tension: {P_1[len(P_1) // 2]:.1f} (expected {-4200.0 * 6 * 5.07:.1f})")
+
+    # Biaxial surface with a process pool
+    surface_1 = interaction_surface(FT.fiber_table(fib_sec_1), library_1, n_angles=24)
+    print(f"Max Mz: {surface_1['Mz'].max():.1f} (uniaxial {M_1.max():.1f})")
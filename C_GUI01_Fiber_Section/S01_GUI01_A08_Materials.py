@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A08_Materials.py
+COMENTARIOS:    Libreria de materiales uniaxiales (por matTag). Las tensiones y rigideces tangentes se evaluan
+                sobre arrays completos de fibras, sin llamadas de Python por fibra.
+"""
+
+# %% [00] INTRODUCTION
+# A material is a dictionary with the name of the model and its parameters, and the library is a dictionary
+# with the matTag as key:
+#
+#   library = {1: {'model': 'Hognestad', 'fc': 300.0},
+#              2: {'model': 'Mander', 'fcc': 390.0, 'eps_cc': 0.005, 'Ec': 260000.0, 'eps_cu': 0.015},
+#              3: {'model': 'ElasticPP', 'fy': 4200.0, 'E': 2.1e6}}
+#
+# Models (compression positive, like S01_GUI01_A07_Interaction.py):
+#   - 'Elastic':   E.
+#   - 'ElasticPP': elastic-perfectly-plastic steel, fy and E.
+#   - 'Bilinear':  steel with hardening, fy, E and b (ratio between the hardening and the elastic stiffness).
+#   - 'Hognestad': concrete without tension, fc, eps_c0, eps_cu and fcu_ratio (stress at eps_cu / fc). With
+#                  fcu_ratio = 1 the descending branch becomes a plateau.
+#   - 'Mander':    concrete without tension (Mander et al., 1988), fcc, eps_cc, Ec and eps_cu.
+# The concrete models don't have stress after eps_cu (crushing). The units are those of the section and
+# 'Material_Strength.txt'.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+
+# %%  [02] MODELOS
+# Each model returns the stress and the tangent stiffness for an array of strains.
+def elastic(strain, E):
+    return E * strain, np.full(np.shape(strain), float(E))
+
+
+def elastic_pp(strain, fy, E):
+    eps_y = fy / E
+    stress = np.clip(E * strain, -fy, fy)
+    tangent = np.where(np.abs(strain) < eps_y, float(E), 0.0)
+    return stress, tangent
+
+
+def bilinear(strain, fy, E, b=0.01):
+    eps_y = fy / E
+    elastic_range = np.abs(strain) <= eps_y
+    stress = np.where(elastic_range, E * strain, np.sign(strain) * (fy + b * E * (np.abs(strain) - eps_y)))
+    tangent = np.where(elastic_range, float(E), b * E)
+    return stress, tangent
+
+
+def hognestad(strain, fc, eps_c0=0.002, eps_cu=0.0038, fcu_ratio=0.85):
+    ratio = strain / eps_c0
+    slope = (1.0 - fcu_ratio) * fc / (eps_cu - eps_c0)
+    ascending = strain < eps_c0
+    stress = np.where(ascending, fc * (2.0 * ratio - ratio ** 2), fc - slope * (strain - eps_c0))
+    tangent = np.where(ascending, 2.0 * fc / eps_c0 * (1.0 - ratio), -slope)
+    active = (strain >= 0.0) & (strain <= eps_cu)
+    return np.where(active, stress, 0.0), np.where(active, tangent, 0.0)
+
+
+def mander(strain, fcc, eps_cc, Ec, eps_cu=0.004):
+    # The curve requires r = Ec / (Ec - Esec) > 1 (Esec = fcc / eps_cc, secant modulus at the peak)
+    if fcc <= 0 or eps_cc <= 0:
+        raise ValueError("Mander requires fcc > 0 and eps_cc > 0")
+    if Ec <= fcc / eps_cc:
+        raise ValueError("Mander requires Ec > fcc / eps_cc")
+    r = Ec / (Ec - fcc / eps_cc)
+    x = np.maximum(strain, 0.0) / eps_cc
+    xr = x ** r
+    denominator = r - 1.0 + xr
+    stress = fcc * x * r / denominator
+    tangent = fcc / eps_cc * r * (r - 1.0) * (1.0 - xr) / denominator ** 2
+    active = (strain >= 0.0) & (strain <= eps_cu)
+    return np.where(active, stress, 0.0), np.where(active, tangent, 0.0)
+
+
+# Models available in the library
+MODELS = {
+    'Elastic': elastic,
+    'ElasticPP': elastic_pp,
+    'Bilinear': bilinear,
+    'Hognestad': hognestad,
+    'Mander': mander
+}
+
+
+# %%  [03] FUNCIONES
+# Function to evaluate one material
+def material_response(material, strain):
+    """
+    Stress and tangent stiffness of a material.
+
+    Args:
+        material (dict): Material of the library, e.g. {'model': 'ElasticPP', 'fy': 4200.0, 'E': 2.1e6}.
+        strain (numpy.ndarray): Strains. Compression positive.
+
+    Returns:
+        tuple: (stress, tangent) arrays with the same shape of strain.
+    """
+    params = {key: value for key, value in material.items() if key != 'model'}
+    try:
+        model = MODELS[material['model']]
+    except KeyError:
+        raise ValueError(f"Unknown material model: {material['model']}")
+    return model(np.asarray(strain, dtype=float), **params)
+
+
+# Function to evaluate the materials of all the fibers
+def fiber_response(library, mat_tags, strain):
+    """
+    Stress and tangent stiffness of all the fibers.
+
+    The fibers are grouped by matTag, so each model is evaluated once over its block of fibers. The fibers
+    with a matTag that is not in the library don't have stress.
+
+    Args:
+        library (dict): Materials with the matTag as key.
+        mat_tags (numpy.ndarray): matTag of each fiber.
+        strain (numpy.ndarray): Strains with shape (..., n_fibers).
+
+    Returns:
+        tuple: (stress, tangent) arrays with the same shape of strain.
+    """
+    strain = np.asarray(strain, dtype=float)
+    stress = np.zeros_like(strain)
+    tangent = np.zeros_like(strain)
+    tags, index = np.unique(mat_tags, return_inverse=True)
+    for k, tag in enumerate(tags):
+        material = library.get(int(tag))
+        if material is None:
+            continue
+        columns = index == k
+        stress[..., columns], tangent[..., columns] = material_response(material, strain[..., columns])
+    return stress, tangent
+
+
+# Function to create a library from the material strength defined in the GUI
+def strength_library(materials, steel_tags, eps_c0=0.002, eps_cu=0.003, eps_y=0.002):
+    """
+    Library from the dictionary of strengths saved in 'Material_Strength.txt'.
+
+    The matTags in steel_tags are elastic-perfectly-plastic steel (E = fy / eps_y). The other matTags are
+    concrete with the Hognestad parabola and a plateau until eps_cu. Materials with strength 0 are omitted.
+
+    Args:
+        materials (dict): Strength of each matTag, e.g. {'1': 300.0, '2': 275.0, '3': 4200.0}.
+        steel_tags (iterable): matTags that are steel.
+
+    Returns:
+        dict: Material library.
+    """
+    steel_tags = [int(tag) for tag in steel_tags]
+    library = {}
+    for tag, strength in materials.items():
+        strength = float(strength)
+        if strength == 0.0:
+            continue
+        if int(tag) in steel_tags:
+            library[int(tag)] = {'model': 'ElasticPP', 'fy': strength, 'E': strength / eps_y}
+        else:
+            library[int(tag)] = {'model': 'Hognestad', 'fc': strength, 'eps_c0': eps_c0, 'eps_cu': eps_cu,
+                                 'fcu_ratio': 1.0}
+    return library
+
+
+# %%  [04] TEST
+if __name__ == '__main__':
+    # Check the tangent of the models with finite differences
+    strain_1 = np.linspace(-0.01, 0.01, 2001)
+    library_1 = {1: {'model': 'Hognestad', 'fc': 300.0},
+                 2: {'model': 'Mander', 'fcc': 390.0, 'eps_cc': 0.005, 'Ec': 260000.0, 'eps_cu': 0.015},
+                 3: {'model': 'Bilinear', 'fy': 4200.0, 'E': 2.1e6, 'b': 0.02}}
+    for tag_1, material_1 in library_1.items():
+        stress_1, tangent_1 = material_response(material_1, strain_1)
+        tangent_fd = np.gradient(stress_1, strain_1)
+        print(f"{material_1['model']}: max stress {stress_1.max():.1f}, "
+              f"median error of the tangent {np.median(np.abs(tangent_fd - tangent_1)):.3e}")
+
+    # Parameters of Mander that are not valid (Ec <= fcc / eps_cc gives r <= 1 or a division by zero)
+    for params_1 in [{'fcc': 30.0, 'eps_cc': 0.002, 'Ec': 14000.0}, {'fcc': 30.0, 'eps_cc': 0.002, 'Ec': 15000.0},
+                     {'fcc': 0.0, 'eps_cc': 0.002, 'Ec': 14000.0}]:
+        try:
+            material_response({'model': 'Mander', **params_1}, [0.0, 0.001, 0.002, 0.004])
+        except ValueError as e:
+            print(f"Mander {params_1}: {e}")
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A09_StrainSolver.py
+COMENTARIOS:    Compatibilidad de deformaciones en la tabla de fibras. Encuentra la deformacion axial que
+                equilibra una carga axial para una curvatura dada (Newton con rigidez tangente analitica),
+                para varios casos de carga a la vez y partiendo desde la solucion del paso anterior.
+"""
+
+# %% [00] INTRODUCTION
+# Plane sections: the strain of a fiber is eps = eps0 + phi * u, where u = y - ref_y for bending about the
+# z axis and u = z - ref_z for bending about the y axis. Compression is positive (see S01_GUI01_A07_Interaction.py).
+#
+#   N = sum(S * A)        K = [[sum(Et * A),     sum(Et * A * u)   ],
+#   M = sum(S * A * u)         [sum(Et * A * u), sum(Et * A * u**2)]]
+#
+# For each load case the axial strain eps0 is solved with Newton iterations dN/deps0 = K[0, 0]. When the
+# tangent vanishes (e.g. all the fibers yielded) a secant step with the previous iteration is used, and the
+# steps are kept inside the bracket of the solution found so far (bisection otherwise). All the load cases are
+# iterated together: one strain matrix (n_cases x n_fibers) per iteration.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+import S01_GUI01_A08_Materials as MT
+
+
+# %%  [02] FUNCIONES
+# Function to obtain the lever arm of the fibers for a bending axis
+def fiber_lever_arm(fibers, axis='z', ref=(0.0, 0.0)):
+    if axis == 'z':
+        return fibers['y'] - ref[0]
+    elif axis == 'y':
+        return fibers['z'] - ref[1]
+    raise ValueError("The bending axis must be 'y' or 'z'.")
+
+
+# Function to calculate the forces and tangent stiffness of the section
+def section_state(fibers, library, eps0, phi, u):
+    """
+    Section forces and tangent stiffness for several strain states.
+
+    Args:
+        fibers (dict): Fiber table, see S01_GUI01_A06_FiberTable.fiber_table.
+        library (dict): Material library, see S01_GUI01_A08_Materials.py.
+        eps0 (numpy.ndarray): Axial strain of each case.
+        phi (numpy.ndarray): Curvature of each case.
+        u (numpy.ndarray): Lever arm of the fibers, see fiber_lever_arm.
+
+    Returns:
+        tuple: (N, M, K) with shapes (n_cases,), (n_cases,) and (n_cases, 2, 2).
+    """
+    area = fibers['area']
+    strain = np.asarray(eps0, dtype=float)[:, None] + np.asarray(phi, dtype=float)[:, None] * u[None, :]
+    stress, tangent = MT.fiber_response(library, fibers['matTag'], strain)
+    N = stress @ area
+    M = stress @ (area * u)
+    K = np.empty((len(N), 2, 2))
+    K[:, 0, 0] = tangent @ area
+    K[:, 0, 1] = K[:, 1, 0] = tangent @ (area * u)
+    K[:, 1, 1] = tangent @ (area * u ** 2)
+    return N, M, K
+
+
+# Function to solve the axial strain that equilibrates the axial load
+def solve_axial_strain(fibers, library, P, phi, axis='z', ref=(0.0, 0.0), eps0=None, tol=1e-8, max_iter=50,
+                       max_step=0.0005):
+    """
+    Axial strain eps0 that satisfies N(eps0, phi) = P for several load cases.
+
+    Args:
+        fibers (dict): Fiber table.
+        library (dict): Material library.
+        P (float or numpy.ndarray): Axial load of each case. Compression positive.
+        phi (float or numpy.ndarray): Curvature of each case.
+        axis (str): Bending axis, 'z' or 'y'.
+        ref (tuple): Point (y, z) used to calculate the moments (plastic centroid).
+        eps0 (float or numpy.ndarray): Initial axial strain (warm start), e.g. the solution of the previous
+            curvature step. None starts from 0.
+        tol (float): Tolerance of the axial force, relative to the axial capacity of the section.
+        max_iter (int): Maximum number of iterations.
+        max_step (float): Maximum increment of eps0 in one iteration.
+
+    Returns:
+        dict: Arrays 'eps0', 'N', 'M', 'K' (section tangent), 'converged' and 'iterations' of each case.
+    """
+    u = fiber_lever_arm(fibers, axis, ref)
+    P, phi = np.broadcast_arrays(np.atleast_1d(np.asarray(P, dtype=float)),
+                                 np.atleast_1d(np.asarray(phi, dtype=float)))
+    eps0 = np.broadcast_to(0.0 if eps0 is None else np.asarray(eps0, dtype=float), P.shape).copy()
+
+    # Reference force to define the tolerance: axial capacity in compression and tension
+    N_probe = section_state(fibers, library, np.array([0.002, -0.002]), np.zeros(2), u)[0]
+    tol_force = tol * max(np.abs(N_probe).max(), np.abs(P).max(), np.finfo(float).tiny)
+
+    iterations = np.zeros(P.shape, dtype=int)
+    converged = np.zeros(P.shape, dtype=bool)
+    eps_prev = np.full(P.shape, np.nan)
+    N_prev = np.full(P.shape, np.nan)
+    eps_lo = np.full(P.shape, -np.inf)  # Bracket of the solution: N < P in eps_lo and N > P in eps_hi
+    eps_hi = np.full(P.shape, np.inf)
+    for iteration in range(max_iter):
+        idx = np.flatnonzero(~converged)
+        if idx.size == 0:
+            break
+        N, M, K = section_state(fibers, library, eps0[idx], phi[idx], u)
+        residual = P[idx] - N
+        done = np.abs(residual) <= tol_force
+        converged[idx[done]] = True
+        iterations[idx] = iteration
+        eps_lo[idx] = np.where(residual > 0.0, np.maximum(eps_lo[idx], eps0[idx]), eps_lo[idx])
+        eps_hi[idx] = np.where(residual < 0.0, np.minimum(eps_hi[idx], eps0[idx]), eps_hi[idx])
+
+        # Newton step with the analytic tangent, secant step if the tangent vanishes. A slope below
+        # k_min gives a step larger than max_step for any residual above the tolerance.
+        k_min = tol_force / max_step
+        k_newton = K[:, 0, 0]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            k_secant = (N - N_prev[idx]) / (eps0[idx] - eps_prev[idx])
+            slope = np.where(np.abs(k_newton) > k_min, k_newton,
+                             np.where(np.abs(k_secant) > k_min, k_secant, np.nan))
+            step = np.where(np.isnan(slope), np.sign(residual) * max_step, residual / slope)
+        eps_new = eps0[idx] + np.clip(step, -max_step, max_step)
+
+        # Bisection if the step leaves the bracket, march in the direction of the residual if the bracket
+        # is still open
+        lo, hi = eps_lo[idx], eps_hi[idx]
+        outside = (eps_new <= lo) | (eps_new >= hi)
+        closed = np.isfinite(lo) & np.isfinite(hi)
+        middle = 0.5 * (np.where(closed, lo, 0.0) + np.where(closed, hi, 0.0))
+        eps_new = np.where(outside & closed, middle, eps_new)
+        eps_new = np.where(outside & ~closed, eps0[idx] + np.sign(residual) * max_step, eps_new)
+
+        eps_prev[idx], N_prev[idx] = eps0[idx], N
+        eps0[idx[~done]] = eps_new[~done]
+
+    N, M, K = section_state(fibers, library, eps0, phi, u)
+    converged = np.abs(P - N) <= tol_force
+    return {'eps0': eps0, 'N': N, 'M': M, 'K': K, 'converged': converged, 'iterations': iterations}
+
+
+# Function to calculate the moment-curvature diagrams of several axial loads
+def moment_curvature(fibers, library, P, phi_max, n_steps=50, axis='z', ref=(0.0, 0.0), tol=1e-8, max_iter=50):
+    """
+    Moment-curvature diagrams for one or more axial loads.
+
+    Each curvature step solves all the axial loads at once, starting from the axial strains of the previous
+    step.
+
+    Returns:
+        dict: 'phi' with shape (n_steps + 1,) and 'M', 'eps0', 'converged' with shape (n_steps + 1, n_cases).
+    """
+    P = np.atleast_1d(np.asarray(P, dtype=float))
+    phis = np.linspace(0.0, phi_max, n_steps + 1)
+    M = np.zeros((n_steps + 1, len(P)))
+    eps0 = np.zeros((n_steps + 1, len(P)))
+    converged = np.zeros((n_steps + 1, len(P)), dtype=bool)
+    eps_start = None
+    for step, phi in enumerate(phis):
+        state = solve_axial_strain(fibers, library, P, phi, axis, ref, eps_start, tol, max_iter)
+        M[step], eps0[step], converged[step] = state['M'], state['eps0'], state['converged']
+        eps_start = state['eps0']
+    return {'phi': phis, 'M': M, 'eps0': eps0, 'converged': converged}
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import S01_GUI01_A06_FiberTable as FT
+
+    # Rectangular column 40x60 [cm] with 3 + 3 bars, strength in [kgf/cm2]
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 30, 10, -30.0, -20.0, 30.0, 20.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 15.0]]
+    library_1 = {1: {'model': 'Mander', 'fcc': 390.0, 'eps_cc': 0.005, 'Ec': 260000.0, 'eps_cu': 0.015},
+                 3: {'model': 'Bilinear', 'fy': 4200.0, 'E': 2.1e6, 'b': 0.01}}
+    mc_1 = moment_curvature(FT.fiber_table(fib_sec_1), library_1, [0.0, 1.0e5, 3.0e5], phi_max=2.0e-4)
+    print(f"All steps converged: {mc_1['converged'].all()}")
+    print(f"Moment at phi_max: {mc_1['M'][-1]}")
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A10_SectionState.py
+COMENTARIOS:    Guarda la contribucion de cada patch/layer (area, momentos de primer y segundo orden, bloque de
+                fibras) para actualizar las propiedades de la seccion y la tabla de fibras de forma incremental
+                cuando se agrega, elimina o edita un solo elemento.
+"""
+
+# %% [00] INTRODUCTION
+# The state of the section is a dictionary:
+#
+#   state = {'items':   [element_1, element_2, ...],          # Elements of the section (numeric values)
+#            'blocks':  [contribution_1, contribution_2, ...], # Contribution of each element
+#            'totals':  {matTag: [A, A*y, A*z, A*y**2, A*z**2, A*y*z]},
+#            'fibers':  fiber table or None}                   # Assembled only when it is requested
+#
+# The contribution of an element depends only on its values, so the identity of an element is its tuple of
+# values. Adding, deleting or editing one element discretizes only that element and updates the totals of its
+# matTag in O(1). The fiber table is spliced with the block of the element (see S01_GUI01_A06_FiberTable.py).
+# sync_section compares a new section list with the state and only discretizes the elements that changed, so
+# the GUI can keep the textarea as the definition of the section.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+import S01_GUI01_A06_FiberTable as FT
+
+
+# %%  [02] FUNCIONES
+# Function to obtain the identity of an element (the lists of an instance are written as tuples)
+def element_key(item):
+    return tuple(element_key(value) if isinstance(value, list) else value for value in item)
+
+
+# Function to calculate the contribution of one element
+def element_contribution(item):
+    """
+    Contribution of one element of the section list.
+
+    Returns:
+        dict: 'key' (tuple with the values of the element), 'matTag', 'sums' ([A, A*y, A*z, A*y**2, A*z**2,
+            A*y*z]) and the fiber block 'y', 'z', 'area'.
+    """
+    y, z, area = FT.element_fibers(item)
+    sums = np.array([area.sum(), area @ y, area @ z, area @ y ** 2, area @ z ** 2, area @ (y * z)])
+    mat_tag = FT.element_mat_tag(item) if item[0] in ['patch', 'layer', 'instance'] else None
+    return {'key': element_key(item), 'matTag': mat_tag, 'sums': sums, 'y': y, 'z': z, 'area': area}
+
+
+# Function to create an empty state
+def new_section_state():
+    return {'items': [], 'blocks': [], 'totals': {}, 'fibers': None}
+
+
+# Function to create the state of a section
+def build_section_state(fib_sec):
+    state = new_section_state()
+    sync_section(state, fib_sec)
+    return state
+
+
+# Functions to add and subtract the contribution of an element in the totals of its matTag
+def _add_totals(state, block, sign=1.0):
+    if block['matTag'] is None:
+        return
+    totals = state['totals'].setdefault(block['matTag'], np.zeros(6))
+    totals += sign * block['sums']
+
+
+# Function to create the fiber arrays of one block
+def _block_table(block, index):
+    n = len(block['y'])
+    return {'y': block['y'], 'z': block['z'], 'area': block['area'],
+            'matTag': np.full(n, block['matTag'] if block['matTag'] is not None else 0),
+            'element': np.full(n, index)}
+
+
+# Function to replace the fibers of the elements in [start, stop) of the fiber table
+def _splice_fibers(state, start, stop, new_blocks):
+    fibers = state['fibers']
+    if fibers is None:
+        return
+    element = fibers['element']
+    first = np.searchsorted(element, start, side='left')
+    last = np.searchsorted(element, stop, side='left')
+    new = [_block_table(block, start + k) for k, block in enumerate(new_blocks)]
+    shift = len(new_blocks) - (stop - start)
+    spliced = {}
+    for name in ['y', 'z', 'area', 'matTag', 'element']:
+        tail = fibers[name][last:] + shift if name == 'element' else fibers[name][last:]
+        spliced[name] = np.concatenate([fibers[name][:first]] + [table[name] for table in new] + [tail])
+    state['fibers'] = spliced
+
+
+# Function to add an element to the section
+def add_element(state, item, position=None):
+    """
+    Add an element in the position of the section list (at the end if position is None).
+    """
+    position = len(state['items']) if position is None else position
+    block = element_contribution(item)
+    state['items'].insert(position, list(item))
+    state['blocks'].insert(position, block)
+    _add_totals(state, block)
+    _splice_fibers(state, position, position, [block])
+
+
+# Function to delete an element of the section
+def remove_element(state, position):
+    block = state['blocks'].pop(position)
+    state['items'].pop(position)
+    _add_totals(state, block, -1.0)
+    _splice_fibers(state, position, position + 1, [])
+
+
+# Function to edit an element of the section
+def replace_element(state, position, item):
+    old_block = state['blocks'][position]
+    if old_block['key'] == element_key(item):
+        return
+    block = element_contribution(item)
+    state['items'][position] = list(item)
+    state['blocks'][position] = block
+    _add_totals(state, old_block, -1.0)
+    _add_totals(state, block)
+    _splice_fibers(state, position, position + 1, [block])
+
+
+# Function to update the state with a new section list
+def sync_section(state, fib_sec):
+    """
+    Update the state to a new section list, reusing the contribution of the elements that didn't change.
+
+    Returns:
+        int: Number of elements that were discretized.
+    """
+    # Contributions available, by identity (an element can be repeated)
+    pool = {}
+    for block in state['blocks']:
+        pool.setdefault(block['key'], []).append(block)
+
+    blocks = []
+    new_count = 0
+    for item in fib_sec:
+        reused = pool.get(element_key(item))
+        if reused:
+            blocks.append(reused.pop())
+        else:
+            block = element_contribution(item)
+            _add_totals(state, block)
+            blocks.append(block)
+            new_count += 1
+
+    # Remove the contributions of the deleted elements
+    for unused in pool.values():
+        for block in unused:
+            _add_totals(state, block, -1.0)
+
+    if [block['key'] for block in blocks] != [block['key'] for block in state['blocks']]:
+        state['fibers'] = None
+    state['items'] = [list(item) for item in fib_sec]
+    state['blocks'] = blocks
+    return new_count
+
+
+# Function to obtain the fiber table of the state
+def state_fiber_table(state):
+    """
+    Fiber table of the section (same format of S01_GUI01_A06_FiberTable.fiber_table). It is assembled from the
+    blocks only if the list of elements changed since the last call.
+    """
+    if state['fibers'] is None:
+        tables = [_block_table(block, index) for index, block in enumerate(state['blocks'])
+                  if block['matTag'] is not None]
+        if not tables:
+            state['fibers'] = FT.fiber_table([])
+        else:
+            state['fibers'] = {name: np.concatenate([table[name] for table in tables])
+                               for name in ['y', 'z', 'area', 'matTag', 'element']}
+    return state['fibers']
+
+
+# Function to obtain the geometric properties of the section
+def section_properties(state):
+    """
+    Area, centroid and moments of inertia (about the centroid) of the section.
+
+    Returns:
+        dict: 'area', 'cy', 'cz', 'Iz' (A*y**2), 'Iy' (A*z**2) and 'Iyz'.
+    """
+    A, Sy, Sz, Syy, Szz, Syz = sum(state['totals'].values(), np.zeros(6))
+    cy, cz = Sy / A, Sz / A
+    return {'area': A, 'cy': cy, 'cz': cz,
+            'Iz': Syy - A * cy ** 2, 'Iy': Szz - A * cz ** 2, 'Iyz': Syz - A * cy * cz}
+
+
+# Function to calculate the plastic centroid with the totals of each matTag
+def plastic_centroid(state, materials):
+    """
+    Args:
+        materials (dict): Strength of each matTag, e.g. {'1': 300.0, '2': 275.0, '3': 4200.0}.
+
+    Returns:
+        tuple: Plastic centroid (y, z). A ValueError is raised if a matTag of the section doesn't have strength, or
+            if the total weighted area is zero.
+    """
+    # matTags of the elements of the section (the totals keep the matTags of the deleted elements)
+    tags = {block['matTag'] for block in state['blocks'] if block['matTag'] is not None}
+    undefined = sorted(int(tag) for tag in tags if str(tag) not in materials)
+    if undefined:
+        raise ValueError(f"The strength of the matTags {undefined} is not defined.")
+    weighted = np.zeros(3)
+    for tag in tags:
+        weighted += float(materials[str(tag)]) * state['totals'][tag][:3]
+    if weighted[0] == 0.0:
+        raise ValueError("The total weighted area of the section is zero: check the strength of the materials.")
+    return float(weighted[1] / weighted[0]), float(weighted[2] / weighted[0])
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 10, 6, -30.0, -20.0, 30.0, 20.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 15.0]]
+    state_1 = build_section_state(fib_sec_1)
+    state_fiber_table(state_1)
+
+    # Edit one layer and compare with a full recalculation
+    replace_element(state_1, 2, ['layer', 'straight', 3, 4, 5.07, 25.0, -15.0, 25.0, 15.0])
+    fib_sec_1[2] = ['layer', 'straight', 3, 4, 5.07, 25.0, -15.0, 25.0, 15.0]
+    fibers_1 = FT.fiber_table(fib_sec_1)
+    print(f"Same fiber table: {all(np.allclose(fibers_1[k], state_fiber_table(state_1)[k]) for k in fibers_1)}")
+    print(f"Properties: {section_properties(state_1)}")
+    print(f"Elements discretized after sync: {sync_section(state_1, fib_sec_1 + [fib_sec_1[1]])}")
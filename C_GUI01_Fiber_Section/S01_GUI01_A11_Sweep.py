@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A11_Sweep.py
+COMENTARIOS:    Evalua una familia de secciones (plantilla con parametros) para todas las combinaciones de los
+                valores de los parametros: centroide plastico, propiedades geometricas y M-phi opcional. Las
+                variantes se calculan en un pool de procesos y los resultados se escriben a una tabla CSV a
+                medida que terminan.
+"""
+
+# %% [00] INTRODUCTION
+# The template is a section list in the format of the GUI (section_params_output), where any value can be an
+# expression of the parameters written as a string that starts with '=':
+#
+#   template = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+#               ['patch', 'rect', 1, 10, 6, '=-h/2', '=-b/2', '=h/2', '=b/2'],
+#               ['layer', 'straight', 3, '=n_bars', '=pi*db**2/4', '=h/2-cover', '=-b/2+cover', '=h/2-cover',
+#                '=b/2-cover']]
+#   materials = {'1': '=fc', '3': 4200.0}
+#   parameters = {'h': [50.0, 60.0], 'b': [40.0], 'cover': [4.0, 5.0], 'n_bars': [3, 4], 'db': [1.6, 2.0],
+#                 'fc': [250.0, 300.0]}
+#
+# The expressions can use the parameters and the functions of the math module. The values can have units like
+# in the textarea ('40.0*cm', '5.07*cm**2', or expressions like "=f'{h/2}*cm'"): each variant is converted to one
+# working unit (by default the first unit of the section) before the calculations, and the results (areas,
+# inertias, centroids and curvatures) are in that unit.
+# The moments of inertia are calculated around the geometric centroid, and the M-phi diagrams around the
+# plastic centroid (see S01_GUI01_A09_StrainSolver.py).
+
+
+# %%  [01] LIBRERIAS
+import csv
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import S01_GUI01_A08_Materials as MT
+import S01_GUI01_A09_StrainSolver as SV
+import S01_GUI01_A10_SectionState as SS
+import S01_GUI01_A12_Cache as RC
+import S01_GUI01_A13_Core as core
+
+
+# %%  [02] FUNCIONES
+# Function to expand the Cartesian grid of the parameters
+def expand_grid(parameters):
+    """
+    Args:
+        parameters (dict): List of values of each parameter.
+
+    Returns:
+        list: Dictionaries with one value of each parameter, for all the combinations.
+    """
+    names = list(parameters)
+    return [dict(zip(names, values)) for values in itertools.product(*(parameters[name] for name in names))]
+
+
+# Function to evaluate one value of the template
+def _evaluate_value(value, params):
+    if isinstance(value, str) and value.startswith('='):
+        namespace = {name: getattr(math, name) for name in dir(math) if not name.startswith('_')}
+        namespace.update(params)
+        return eval(value[1:], {'__builtins__': {}}, namespace)
+    return value
+
+
+# Function to obtain the unit of a section (the first unit of its elements, '-' if it doesn't have units)
+def section_unit(fib_sec):
+    for item in fib_sec:
+        if item[0] in ['patch', 'layer', 'instance']:
+            unit = core.element_unit(item[1] if item[0] == 'instance' else item)
+            if unit != '-':
+                return unit
+    return '-'
+
+
+# Function to create the section of one variant
+def build_section(template, params, unit=None):
+    """
+    Args:
+        unit (str): Working unit of the section. None uses the first unit of the section.
+
+    Returns:
+        list: Section with numeric values in the working unit.
+    """
+    fib_sec = [[_evaluate_value(value, params) for value in item] for item in template]
+    unit = section_unit(fib_sec) if unit is None else unit
+    return fib_sec if unit == '-' else core.convert_units(fib_sec, unit)
+
+
+# Function to create the material strengths of one variant
+def build_materials(materials, params):
+    return {tag: _evaluate_value(value, params) for tag, value in materials.items()}
+
+
+# Function to evaluate one variant
+def evaluate_variant(template, materials, params, steel_tags=(), mphi=None, unit=None):
+    """
+    Plastic centroid, geometric properties and (optional) M-phi of one variant.
+
+    Args:
+        template (list): Section list with expressions.
+        materials (dict): Strength of each matTag (values can be expressions).
+        params (dict): Value of each parameter.
+        steel_tags (iterable): matTags that are steel, used for the M-phi diagrams.
+        mphi (dict): Options of the M-phi diagrams: 'P' (list of axial loads), 'phi_max' and optionally
+            'n_steps' and 'axis'. None doesn't calculate them.
+        unit (str): Working unit (see build_section).
+
+    Returns:
+        dict: Row of the results table.
+    """
+    fib_sec = build_section(template, params, unit)
+    strengths = build_materials(materials, params)
+    state = SS.build_section_state(fib_sec)
+    cp_y, cp_z = SS.plastic_centroid(state, strengths)
+    properties = SS.section_properties(state)
+    fibers = SS.state_fiber_table(state)
+
+    row = dict(params)
+    row.update({'cp_y': cp_y, 'cp_z': cp_z, 'area': float(properties['area']), 'Iy': float(properties['Iy']),
+                'Iz': float(properties['Iz']), 'Iyz': float(properties['Iyz']), 'n_fibers': len(fibers['y'])})
+
+    if mphi is not None:
+        library = MT.strength_library(strengths, steel_tags)
+        result = SV.moment_curvature(fibers, library, mphi['P'], mphi['phi_max'], mphi.get('n_steps', 50),
+                                     mphi.get('axis', 'z'), (cp_y, cp_z))
+        M_max = np.abs(np.where(result['converged'], result['M'], 0.0)).max(axis=0)
+        for k, M in enumerate(M_max):
+            row[f'M_max_{k + 1}'] = float(M)
+    return row
+
+
+# Function to evaluate the variants, in the order they finish
+def iter_sweep(template, materials, parameters, steel_tags=(), mphi=None, n_workers=None, cache=None, unit=None):
+    """
+    Evaluate all the variants of the grid in a process pool.
+
+    Args:
+        parameters (dict): List of values of each parameter, see expand_grid.
+        n_workers (int): Number of processes. None uses os.cpu_count(); 1 calculates in this process.
+        cache (dict): Cache of results (see S01_GUI01_A12_Cache.py). The variants saved before are not
+            calculated again, and the new ones are saved when they finish.
+        Other arguments as in evaluate_variant.
+
+    Yields:
+        dict: Row of each variant as soon as it is calculated, with its position in the grid ('index').
+    """
+    grid = expand_grid(parameters)
+    options = {'steel_tags': [int(tag) for tag in steel_tags], 'mphi': mphi}
+
+    # Variants saved in the cache
+    pending = []
+    for index, params in enumerate(grid):
+        row = None
+        if cache is not None:
+            row = RC.cache_get(cache, build_section(template, params, unit), build_materials(materials, params),
+                               'sweep', options)
+        if row is None:
+            pending.append(index)
+        else:
+            # Two variants can have the same section and materials (e.g. a parameter that is not used)
+            yield {'index': index, **row, **params}
+
+    def save(index, row):
+        if cache is not None:
+            params = grid[index]
+            RC.cache_put(cache, build_section(template, params, unit), build_materials(materials, params), 'sweep',
+                         row, options)
+        return {'index': index, **row}
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(pending))
+
+    if n_workers <= 1:
+        for index in pending:
+            yield save(index, evaluate_variant(template, materials, grid[index], steel_tags, mphi, unit))
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(evaluate_variant, template, materials, grid[index], steel_tags, mphi, unit): index
+                   for index in pending}
+        for future in as_completed(futures):
+            yield save(futures[future], future.result())
+
+
+# Function to run the sweep and write the results table
+def run_sweep(template, materials, parameters, steel_tags=(), mphi=None, n_workers=None, output=None, cache=None,
+              unit=None):
+    """
+    Evaluate all the variants and write each row to a CSV file when it is calculated.
+
+    Args:
+        output (str): Path of the CSV file. None doesn't write the file.
+        Other arguments as in iter_sweep.
+
+    Returns:
+        list: Rows of the results table in the order of the grid.
+    """
+    rows = []
+    file = open(output, 'w', newline='') if output is not None else None
+    try:
+        writer = None
+        for row in iter_sweep(template, materials, parameters, steel_tags, mphi, n_workers, cache, unit):
+            rows.append(row)
+            if file is not None:
+                if writer is None:
+                    writer = csv.DictWriter(file, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+                file.flush()
+    finally:
+        if file is not None:
+            file.close()
+    return sorted(rows, key=lambda row: row['index'])
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    # Rectangular columns with bars in two faces, units [cm] and [kgf/cm2]
+    template_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                  ['patch', 'rect', 1, 20, 6, '=-h/2', '=-b/2', '=h/2', '=b/2'],
+                  ['layer', 'straight', 3, '=n_bars', '=pi*db**2/4', '=h/2-cover', '=-b/2+cover', '=h/2-cover',
+                   '=b/2-cover'],
+                  ['layer', 'straight', 3, '=n_bars', '=pi*db**2/4', '=-h/2+cover', '=-b/2+cover',
+                   '=-h/2+cover', '=b/2-cover']]
+    materials_1 = {'1': '=fc', '3': 4200.0}
+    parameters_1 = {'h': [50.0, 60.0], 'b': [40.0], 'cover': [4.0, 5.0], 'n_bars': [3, 4], 'db': [2.0],
+                    'fc': [250.0, 300.0]}
+    rows_1 = run_sweep(template_1, materials_1, parameters_1, steel_tags=[3],
+                       mphi={'P': [0.0, 1.0e5], 'phi_max': 2.0e-4, 'n_steps': 20})
+    for row_1 in rows_1[:4]:
+        print(row_1)
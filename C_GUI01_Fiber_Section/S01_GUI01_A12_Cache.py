@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A12_Cache.py
+COMENTARIOS:    Cache en disco (SQLite) de los resultados de la seccion (centroide plastico, tabla de centros,
+                imagenes, resultados de barridos), para reutilizarlos despues de reiniciar el kernel.
+"""
+
+# %% [00] INTRODUCTION
+# Each result is saved with a key created from:
+#   - The hash of the section list (with the values as they are written, units included).
+#   - The hash of the material strengths.
+#   - The type of calculation ('CP', 'center', 'sweep', ...) and its options (e.g. the graphic unit).
+# The value is saved with pickle in a BLOB column. When the size of all the results is larger than max_bytes
+# (or there are more than max_entries results), the results used less recently are deleted.
+#
+#   cache = open_cache()
+#   value = cache_get(cache, fib_sec, materials, 'CP')
+#   if value is None:
+#       value = ...
+#       cache_put(cache, fib_sec, materials, 'CP', value)
+
+
+# %%  [01] LIBRERIAS
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+
+
+# %%  [02] FUNCIONES
+# Default file of the cache (same folder of the files created by the GUI)
+DEFAULT_PATH = r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Cache_Fiber_Section.sqlite'
+
+
+# Function to obtain the hash of a list or dictionary
+def content_hash(content):
+    text = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# Function to create the key of a result
+def result_key(fib_sec, materials, kind, options=None):
+    """
+    Returns:
+        tuple: (key, section_hash, materials_hash).
+    """
+    section_hash = content_hash(fib_sec)
+    materials_hash = content_hash(materials)
+    key = content_hash([section_hash, materials_hash, kind, options])
+    return key, section_hash, materials_hash
+
+
+# Function to open (or create) the cache
+def open_cache(path=DEFAULT_PATH, max_bytes=100 * 1024 ** 2, max_entries=10000):
+    """
+    Args:
+        path (str): SQLite file.
+        max_bytes (int): Maximum size of the saved values.
+        max_entries (int): Maximum number of results.
+
+    Returns:
+        dict: Cache with the connection and the limits.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(path)
+    connection.execute("""CREATE TABLE IF NOT EXISTS results (
+                              key TEXT PRIMARY KEY,
+                              kind TEXT,
+                              section_hash TEXT,
+                              materials_hash TEXT,
+                              value BLOB,
+                              size INTEGER,
+                              accessed REAL)""")
+    connection.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+    connection.commit()
+    return {'connection': connection, 'max_bytes': max_bytes, 'max_entries': max_entries}
+
+
+# Function to obtain a result of the cache
+def cache_get(cache, fib_sec, materials, kind, options=None):
+    """
+    Returns:
+        object: Saved result, or None if it is not in the cache.
+    """
+    connection = cache['connection']
+    key = result_key(fib_sec, materials, kind, options)[0]
+    found = connection.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+    if found is None:
+        return None
+    connection.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+    connection.commit()
+    return pickle.loads(found[0])
+
+
+# Function to save a result in the cache
+def cache_put(cache, fib_sec, materials, kind, value, options=None):
+    connection = cache['connection']
+    key, section_hash, materials_hash = result_key(fib_sec, materials, kind, options)
+    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (key, kind, section_hash, materials_hash, sqlite3.Binary(blob), len(blob), time.time()))
+    _evict(cache)
+    connection.commit()
+
+
+# Function to delete the results used less recently until the limits are satisfied
+def _evict(cache):
+    connection = cache['connection']
+    count, total = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+    if count <= cache['max_entries'] and total <= cache['max_bytes']:
+        return
+    to_delete = []
+    for key, size in connection.execute("SELECT key, size FROM results ORDER BY accessed ASC"):
+        if count <= cache['max_entries'] and total <= cache['max_bytes']:
+            break
+        to_delete.append((key,))
+        count -= 1
+        total -= size
+    connection.executemany("DELETE FROM results WHERE key = ?", to_delete)
+
+
+# Function to obtain a result of the cache, or calculate and save it
+def cached(cache, fib_sec, materials, kind, function, options=None):
+    """
+    Args:
+        function (callable): Function without arguments that calculates the result.
+
+    Returns:
+        object: Result.
+    """
+    value = cache_get(cache, fib_sec, materials, kind, options)
+    if value is None:
+        value = function()
+        cache_put(cache, fib_sec, materials, kind, value, options)
+    return value
+
+
+# Function to delete the results of the cache (all, or only one type of calculation)
+def clear_cache(cache, kind=None):
+    connection = cache['connection']
+    if kind is None:
+        connection.execute("DELETE FROM results")
+    else:
+        connection.execute("DELETE FROM results WHERE kind = ?", (kind,))
+    connection.commit()
+
+
+# Function to close the cache
+def close_cache(cache):
+    cache['connection'].close()
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import tempfile
+
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 10, 6, '-30.0*cm', '-20.0*cm', '30.0*cm', '20.0*cm']]
+    materials_1 = {'1': 300.0}
+    cache_1 = open_cache(os.path.join(tempfile.mkdtemp(), 'cache.sqlite'), max_bytes=2000)
+    print(f"First call: {cached(cache_1, fib_sec_1, materials_1, 'test', lambda: 'calculated')}")
+    print(f"Second call: {cached(cache_1, fib_sec_1, materials_1, 'test', lambda: 'not used')}")
+
+    # The oldest results are deleted when the size limit is exceeded
+    for k in range(5):
+        cache_put(cache_1, fib_sec_1, materials_1, 'big', bytes(600), options=k)
+    print(f"Results in the cache: {cache_1['connection'].execute('SELECT COUNT(*) FROM results').fetchone()[0]}")
+    close_cache(cache_1)
@@ -0,0 +1,1069 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A13_Core.py
+COMENTARIOS:    Logica de la GUI sin widgets ni graficos: lectura de la seccion, conversion de unidades, cover,
+                replicas, seccion en el CP, tabla de centros de fibras y codigo de OpenSeesPy. Se puede importar
+                sin Jupyter, ipywidgets ni matplotlib (procesos en lote, CI).
+"""
+
+# %% [00] INTRODUCTION
+# The section is the list of the textarea 'Fiber Section' of the GUI. The values with units are strings like
+# '40.0*cm' (length) or '5.07*cm**2' (area):
+#
+#   section = [['section', 'Fiber', 1, '-GJ', 1000000.0],
+#              ['patch', 'rect', 1, 10, 10, '-30.0*cm', '-20.0*cm', '30.0*cm', '20.0*cm'],
+#              ['layer', 'straight', 3, 3, '5.07*cm**2', '25.0*cm', '-15.0*cm', '25.0*cm', '15.0*cm']]
+#
+# convert_units transforms the section to numeric values in the graphic unit, which is the input of the
+# calculations (CP, centers, fiber table). The functions that modify elements (cover, replicate) keep the
+# units of the element.
+# An instance is one base element and the list of its copies, written as one line of the section:
+#
+#   ['instance', ['layer', 'straight', 3, 1, '5.07*cm**2', '25.0*cm', '-15.0*cm', '25.0*cm', '-15.0*cm'],
+#    [[0.0, 0.0, 0.0], [0.0, 10.0, 0.0], [-10.0, 0.0, 0.0]], 0.0, 0.0]
+#
+# Each copy is [dy, dz, angle]: the base is rotated angle [deg] around (center_y, center_z) and displaced
+# (dy, dz). The displacements and the center are in the unit of the base element (without unit strings). The
+# fiber table and the plots use the base element once; expand_instances writes the copies as elements (code of
+# OpenSeesPy, centers of the fibers).
+# The GUI (S01_GUI01_A01_Fiber_Section.py) calls these functions with the values of its widgets.
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+import S01_GUI01_A04_CP as CP
+import S01_GUI01_A06_FiberTable as FT
+
+
+# %%  [02] UNIDADES
+# Conversion factors: UNIT_FACTORS[graphic_unit][unit] is the value of 1 unit in the graphic unit
+UNIT_FACTORS = {
+    'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
+    'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
+    'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
+    'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
+    'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
+}
+
+
+# Function to read the section written in the textarea
+def parse_section(text):
+    """
+    Returns:
+        list: Section list. A ValueError is raised if the text is not a list.
+    """
+    try:
+        section = eval(text)
+    except Exception:
+        raise ValueError("Invalid list format")
+    if not isinstance(section, list):
+        raise ValueError("Invalid list format")
+    return section
+
+
+# Function to write the section in the textarea (one element per line)
+def format_section(section):
+    if not section:
+        return "[]"
+    return "[\n" + ",\n".join(map(str, section)) + "\n]"
+
+
+# Function to add an element at the end of the section written in the textarea
+def append_element(text, item):
+    """
+    The other elements of the text are not written again (the text can have any format of a list).
+
+    Returns:
+        str: Text of the section with the element in a new line. A ValueError is raised if the text doesn't end
+            with ']'.
+    """
+    body = text.rstrip()
+    if not body.endswith(']'):
+        raise ValueError("Invalid list format")
+    body = body[:-1].rstrip().rstrip(',')
+    if body.endswith('['):
+        return f"{body}\n{item}\n]"
+    return f"{body},\n{item}\n]"
+
+
+# Function to convert one value with units to the graphic unit
+def convert_value(value, graphic_unit):
+    if isinstance(value, str) and '*' in value:
+        # Split the string into value and unit
+        parts = value.split('*')
+        factor = UNIT_FACTORS[graphic_unit][parts[1]]
+        # Check if the unit is squared
+        if '**2' in value:
+            factor = factor ** 2
+        return float(parts[0]) * factor
+    return value
+
+
+# Function to convert one element to numeric values in the graphic unit
+def convert_element(item, graphic_unit):
+    if item[0] == 'instance':
+        unit = element_unit(item[1])
+        factor = 1 if unit == '-' else UNIT_FACTORS[graphic_unit][unit]
+        return ['instance', convert_element(item[1], graphic_unit),
+                [[dy * factor, dz * factor, angle] for dy, dz, angle in item[2]], item[3] * factor, item[4] * factor]
+    return [convert_value(value, graphic_unit) for value in item]
+
+
+# Function to convert the section to numeric values in the graphic unit
+def convert_units(section, graphic_unit):
+    return [convert_element(item, graphic_unit) for item in section]
+
+
+# Function to add the units of the original section to a numeric section with the same structure
+def restore_units(section_values, section, graphic_unit):
+    """
+    The values that had units in the original section are written with the graphic unit.
+    """
+    restored = []
+    for item_values, item in zip(section_values, section):
+        if item[0] == 'instance':
+            # The displacements and the center are already in the graphic unit
+            restored.append(['instance'] + restore_units([item_values[1]], [item[1]], graphic_unit) +
+                            list(item_values[2:]))
+            continue
+        restored_item = list(item_values)
+        for i, value in enumerate(item):
+            if isinstance(value, str) and '*' in value:
+                unit_str = '*' + graphic_unit + '**2' if '**2' in value else '*' + graphic_unit
+                restored_item[i] = str(item_values[i]) + unit_str
+        restored.append(restored_item)
+    return restored
+
+
+# Function to obtain the unit of an element ('-' if it doesn't have units)
+def element_unit(item):
+    for value in item[5:]:
+        if isinstance(value, str) and '*' in value:
+            return value.split('*')[1]
+    return '-'
+
+
+# Function to add unit to a value of the section definition
+def unit_value(value, unit_x, coef=1):
+    if unit_x == "-":
+        return value
+    if coef == 1:
+        return str(value) + f"*{unit_x}"
+    return str(value) + f"*{unit_x}**{coef}"
+
+
+# Function to add unit to a value rounded to significant digits (coordinates and areas of the generated elements)
+def rounded_unit_value(value, unit_x, coef=1, digits=6):
+    return unit_value(float(f"{float(value):.{digits}g}") + 0.0, unit_x, coef)
+
+
+# Function to delete the units of an element
+def strip_units(item):
+    """
+    Returns:
+        tuple: (values, unit) with the numeric values of the element and its unit.
+    """
+    values = [float(value.split('*')[0]) if isinstance(value, str) and '*' in value else value for value in item]
+    return values, element_unit(item)
+
+
+# Function to replace an element of the section by a list of elements (added at the end of the section)
+def replace_element(section, original, new_items, position=None):
+    """
+    Args:
+        position (int): Position of the original element in the section. If it is None (or the element in the
+            position is not the original), the element is searched in the section.
+    """
+    section = list(section)
+    if position is None or not 0 <= position < len(section) or section[position] != original:
+        position = next((index for index, item in enumerate(section) if item == original), None)
+    if position is not None:
+        del section[position]
+    return section + new_items
+
+
+# Function to write a value of an element in a label
+def _label_value(value):
+    return f"{value:g}" if isinstance(value, (int, float)) else str(value)
+
+
+# Function to create the short label of an element (used in the dropdown to select the elements)
+def element_label(position, item):
+    """
+    Returns:
+        str: e.g. '3: patch rect | mat 1 | 10x10 | (-30, -20) cm' or '4: layer straight | mat 3 | 3 x 5.07 |
+            (25, -15) cm'. The point is the first point of the element. An instance shows the number of copies,
+            e.g. '5: instance x24 layer straight | ...'.
+    """
+    if item[0] == 'instance':
+        label = element_label(position, item[1]).split(': ', 1)[1]
+        return f"{position}: instance x{len(item[2])} {label}"
+    values, unit = strip_units(item)
+    unit = '' if unit == '-' else f' {unit}'
+    if item[0] == 'layer':
+        fibers = f"{_label_value(values[3])} x {_label_value(values[4])}"
+    else:
+        fibers = f"{_label_value(values[3])}x{_label_value(values[4])}"
+    point = f"({_label_value(values[5])}, {_label_value(values[6])}){unit}"
+    return f"{position}: {item[0]} {item[1]} | mat {item[2]} | {fibers} | {point}"
+
+
+# Function to create the options of the dropdown to select the elements
+def element_options(section):
+    """
+    Returns:
+        list: (label, position) of each patch, layer and instance of the section.
+    """
+    options = []
+    for position, item in enumerate(section):
+        if item[0] in ['patch', 'layer', 'instance']:
+            try:
+                label = element_label(position, item)
+            except (IndexError, ValueError, TypeError):
+                label = f"{position}: {item}"
+            options.append((label, position))
+    return options
+
+
+# %%  [03] COVER
+# Function to move the edges of a convex polygon to the inside
+def offset_polygon(points, offsets):
+    """
+    All the edges are moved together: the vertex i of the inner polygon is the intersection of the edges i - 1
+    and i moved to the inside.
+
+    Args:
+        points (array): n x 2 vertices (y, z) of a convex polygon (clockwise or counter-clockwise).
+        offsets (array): n distances, offsets[i] is the distance of the edge from points[i] to points[i + 1].
+
+    Returns:
+        np.ndarray: n x 2 vertices of the inner polygon. A ValueError is raised if the polygon is not convex or
+            the offsets are larger than the polygon.
+    """
+    points = np.asarray(points, dtype=float)
+    offsets = np.broadcast_to(np.asarray(offsets, dtype=float), len(points))
+    edges = np.roll(points, -1, axis=0) - points
+    turns = edges[:, 0] * np.roll(edges, -1, axis=0)[:, 1] - edges[:, 1] * np.roll(edges, -1, axis=0)[:, 0]
+    orientation = np.sign(turns.sum())
+    if len(points) < 3 or np.any(turns * orientation <= 0.0):
+        raise ValueError("The polygon must be convex (without repeated or colinear points).")
+
+    # Unit normals to the inside, and lines n . p = n . p_i + offset_i of the moved edges
+    normals = orientation * np.column_stack([-edges[:, 1], edges[:, 0]]) / np.hypot(edges[:, 0], edges[:, 1])[:, None]
+    rhs = np.einsum('ij,ij->i', normals, points) + offsets
+
+    # Intersection of the edges i - 1 and i (n systems of 2 x 2)
+    matrices = np.stack([np.roll(normals, 1, axis=0), normals], axis=1)
+    inner = np.linalg.solve(matrices, np.column_stack([np.roll(rhs, 1), rhs])[..., None])[..., 0]
+    inner_edges = np.roll(inner, -1, axis=0) - inner
+    if np.any(np.einsum('ij,ij->i', inner_edges, edges) <= 0.0):
+        raise ValueError("The cover is larger than the polygon.")
+    return inner
+
+
+# Function to add cover to a convex polygon
+def polygon_cover(points, covers, mat_tag, num_subdiv, unit='-', num_decimals=4):
+    """
+    Divide a convex polygon in the core (matTag) and the cover (matTag + 1), with quad patches.
+
+    Args:
+        points (array): n x 2 vertices (y, z) of the polygon, without units.
+        covers (array): n cover thicknesses, covers[i] is next to the edge from points[i] to points[i + 1].
+        mat_tag (int): Material tag of the core.
+        num_subdiv (array): n subdivisions along each edge.
+        unit (str): Unit of the points ('-' without units).
+
+    Returns:
+        list: Core patches and one cover patch for each edge with cover > 0. The core of a polygon with 4 vertices
+            is one quad patch; the core of other polygons is divided in quad patches from its centroid to the
+            midpoints of its edges.
+    """
+    points = np.asarray(points, dtype=float)
+    covers = np.broadcast_to(np.asarray(covers, dtype=float), len(points))
+    num_subdiv = np.broadcast_to(np.asarray(num_subdiv, dtype=int), len(points))
+    inner = offset_polygon(points, covers)
+
+    # Vertices of the core patches (m x 4 x 2) and of the cover patches (n x 4 x 2)
+    if len(points) == 4:
+        core_quads = inner[None, :, :]
+        core_subdiv = [(num_subdiv[0], num_subdiv[1])]
+    else:
+        centroid = np.broadcast_to(inner.mean(axis=0), inner.shape)
+        midpoints = 0.5 * (inner + np.roll(inner, -1, axis=0))
+        core_quads = np.stack([centroid, np.roll(midpoints, 1, axis=0), inner, midpoints], axis=1)
+        half = np.maximum(1, (num_subdiv + 1) // 2)
+        core_subdiv = list(zip(half, np.roll(half, 1)))
+    cover_quads = np.stack([points, np.roll(points, -1, axis=0), np.roll(inner, -1, axis=0), inner], axis=1)
+    core_quads = (np.round(core_quads, num_decimals) + 0.0).tolist()
+    cover_quads = (np.round(cover_quads, num_decimals) + 0.0).tolist()
+
+    patches = []
+    for quad, (n_ij, n_jk) in zip(core_quads, core_subdiv):
+        patches.append(['patch', 'quad', int(mat_tag), int(n_ij), int(n_jk)] +
+                       [unit_value(value, unit) for point in quad for value in point])
+    for quad, cover, n_edge in zip(cover_quads, covers, num_subdiv):
+        if cover > 0:
+            patches.append(['patch', 'quad', int(mat_tag) + 1, int(n_edge), 1] +
+                           [unit_value(value, unit) for point in quad for value in point])
+    return patches
+
+
+# Function to add cover to a patch
+def cover_element(item, left=0.0, right=0.0, up=0.0, below=0.0, inner=0.0, outer=0.0):
+    """
+    Divide a patch in the core (same matTag) and the cover (matTag + 1).
+
+    Args:
+        item (list): Patch with or without units.
+        left, right, up, below (float): Cover of a rect or quad patch. In a quad patch, the left cover is
+            next to the side IJ, the up cover next to JK, the right cover next to KL and the below cover next
+            to LI (see polygon_cover, the cover patches meet in the bisectors of the corners).
+        inner, outer (float): Cover of a circ patch, next to the inner and outer radius.
+
+    Returns:
+        list: Core patch and the cover patches, with the units of the original patch. The cover of an instance
+            is added to its base element, and each patch keeps the copies of the instance.
+    """
+    if item[0] == 'instance':
+        return [['instance', patch] + list(item[2:])
+                for patch in cover_element(item[1], left, right, up, below, inner, outer)]
+    values, unit = strip_units(item)
+    patch_layer_type, type_element = values[0], values[1]
+
+    if patch_layer_type == 'patch' and type_element == 'rect':
+        matTag, nFibY, nFibZ = int(values[2]), int(values[3]), int(values[4])
+        y0, z0, y1, z1 = (float(value) for value in values[5:9])
+
+        # Modify the original rect patch
+        patch_modificado = [['patch', 'rect', matTag, nFibY, nFibZ,
+                             unit_value(y0 + below, unit), unit_value(z0 + left, unit),
+                             unit_value(y1 - up, unit), unit_value(z1 - right, unit)]]
+        # Left
+        if left > 0:
+            patch_modificado.append(['patch', 'rect', matTag + 1, nFibY, 1,
+                                     unit_value(y0 + below, unit), unit_value(z0, unit),
+                                     unit_value(y1 - up, unit), unit_value(z0 + left, unit)])
+        # Right
+        if right > 0:
+            patch_modificado.append(['patch', 'rect', matTag + 1, nFibY, 1,
+                                     unit_value(y0 + below, unit), unit_value(z1 - right, unit),
+                                     unit_value(y1 - up, unit), unit_value(z1, unit)])
+        # Below
+        if below > 0:
+            patch_modificado.append(['patch', 'rect', matTag + 1, 1, nFibZ,
+                                     unit_value(y0, unit), unit_value(z0, unit),
+                                     unit_value(y0 + below, unit), unit_value(z1, unit)])
+        # Up
+        if up > 0:
+            patch_modificado.append(['patch', 'rect', matTag + 1, 1, nFibZ,
+                                     unit_value(y1 - up, unit), unit_value(z0, unit),
+                                     unit_value(y1, unit), unit_value(z1, unit)])
+        return patch_modificado
+
+    elif patch_layer_type == 'patch' and type_element == 'quad':
+        matTag, numSubdivIJ, numSubdivJK = int(values[2]), int(values[3]), int(values[4])
+        points = np.array(values[5:13], dtype=float).reshape(4, 2)
+        # Cover next to the sides IJ, JK, KL and LI
+        return polygon_cover(points, [left, up, right, below], matTag,
+                             [numSubdivIJ, numSubdivJK, numSubdivIJ, numSubdivJK], unit)
+
+    elif patch_layer_type == 'patch' and type_element == 'circ':
+        matTag, numSubdivCirc, numSubdivRad = int(values[2]), int(values[3]), int(values[4])
+        yc, zc, r_ini, r_end, ang_ini, ang_end = (float(value) for value in values[5:11])
+        center = [unit_value(yc, unit), unit_value(zc, unit)]
+        angles = [unit_value(ang_ini, unit), unit_value(ang_end, unit)]
+
+        # Modify the original circ patch
+        patch_modificado = [['patch', 'circ', matTag, numSubdivCirc, numSubdivRad] + center +
+                            [unit_value(r_ini + inner, unit), unit_value(r_end - outer, unit)] + angles]
+        # Inner cover
+        if inner > 0:
+            patch_modificado.append(['patch', 'circ', matTag + 1, numSubdivCirc, 1] + center +
+                                    [unit_value(r_ini, unit), unit_value(r_ini + inner, unit)] + angles)
+        # Outer cover
+        if outer > 0:
+            patch_modificado.append(['patch', 'circ', matTag + 1, numSubdivCirc, 1] + center +
+                                    [unit_value(r_end - outer, unit), unit_value(r_end, unit)] + angles)
+        return patch_modificado
+
+    raise ValueError("The cover can only be added to a patch.")
+
+
+# Function to add cover to an element of the section
+def section_cover(section, item, position=None, **cover):
+    return replace_element(section, item, cover_element(item, **cover), position)
+
+
+# Function to find the patches of the section that can have cover
+def cover_positions(section, mat_tag=None):
+    """
+    Args:
+        mat_tag (int): Material tag of the patches. None selects all the patches.
+
+    Returns:
+        list: Positions of the rect, quad and circ patches (and instances of these patches).
+    """
+    positions = []
+    for position, item in enumerate(section):
+        base = item[1] if item[0] == 'instance' else item
+        if base[0] == 'patch' and base[1] in ['rect', 'quad', 'circ']:
+            if mat_tag is None or int(base[2]) == int(mat_tag):
+                positions.append(position)
+    return positions
+
+
+# Function to add cover to many patches of the section
+def section_cover_patches(section, mat_tag=None, **cover):
+    """
+    Add the same cover to all the patches (or the patches of one matTag) in one operation.
+
+    Args:
+        cover: Arguments of cover_element. Each patch uses the covers of its type (left, right, up and below in
+            rect and quad patches; inner and outer in circ patches).
+
+    Returns:
+        list: Section without the patches, and the core and cover patches of each one at the end. A ValueError is
+            raised if there aren't patches, or with the position of the patch that can't have the cover.
+    """
+    positions = cover_positions(section, mat_tag)
+    if not positions:
+        raise ValueError("There aren't patches to add the cover.")
+    new_items = []
+    for position in positions:
+        try:
+            new_items += cover_element(section[position], **cover)
+        except ValueError as e:
+            raise ValueError(f"Element {position}: {e}")
+    selected = set(positions)
+    return [item for position, item in enumerate(section) if position not in selected] + new_items
+
+
+# %%  [04] REPLICATE
+# Positions of the coordinates of each element (the other values are copied)
+COORDINATES = {
+    ('patch', 'rect'): [(5, 6), (7, 8)],
+    ('patch', 'quad'): [(5, 6), (7, 8), (9, 10), (11, 12)],
+    ('patch', 'circ'): [(5, 6)],
+    ('layer', 'straight'): [(5, 6), (7, 8)],
+    ('layer', 'circ'): [(5, 6)]
+}
+
+
+# Positions of the angles of the circular elements [deg] (they don't have units)
+ANGLES = {
+    ('patch', 'circ'): (9, 10),
+    ('layer', 'circ'): (8, 9)
+}
+
+
+# Function to create the displacements of copies along a line
+def linear_pattern(num_copies, dis_y, dis_z):
+    """
+    Returns:
+        np.ndarray: (num_copies + 1) x 2 displacements (y, z), the first one is the original element.
+    """
+    steps = np.arange(num_copies + 1)
+    return np.column_stack([steps * dis_y, steps * dis_z])
+
+
+# Function to create the displacements of copies in a grid
+def grid_pattern(rows, columns, dis_y, dis_z):
+    """
+    Args:
+        rows, columns (int): Number of elements along y and z (the original element is in the first row and
+            column).
+
+    Returns:
+        np.ndarray: (rows * columns) x 2 displacements (y, z).
+    """
+    row, column = np.meshgrid(np.arange(rows), np.arange(columns), indexing='ij')
+    return np.column_stack([row.ravel() * dis_y, column.ravel() * dis_z])
+
+
+# Function to create the rotations of copies around a center
+def polar_pattern(num_copies, angle):
+    """
+    Returns:
+        np.ndarray: (num_copies + 1) angles [deg], the first one is the original element.
+    """
+    return np.arange(num_copies + 1) * angle
+
+
+# Function to transform an element into several copies
+def transform_element(item, offsets=None, angles=None, center=(0.0, 0.0), rotate=True):
+    """
+    Copies of an element. The point p of the copy k is R(angles[k]) (p - center) + center + offsets[k], with the
+    rotation in the y-z plane (from y to z). All the copies are calculated together.
+
+    Args:
+        offsets (np.ndarray): n x 2 displacements (y, z) in the unit of the element. None doesn't displace.
+        angles (np.ndarray): n angles [deg]. None doesn't rotate.
+        center (tuple): Center of the rotations (y, z) in the unit of the element.
+        rotate (bool): If False, the copies are only displaced to the position of the rotated center of the
+            element (they keep their orientation).
+
+    Returns:
+        list: Copies with the units of the original element. A rotated rect patch is written as a quad patch, and
+            the angles of the circular elements are rotated.
+    """
+    values, unit = strip_units(item)
+    try:
+        coordinates = COORDINATES[(values[0], values[1])]
+    except KeyError:
+        raise ValueError("The replicate element must be a patch or a layer.")
+    n_copies = len(offsets) if offsets is not None else len(angles)
+    offsets = np.zeros((n_copies, 2)) if offsets is None else np.asarray(offsets, dtype=float)
+    angles = np.zeros(n_copies) if angles is None else np.asarray(angles, dtype=float)
+    center = np.asarray(center, dtype=float)
+
+    # Points of the element (m x 2), as quad if the rect patch is rotated
+    points = np.array([[values[y_index], values[z_index]] for y_index, z_index in coordinates], dtype=float)
+    base = [values[0], values[1], int(values[2]), int(values[3])]
+    base.append(unit_value(float(values[4]), unit, 2) if values[0] == 'layer' else int(values[4]))
+    rotated = rotate and np.any(np.mod(angles, 360.0) != 0.0)
+    if rotated and (values[0], values[1]) == ('patch', 'rect'):
+        (y1, z1), (y2, z2) = points
+        points = np.array([[y1, z1], [y2, z1], [y2, z2], [y1, z2]])
+        base[1] = 'quad'
+
+    # Points of all the copies (n x m x 2) in one operation
+    theta = np.radians(angles)
+    cos, sin = np.cos(theta)[:, None], np.sin(theta)[:, None]
+    if rotate:
+        local = points[None, :, :] - center
+        new_points = np.stack([cos * local[..., 0] - sin * local[..., 1],
+                               sin * local[..., 0] + cos * local[..., 1]], axis=-1) + center
+    else:
+        reference = points.mean(axis=0) - center
+        moved = np.column_stack([cos[:, 0] * reference[0] - sin[:, 0] * reference[1],
+                                 sin[:, 0] * reference[0] + cos[:, 0] * reference[1]]) + center
+        new_points = points[None, :, :] + (moved - points.mean(axis=0))[:, None, :]
+    new_points = (np.round(new_points + offsets[:, None, :], 10) + 0.0).tolist()
+
+    # Other values of the element (radius of the circular elements and angles)
+    others = [float(value) for value in values[5 + 2 * len(coordinates):]]
+    angle_indexes = ANGLES.get((values[0], values[1]))
+    copies = []
+    for k in range(n_copies):
+        new_item = list(base)
+        for y, z in new_points[k]:
+            new_item += [unit_value(y, unit), unit_value(z, unit)]
+        for i, value in enumerate(others, start=5 + 2 * len(coordinates)):
+            if angle_indexes is not None and i in angle_indexes:
+                new_item.append(round(value + float(angles[k]), 10) if rotate else value)
+            else:
+                new_item.append(unit_value(value, unit))
+        copies.append(new_item)
+    return copies
+
+
+# Function to replicate an element
+def replicate_element(item, num_copies, dis_y, dis_z):
+    """
+    Copies of an element, each one displaced (dis_y, dis_z) from the previous.
+
+    Returns:
+        list: Original element and the copies, with the units of the original element.
+    """
+    return transform_element(item, offsets=linear_pattern(num_copies, dis_y, dis_z))
+
+
+# Function to create the displacements and rotations of a replicate pattern
+def pattern_transforms(pattern='linear', num_copies=1, dis_y=0.0, dis_z=0.0, num_columns=0, angle=0.0):
+    """
+    Args:
+        pattern (str): 'linear' (num_copies along (dis_y, dis_z)), 'grid' (num_copies + 1 rows every dis_y and
+            num_columns + 1 columns every dis_z) or 'polar' (num_copies rotated angle [deg]).
+
+    Returns:
+        tuple: (offsets, angles), n x 2 displacements (y, z) and n angles [deg]. The first one is the original
+            element.
+    """
+    if pattern == 'linear':
+        offsets = linear_pattern(num_copies, dis_y, dis_z)
+    elif pattern == 'grid':
+        offsets = grid_pattern(num_copies + 1, num_columns + 1, dis_y, dis_z)
+    elif pattern == 'polar':
+        angles = polar_pattern(num_copies, angle)
+        return np.zeros((len(angles), 2)), angles
+    else:
+        raise ValueError(f"Unknown replicate pattern: {pattern}")
+    return offsets, np.zeros(len(offsets))
+
+
+# Function to replicate an element with a pattern
+def replicate_pattern(item, pattern='linear', num_copies=1, dis_y=0.0, dis_z=0.0, num_columns=0, angle=0.0,
+                      center_y=0.0, center_z=0.0, rotate=True):
+    """
+    Args:
+        pattern (str): 'linear', 'grid' or 'polar' (see pattern_transforms). The polar copies are rotated around
+            (center_y, center_z).
+
+    Returns:
+        list: Original element and the copies, with the units of the original element.
+    """
+    offsets, angles = pattern_transforms(pattern, num_copies, dis_y, dis_z, num_columns, angle)
+    return transform_element(item, offsets, angles, (center_y, center_z), rotate)
+
+
+# Function to replicate an element with a pattern as an instance
+def instance_element(item, pattern='linear', num_copies=1, dis_y=0.0, dis_z=0.0, num_columns=0, angle=0.0,
+                     center_y=0.0, center_z=0.0, rotate=True):
+    """
+    Same copies of replicate_pattern, written as one instance (see [00] INTRODUCTION).
+
+    Returns:
+        list: ['instance', item, transforms, center_y, center_z].
+    """
+    values, _ = strip_units(item)
+    try:
+        coordinates = COORDINATES[(values[0], values[1])]
+    except KeyError:
+        raise ValueError("The replicate element must be a patch or a layer.")
+    offsets, angles = pattern_transforms(pattern, num_copies, dis_y, dis_z, num_columns, angle)
+    if not rotate:
+        # The copies keep their orientation: the rotation of the reference point is a displacement
+        points = np.array([[values[y_index], values[z_index]] for y_index, z_index in coordinates], dtype=float)
+        y_ref, z_ref = points.mean(axis=0)
+        y_new, z_new = FT.instance_points([y_ref], [z_ref], np.column_stack([offsets, angles]), center_y, center_z)
+        offsets = np.column_stack([y_new[:, 0] - y_ref, z_new[:, 0] - z_ref])
+        angles = np.zeros(len(angles))
+    transforms = np.round(np.column_stack([offsets, angles]), 10) + 0.0
+    return ['instance', list(item), transforms.tolist(), float(center_y), float(center_z)]
+
+
+# Function to write the copies of an instance as elements
+def expand_instance(item):
+    """
+    Returns:
+        list: Copies of the base element, with its units (a rotated rect patch is written as a quad patch).
+    """
+    transforms = np.asarray(item[2], dtype=float).reshape(-1, 3)
+    if len(transforms) == 0:
+        return []
+    return transform_element(item[1], transforms[:, :2], transforms[:, 2], (item[3], item[4]))
+
+
+# Function to write the instances of the section as elements
+def expand_instances(section):
+    expanded = []
+    for item in section:
+        if item[0] == 'instance':
+            expanded.extend(expand_instance(item))
+        else:
+            expanded.append(item)
+    return expanded
+
+
+# Function to replicate an element of the section
+def section_replicate(section, item, num_copies, dis_y, dis_z, position=None, pattern='linear', instanced=False,
+                      **options):
+    """
+    Args:
+        instanced (bool): If True, the element is replaced by one instance (see instance_element). Otherwise, the
+            copies are added as elements.
+        options: Other arguments of replicate_pattern (num_columns, angle, center_y, center_z, rotate).
+    """
+    if instanced:
+        copies = [instance_element(item, pattern, num_copies, dis_y, dis_z, **options)]
+    else:
+        copies = replicate_pattern(item, pattern, num_copies, dis_y, dis_z, **options)
+    return replace_element(section, item, copies, position)
+
+
+# %%  [05] TRANSFORM
+# Function to create the matrix of a rigid transformation of the points (y, z)
+def transform_matrix(angle=0.0, mirror=None):
+    """
+    Args:
+        angle (float): Rotation [deg] from y to z.
+        mirror (str): 'y' changes the sign of y and 'z' changes the sign of z (before the rotation). None doesn't
+            mirror.
+
+    Returns:
+        np.ndarray: 2 x 2 matrix.
+    """
+    if mirror not in [None, 'y', 'z']:
+        raise ValueError("The mirror must be 'y', 'z' or None.")
+    theta = np.radians(angle)
+    rotation = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+    return rotation @ np.diag([-1.0 if mirror == 'y' else 1.0, -1.0 if mirror == 'z' else 1.0])
+
+
+# Function to transform the initial and final angles of a circular element [deg]
+def transform_angles(ang_ini, ang_end, angle=0.0, mirror=None):
+    if mirror == 'y':
+        ang_ini, ang_end = 180.0 - ang_end, 180.0 - ang_ini
+    elif mirror == 'z':
+        ang_ini, ang_end = -ang_end, -ang_ini
+    return round(ang_ini + angle, 10) + 0.0, round(ang_end + angle, 10) + 0.0
+
+
+# Function to write an element with its transformed points
+def _transformed_element(item, points, angle, mirror):
+    """
+    Args:
+        item (list): Original patch or layer (with units).
+        points (np.ndarray): Transformed points (see transform_section: the four corners of a rect patch).
+    """
+    unit = element_unit(item)
+    kind = (item[0], item[1])
+    if kind == ('patch', 'rect'):
+        n_y, n_z = item[3], item[4]
+        quarter = angle / 90.0
+        if abs(quarter - round(quarter)) > 1e-9:
+            # Rotated rect patch: quad patch I, J, K, L
+            kind, new_item = ('patch', 'quad'), ['patch', 'quad', item[2], n_y, n_z]
+            if mirror is not None:
+                points = points[[1, 0, 3, 2]]
+        else:
+            if round(quarter) % 2 == 1:
+                n_y, n_z = n_z, n_y
+            points = np.array([points.min(axis=0), points.max(axis=0)])
+            new_item = ['patch', 'rect', item[2], n_y, n_z]
+        for y, z in points.tolist():
+            new_item += [unit_value(y, unit), unit_value(z, unit)]
+        return new_item
+
+    new_item = list(item)
+    if kind == ('patch', 'quad') and mirror is not None:
+        # Same orientation of the points (the sides IJ and JK keep their subdivisions)
+        points = points[[1, 0, 3, 2]]
+    for (y_index, z_index), (y, z) in zip(COORDINATES[kind], points.tolist()):
+        new_item[y_index], new_item[z_index] = unit_value(y, unit), unit_value(z, unit)
+    if kind in ANGLES:
+        ang_ini, ang_end = ANGLES[kind]
+        new_item[ang_ini], new_item[ang_end] = transform_angles(float(strip_units([item[ang_ini]])[0][0]),
+                                                                float(strip_units([item[ang_end]])[0][0]), angle,
+                                                                mirror)
+    return new_item
+
+
+# Function to rotate, mirror and displace elements of the section
+def transform_section(section, graphic_unit, positions=None, angle=0.0, mirror=None, dy=0.0, dz=0.0,
+                      center=(0.0, 0.0)):
+    """
+    Rigid transformation of elements: the point p is moved to M (p - center) + center + (dy, dz), with M the
+    mirror and then the rotation (see transform_matrix). The points of all the elements are transformed together,
+    in one array operation.
+
+    Args:
+        graphic_unit (str): Unit of dy, dz and center (the elements keep their units).
+        positions (list): Positions of the elements in the section. None transforms all the patches, layers and
+            instances.
+
+    Returns:
+        list: Section with the transformed elements in their positions. A rect patch rotated an angle that is not a
+            multiple of 90 deg is written as a quad patch, and the angles of the circular elements are changed.
+            In an instance, the base element and the center are transformed, and the copies are changed to keep
+            their relative position.
+    """
+    matrix = transform_matrix(angle, mirror)
+    if positions is None:
+        positions = [position for position, item in enumerate(section) if item[0] in ['patch', 'layer', 'instance']]
+
+    # Points of all the elements (in the unit of each element) and the factors to the graphic unit
+    points, factors, slices = [], [], {}
+    for position in positions:
+        item = section[position]
+        base = item[1] if item[0] == 'instance' else item
+        values, unit = strip_units(base)
+        kind = (values[0], values[1])
+        if kind not in COORDINATES:
+            raise ValueError(f"Element {position}: only patches and layers can be transformed.")
+        if kind == ('patch', 'rect'):
+            (y1, z1), (y2, z2) = [(values[i], values[j]) for i, j in COORDINATES[kind]]
+            element_points = [(y1, z1), (y2, z1), (y2, z2), (y1, z2)]
+        else:
+            element_points = [(values[i], values[j]) for i, j in COORDINATES[kind]]
+        if item[0] == 'instance':
+            element_points.append((item[3], item[4]))
+        slices[position] = slice(len(points), len(points) + len(element_points))
+        points += element_points
+        factors += [1.0 if unit == '-' else UNIT_FACTORS[graphic_unit][unit]] * len(element_points)
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    factors = np.asarray(factors, dtype=float)[:, None]
+    center = np.asarray(center, dtype=float)
+    moved = ((points * factors - center) @ matrix.T + center + np.array([dy, dz], dtype=float)) / factors
+    moved = np.round(moved, 10) + 0.0
+
+    transformed = list(section)
+    for position, points_slice in slices.items():
+        item = section[position]
+        if item[0] == 'instance':
+            # Copy k: R(angle_k) (p - c) + c + t_k, with M R(angle_k) = R(det(M) angle_k) M
+            copies = np.asarray(item[2], dtype=float).reshape(-1, 3)
+            offsets = np.round(copies[:, :2] @ matrix.T, 10) + 0.0
+            copy_angles = copies[:, 2] * (1.0 if mirror is None else -1.0) + 0.0
+            new_base = _transformed_element(item[1], moved[points_slice][:-1], angle, mirror)
+            y_c, z_c = moved[points_slice][-1]
+            transformed[position] = ['instance', new_base, np.column_stack([offsets, copy_angles]).tolist(),
+                                     float(y_c), float(z_c)]
+        else:
+            transformed[position] = _transformed_element(item, moved[points_slice], angle, mirror)
+    return transformed
+
+
+# %%  [06] MESH DENSITY
+# Function to calculate the lengths of a patch along its two subdivisions
+def patch_lengths(item):
+    """
+    Args:
+        item (list): Patch with numeric values.
+
+    Returns:
+        tuple: Lengths along the subdivisions item[3] and item[4]: (y, z) in a rect patch, (IJ, JK) in a quad
+            patch (mean of the opposite sides) and (arc at the mean radius, radial length) in a circ patch.
+    """
+    if item[1] == 'rect':
+        return abs(item[7] - item[5]), abs(item[8] - item[6])
+    elif item[1] in ['quad', 'quadr']:
+        points = np.array(item[5:13], dtype=float).reshape(4, 2)
+        sides = np.linalg.norm(np.roll(points, -1, axis=0) - points, axis=1)
+        return (sides[0] + sides[2]) / 2.0, (sides[1] + sides[3]) / 2.0
+    elif item[1] == 'circ':
+        r_ini, r_end = abs(item[7]), abs(item[8])
+        return (r_ini + r_end) / 2.0 * np.radians(abs(item[10] - item[9])), abs(r_end - r_ini)
+    raise ValueError(f"Unknown patch: {item[1]}")
+
+
+# Function to calculate the subdivisions of the patches for a fiber size
+def mesh_subdivisions(lengths, fiber_size):
+    """
+    Args:
+        lengths (np.ndarray): n x 2 lengths of the patches (see patch_lengths).
+
+    Returns:
+        np.ndarray: n x 2 subdivisions (at least 1).
+    """
+    return np.maximum(1, np.ceil(np.asarray(lengths) / fiber_size - 1e-9)).astype(int)
+
+
+# Function to find the fiber size of a budget of fibers
+def budget_fiber_size(lengths, copies, max_fibers, n_iterations=60):
+    """
+    Smallest fiber size (bisection) with sum(copies * subdivisions) <= max_fibers.
+
+    Args:
+        lengths (np.ndarray): n x 2 lengths of the patches.
+        copies (np.ndarray): n copies of each patch (1, or the copies of an instance).
+        max_fibers (int): Fibers of the patches.
+    """
+    lengths, copies = np.asarray(lengths, dtype=float), np.asarray(copies)
+    if max_fibers < copies.sum():
+        raise ValueError(f"The budget must be at least {int(copies.sum())} fibers (one fiber per patch).")
+    low, high = np.log(lengths.max() * 1e-6), np.log(lengths.max())
+    for _ in range(n_iterations):
+        middle = (low + high) / 2.0
+        if np.sum(copies * np.prod(mesh_subdivisions(lengths, np.exp(middle)), axis=1)) > max_fibers:
+            low = middle
+        else:
+            high = middle
+    return float(np.exp(high))
+
+
+# Function to choose the subdivisions of the patches from a fiber size or a budget of fibers
+def auto_mesh(section, graphic_unit, fiber_size=None, max_fibers=None, positions=None):
+    """
+    Args:
+        graphic_unit (str): Unit of fiber_size.
+        fiber_size (float): Maximum size of the fibers.
+        max_fibers (int): Maximum number of fibers of the section (with the layers and the patches that are not
+            changed). If fiber_size is also given, the larger fiber size is used.
+        positions (list): Positions of the patches to change. None changes all the patches (and instances of
+            patches).
+
+    Returns:
+        tuple: (section, fiber_size, n_fibers). Section with the new subdivisions (the other values are not
+            changed), fiber size used and number of fibers of the section.
+    """
+    if fiber_size is None and max_fibers is None:
+        raise ValueError("Define the fiber size or the number of fibers.")
+    if fiber_size is not None and fiber_size <= 0:
+        raise ValueError("The fiber size must be positive.")
+    if positions is None:
+        positions = cover_positions(section)
+    positions = [position for position in positions
+                 if (section[position][1] if section[position][0] == 'instance' else section[position])[0] == 'patch']
+    if not positions:
+        raise ValueError("There aren't patches to mesh.")
+
+    lengths, copies = [], []
+    for position in positions:
+        item = section[position]
+        base = item[1] if item[0] == 'instance' else item
+        values = convert_element(base, graphic_unit)
+        if values[1] == 'circ':
+            # Angles [deg] (they can be written with the unit of the patch)
+            values[9:11] = strip_units(base)[0][9:11]
+        lengths.append(patch_lengths(values))
+        copies.append(len(item[2]) if item[0] == 'instance' else 1)
+    lengths, copies = np.array(lengths, dtype=float), np.array(copies)
+    if max_fibers is not None:
+        fixed = FT.fiber_count(section) - sum(FT.element_fiber_count(section[position]) for position in positions)
+        if max_fibers - fixed < copies.sum():
+            raise ValueError(f"The budget must be at least {int(fixed + copies.sum())} fibers (layers, patches that "
+                             "are not changed and one fiber per patch).")
+        size_budget = budget_fiber_size(lengths, copies, max_fibers - fixed)
+        fiber_size = size_budget if fiber_size is None else max(fiber_size, size_budget)
+    subdivisions = mesh_subdivisions(lengths, fiber_size).tolist()
+
+    meshed = list(section)
+    for position, (n_1, n_2) in zip(positions, subdivisions):
+        item = list(section[position])
+        if item[0] == 'instance':
+            item[1] = item[1][:3] + [n_1, n_2] + item[1][5:]
+        else:
+            item[3], item[4] = n_1, n_2
+        meshed[position] = item
+    return meshed, fiber_size, FT.fiber_count(meshed)
+
+
+# %%  [07] CP, CENTERS AND CODE
+# Function to draw the section with respect to its plastic centroid
+def section_in_cp(section, materials, graphic_unit, plastic_centroid=None):
+    """
+    Args:
+        section (list): Section with units.
+        materials (dict): Strength of each matTag ('Material_Strength.txt').
+        graphic_unit (str): Unit of the calculation.
+        plastic_centroid (tuple): Plastic centroid (y, z) in the graphic unit, if it was calculated before.
+
+    Returns:
+        list: Section drawn with respect to its plastic centroid, with units.
+    """
+    section_values = convert_units(section, graphic_unit)
+    cp_section = CP.Seccion_CP(section_values, materials, plastic_centroid, verbose=False)
+    return restore_units(cp_section, section, graphic_unit)
+
+
+# Function to calculate the center of the fibers
+def center_table(section_values):
+    """
+    Center of the fibers of each element, in the format of 'Center_Fiber_Section.txt' (coordinates [z, y],
+    same as S01_GUI01_A05_CenterFiber.plot_center_fiber_section, without the plot).
+
+    Args:
+        section_values (list): Section with numeric values (see convert_units).
+
+    Returns:
+        dict: 'center_fiber_patch', 'center_fiber_straight', 'center_fiber_circle' and 'center_fiber_wedge'.
+    """
+    centers = {'center_fiber_patch': [], 'center_fiber_straight': [], 'center_fiber_circle': [],
+               'center_fiber_wedge': []}
+    for item in expand_instances(section_values):
+        if item[0] == 'layer' and item[1] == 'straight':
+            n_bars, As, Iy, Iz, Jy, Jz = item[3:9]
+            Y, Z = np.linspace(Iy, Jy, n_bars), np.linspace(Iz, Jz, n_bars)
+            centers['center_fiber_straight'].append([[float(z), float(y)] for y, z in zip(Y, Z)])
+        elif item[0] == 'layer' and item[1] == 'circ':
+            y, z, _ = FT.circ_layer_fibers(*item[3:10])
+            centers['center_fiber_circle'].append([[float(zi), float(yi)] for yi, zi in zip(y, z)])
+        elif item[0] == 'patch' and item[1] in ['rect', 'quad', 'quadr']:
+            y, z, _ = FT.element_fibers(item)
+            centers['center_fiber_patch'].append([[float(zi), float(yi)] for yi, zi in zip(y, z)])
+        elif item[0] == 'patch' and item[1] == 'circ':
+            # Center of the wedges in the plot (horizontal axis z), at the midpoint radius
+            nc, nr, yC, zC, ri, re, a0, a1 = item[3:11]
+            r_mid = ri + (np.arange(nr) + 0.5) * (re - ri) / nr
+            th_mid = np.deg2rad(a0 + (np.arange(nc) + 0.5) * (a1 - a0) / nc)
+            z = zC + r_mid[:, None] * np.cos(th_mid)[None, :]
+            y = yC + r_mid[:, None] * np.sin(th_mid)[None, :]
+            centers['center_fiber_wedge'].append([[float(zi), float(yi)] for zi, yi in zip(z.ravel(), y.ravel())])
+    return centers
+
+
+# Function to write the OpenSeesPy code of the section
+def section_code(section, graphic_unit):
+    """
+    Code that defines and plots the section with opsvis. The units of the section are defined as variables
+    with their factor to the graphic unit. The instances are written as elements.
+    """
+    section = expand_instances(section)
+    # Find all unique units in the section list
+    units = []
+    for item in section:
+        for subitem in item:
+            if isinstance(subitem, str) and '*' in subitem and subitem.split('*')[1] not in units:
+                units.append(subitem.split('*')[1])
+
+    # Create the template
+    template = """import opsvis as opsv
+import matplotlib.pyplot as plt
+"""
+    # Write the units to use in the definition of the section.
+    for unit in units:
+        factor = UNIT_FACTORS[graphic_unit][unit]
+        template += f"{unit} = {factor} # Complete this field according the units of your code.\n"
+
+    # Write the section parameters: the values with units are written as expressions, e.g. 40.0*cm
+    special = ['section', 'Fiber', 'patch', 'rect', 'quad', 'circ', 'layer', 'straight', '-GJ']
+    for index, item in enumerate(section):
+        values = [f"'{value}'" if value in special else str(value).replace("'", "") for value in item]
+        item_str = '[' + ', '.join(values) + ']'
+        if index == 0:
+            template += f"\nsection = [{item_str},\n"
+        elif index != len(section) - 1:
+            template += " " * 11 + f"{item_str},\n"
+        else:
+            template += " " * 11 + f"{item_str}]\n"
+
+    # Template code
+    template += """
+opsv.plot_fiber_section(section)        # Display section
+plt.axis('equal')
+plt.savefig(r'img_CP.png')              # Save image
+
+# Define section in Openseespy. Remember define materials before define the section
+opsv.fib_sec_list_to_cmds(section)"""
+    return template
+
+
+# %%  [08] TEST
+if __name__ == '__main__':
+    section_1 = parse_section("""[['section', 'Fiber', 1, '-GJ', 1000000.0],
+        ['patch', 'rect', 1, 10, 10, '-30.0*cm', '-20.0*cm', '30.0*cm', '20.0*cm'],
+        ['layer', 'straight', 3, 3, '5.07*cm**2', '25.0*cm', '-15.0*cm', '25.0*cm', '15.0*cm']]""")
+
+    # Elements of the section
+    print(element_options(section_1))
+
+    # Cover of a hexagon (radius 30 cm) without cover in one edge
+    hexagon_1 = [[30.0 * np.cos(np.radians(60.0 * k)), 30.0 * np.sin(np.radians(60.0 * k))] for k in range(6)]
+    print(format_section(polygon_cover(hexagon_1, [4.0, 4.0, 4.0, 0.0, 4.0, 4.0], 1, 4, 'cm')))
+
+    # Cover of all the patches with matTag 1 of a box with 2 cells
+    box_1 = [['patch', 'rect', 1, 4, 8, '-50.0*cm', '-80.0*cm', '-30.0*cm', '80.0*cm'],
+             ['patch', 'rect', 1, 4, 8, '30.0*cm', '-80.0*cm', '50.0*cm', '80.0*cm'],
+             ['patch', 'rect', 1, 4, 2, '-30.0*cm', '-80.0*cm', '30.0*cm', '-60.0*cm'],
+             ['patch', 'rect', 1, 4, 2, '-30.0*cm', '-10.0*cm', '30.0*cm', '10.0*cm'],
+             ['patch', 'rect', 1, 4, 2, '-30.0*cm', '60.0*cm', '30.0*cm', '80.0*cm']]
+    print(f"Patches of the box with cover: {len(section_cover_patches(box_1, 1, left=2.0, right=2.0))}")
+
+    # Cover and replicate
+    section_1 = section_cover(section_1, section_1[1], 1, left=4.0, right=4.0, up=4.0, below=4.0)
+    section_1 = section_replicate(section_1, section_1[1], 1, -50.0, 0.0)
+    print(format_section(section_1))
+
+    # Grid of 4 x 4 bars as one instance
+    bar_1 = ['layer', 'straight', 3, 1, '2.0*cm**2', '-15.0*cm', '-15.0*cm', '-15.0*cm', '-15.0*cm']
+    section_2 = section_replicate([bar_1], bar_1, 3, 10.0, 10.0, pattern='grid', instanced=True, num_columns=3)
+    fibers_2 = FT.fiber_table(convert_units(section_2, 'cm'))
+    fibers_3 = FT.fiber_table(convert_units(expand_instances(section_2), 'cm'))
+    print(element_options(section_2))
+    print(f"Copies: {len(expand_instances(section_2))}, same fibers: {np.allclose(fibers_2['z'], fibers_3['z'])}")
+
+    # Section rotated 30 deg around the origin and mirrored (z -> -z)
+    print(format_section(transform_section(section_1, 'cm', angle=30.0, mirror='z')))
+
+    # Mesh of the section with a budget of 200 fibers
+    meshed_1, size_1, n_fibers_1 = auto_mesh(section_1, 'cm', max_fibers=200)
+    print(f"Fibers: {FT.fiber_count(section_1)} -> {n_fibers_1} (fiber size {size_1:.3f} cm)")
+
+    # Section in the CP and code
+    cp_section_1 = section_in_cp(section_1, {'1': 300.0, '2': 250.0, '3': 4200.0}, 'cm')
+    print(section_code(cp_section_1, 'm'))
+    print(f"Centers of the bars: {center_table(convert_units(section_1, 'cm'))['center_fiber_straight']}")
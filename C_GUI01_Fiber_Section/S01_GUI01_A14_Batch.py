@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A14_Batch.py
+COMENTARIOS:    Procesa en lote una carpeta con archivos de secciones (mismo formato del textarea de la GUI).
+                Para cada seccion escribe la imagen, la seccion en el CP, la tabla de centros de fibras y el
+                codigo de OpenSeesPy, en paralelo, con un resumen de tiempos y errores.
+"""
+
+# %% [00] INTRODUCTION
+# Use (from the folder of S01_GUI01_A01_Fiber_Section.py):
+#
+#   python C_GUI01_Fiber_Section/S01_GUI01_A14_Batch.py Secciones/ -o Resultados/ -u cm -w 4
+#
+# Each file of the folder (*.txt by default) contains one section list, e.g. the text copied from the textarea
+# 'Fiber Section'. For a file 'Columna_01.txt' the outputs are:
+#   - Columna_01.png            Image of the section (like 'Show').
+#   - Columna_01_CP.txt         Section drawn with respect to its plastic centroid (like 'CP').
+#   - Columna_01_Center.txt     Center of the fibers (like 'Center').
+#   - Columna_01_Code.py        OpenSeesPy code (like 'Code').
+# The material strengths are read from 'Material_Strength.txt' of the GUI (option -m to use another file).
+# The summary of the files processed (time and errors) is written in 'Batch_Summary.csv'.
+
+
+# %%  [01] LIBRERIAS
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import S01_GUI01_A13_Core as core
+
+
+# %%  [02] FUNCIONES
+# Function to save the image of a section
+def save_preview(section_values, path, graphic_unit, fibers=True):
+    # matplotlib is imported only when the images are requested, without display
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import S01_GUI01_A02_Graf_Sec_OPSVIS as opsv1
+
+    opsv1.plot_fiber_section(section_values, f'z [{graphic_unit}]', f'y [{graphic_unit}]', fibers=fibers)
+    plt.axis('equal')
+    plt.savefig(path)
+    plt.close('all')
+
+
+# Function to process one file
+def process_section(path, output_dir, materials, graphic_unit, png=True, fibers=True):
+    """
+    Write the outputs of one section file.
+
+    Returns:
+        dict: 'file', 'status' ('ok' or 'error'), 'time' [s], 'outputs' (number of files written) and 'error'.
+    """
+    start = time.perf_counter()
+    name = os.path.splitext(os.path.basename(path))[0]
+    base = os.path.join(output_dir, name)
+    outputs = 0
+    try:
+        with open(path, 'r') as file:
+            section = core.parse_section(file.read())
+        section_values = core.convert_units(section, graphic_unit)
+
+        if png:
+            save_preview(section_values, base + '.png', graphic_unit, fibers)
+            outputs += 1
+
+        if materials is not None:
+            cp_section = core.section_in_cp(section, materials, graphic_unit)
+            with open(base + '_CP.txt', 'w') as file:
+                file.write(core.format_section(cp_section))
+            outputs += 1
+
+        with open(base + '_Center.txt', 'w') as file:
+            file.write(str(core.center_table(section_values)))
+        outputs += 1
+
+        with open(base + '_Code.py', 'w') as file:
+            file.write(core.section_code(section, graphic_unit))
+        outputs += 1
+
+    except Exception as e:
+        return {'file': os.path.basename(path), 'status': 'error', 'time': time.perf_counter() - start,
+                'outputs': outputs, 'error': f"{type(e).__name__}: {e}"}
+    return {'file': os.path.basename(path), 'status': 'ok', 'time': time.perf_counter() - start,
+            'outputs': outputs, 'error': ''}
+
+
+# Function to process all the files of a folder
+def process_directory(input_dir, output_dir, materials=None, graphic_unit='m', pattern='*.txt', n_workers=None,
+                      png=True, fibers=True):
+    """
+    Process the section files of a folder in a process pool.
+
+    Args:
+        n_workers (int): Number of processes. None uses os.cpu_count(); 1 processes in this process.
+
+    Returns:
+        list: Results of process_section, in the order of the files.
+    """
+    paths = sorted(glob.glob(os.path.join(input_dir, pattern)))
+    os.makedirs(output_dir, exist_ok=True)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(paths)))
+
+    if n_workers == 1:
+        return [process_section(path, output_dir, materials, graphic_unit, png, fibers) for path in paths]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = {pool.submit(process_section, path, output_dir, materials, graphic_unit, png, fibers): path
+                   for path in paths}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[path] for path in paths]
+
+
+# Function to write the summary of the batch
+def write_summary(results, path):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=['file', 'status', 'time', 'outputs', 'error'])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+# Function to read the command line arguments and run the batch
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch processing of fiber sections (OPSVIS format).")
+    parser.add_argument('input_dir', help="Folder with the section files.")
+    parser.add_argument('-o', '--output', default=None, help="Output folder (default: input_dir/Batch).")
+    parser.add_argument('-m', '--materials',
+                        default=r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Material_Strength.txt',
+                        help="File with the material strength dictionary. The CP is omitted if it doesn't exist.")
+    parser.add_argument('-u', '--unit', default='m', choices=list(core.UNIT_FACTORS),
+                        help="Graphic unit of the calculations.")
+    parser.add_argument('-p', '--pattern', default='*.txt', help="Pattern of the section files.")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Number of processes.")
+    parser.add_argument('--no-png', action='store_true', help="Don't write the images.")
+    parser.add_argument('--no-fibers', action='store_true', help="Don't draw the fibers in the images.")
+    args = parser.parse_args(argv)
+
+    output_dir = args.output if args.output is not None else os.path.join(args.input_dir, 'Batch')
+    materials = None
+    if os.path.isfile(args.materials):
+        with open(args.materials, 'r') as file:
+            materials = eval(file.read())
+    else:
+        print(f"Material file not found ({args.materials}): the CP is omitted.")
+
+    start = time.perf_counter()
+    results = process_directory(args.input_dir, output_dir, materials, args.unit, args.pattern, args.workers,
+                                not args.no_png, not args.no_fibers)
+    total = time.perf_counter() - start
+    write_summary(results, os.path.join(output_dir, 'Batch_Summary.csv'))
+
+    # Summary report
+    failed = [result for result in results if result['status'] != 'ok']
+    for result in results:
+        print(f"{result['file']:<40} {result['status']:<6} {result['time']:8.3f} s  {result['error']}")
+    print(f"\nSections: {len(results)}, ok: {len(results) - len(failed)}, errors: {len(failed)}, "
+          f"total time: {total:.2f} s")
+    return 1 if failed else 0
+
+
+# %%  [03] MAIN
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A15_Startup.py
+COMENTARIOS:    Mide el tiempo de inicio en frio de la GUI (importaciones, widgets y display) en procesos nuevos,
+                y lo compara con un tiempo maximo.
+"""
+
+# %% [00] INTRODUCTION
+# Use (from the folder of S01_GUI01_A01_Fiber_Section.py):
+#
+#   python C_GUI01_Fiber_Section/S01_GUI01_A15_Startup.py --runs 5 --budget 3.0
+#
+# Each run executes the GUI in a new Python process (like '%run' in a new kernel), with the 'Agg' backend of
+# matplotlib and without printing the widgets. The report shows the time of each run, the median, and the
+# heavy modules that were imported during the start (they should be imported only when they are used).
+# The exit code is 1 if the median is larger than the budget.
+
+
+# %%  [01] LIBRERIAS
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# %%  [02] FUNCIONES
+# Modules that must not be imported during the start of the GUI
+LAZY_MODULES = ['imageio', 'S01_GUI01_A03_Video', 'S01_GUI01_A05_CenterFiber']
+
+# Code executed in the new process
+_CHILD_CODE = """
+import time
+start = time.perf_counter()
+import contextlib, io, json, runpy, sys
+import matplotlib
+matplotlib.use('Agg')
+with contextlib.redirect_stdout(io.StringIO()):
+    runpy.run_path({gui!r}, run_name='__main__')
+total = time.perf_counter() - start
+print(json.dumps({{'time': total, 'modules': [name for name in {lazy!r} if name in sys.modules]}}))
+"""
+
+
+# Function to measure one cold start of the GUI
+def startup_run(gui_path='S01_GUI01_A01_Fiber_Section.py', cwd='.'):
+    """
+    Returns:
+        dict: 'time' (seconds from the start of the process until the interface is displayed) and 'modules'
+            (modules of LAZY_MODULES imported during the start).
+    """
+    code = _CHILD_CODE.format(gui=gui_path, lazy=LAZY_MODULES)
+    result = subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"The GUI failed to start:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+# Function to measure several cold starts
+def startup_benchmark(gui_path='S01_GUI01_A01_Fiber_Section.py', cwd='.', n_runs=3):
+    runs = [startup_run(gui_path, cwd) for _ in range(n_runs)]
+    times = [run['time'] for run in runs]
+    modules = sorted({name for run in runs for name in run['modules']})
+    return {'times': times, 'median': statistics.median(times), 'modules': modules}
+
+
+# Function to read the command line arguments and run the benchmark
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start benchmark of the Fiber Section GUI.")
+    parser.add_argument('--gui', default='S01_GUI01_A01_Fiber_Section.py', help="Script of the GUI.")
+    parser.add_argument('--runs', type=int, default=3, help="Number of runs.")
+    parser.add_argument('--budget', type=float, default=3.0, help="Maximum median start time [s].")
+    args = parser.parse_args(argv)
+
+    cwd = os.path.dirname(os.path.abspath(args.gui))
+    report = startup_benchmark(os.path.basename(args.gui), cwd, args.runs)
+    for k, time_k in enumerate(report['times']):
+        print(f"Run {k + 1}: {time_k:.3f} s")
+    print(f"Median: {report['median']:.3f} s (budget {args.budget:.3f} s)")
+    if report['modules']:
+        print(f"Modules imported during the start that should be lazy: {', '.join(report['modules'])}")
+    return 0 if report['median'] <= args.budget and not report['modules'] else 1
+
+
+# %%  [03] MAIN
+if __name__ == '__main__':
+    sys.exit(main())
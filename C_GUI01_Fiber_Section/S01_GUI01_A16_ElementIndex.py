@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A16_ElementIndex.py
+COMENTARIOS:    Indice de los elementos (patch y layer) de la seccion, para filtrar por tipo, matTag y zona
+                (rectangulo en y-z), y mostrar en la GUI solo una pagina de las opciones del selector.
+"""
+
+# %% [00] INTRODUCTION
+# The index is created once for each version of the section (the text of the textarea 'Fiber Section'):
+#
+#   index = build_element_index(section, graphic_unit)
+#   positions = filter_elements(index, kind='layer straight', mat_tag=3, bbox=(-30.0, -20.0, 0.0, 20.0))
+#   options, page, n_pages = page_options(index, positions, page=0)
+#
+# The positions are the positions of the elements in the section list. The bounding boxes are in the graphic
+# unit, and the filter 'bbox' (ymin, zmin, ymax, zmax) selects the elements that intersect the rectangle.
+# The labels of the options are created only for the elements of the page.
+# An instance has the type and matTag of its base element, and its bounding box contains all the copies.
+
+
+# %%  [01] LIBRERIAS
+import math
+
+import numpy as np
+
+import S01_GUI01_A06_FiberTable as FT
+import S01_GUI01_A13_Core as core
+
+
+# %%  [02] FUNCIONES
+# Types of elements that can be filtered
+ELEMENT_TYPES = ['patch rect', 'patch quad', 'patch circ', 'layer straight', 'layer circ']
+
+# Number of options of each page of the selector
+PAGE_SIZE = 50
+
+
+# Function to calculate the bounding box of an element (numeric values)
+def element_bbox(item):
+    """
+    Returns:
+        tuple: (ymin, zmin, ymax, zmax). The circular elements use the whole circle.
+    """
+    if item[0] == 'instance':
+        ymin, zmin, ymax, zmax = element_bbox(item[1])
+        ys, zs = FT.instance_points([ymin, ymin, ymax, ymax], [zmin, zmax, zmin, zmax], *item[2:5])
+        return ys.min(), zs.min(), ys.max(), zs.max()
+    kind = (item[0], item[1])
+    if kind in [('patch', 'rect'), ('layer', 'straight')]:
+        ys, zs = [item[5], item[7]], [item[6], item[8]]
+    elif kind == ('patch', 'quad'):
+        ys, zs = item[5:13:2], item[6:13:2]
+    elif kind == ('patch', 'circ'):
+        radius = max(abs(item[7]), abs(item[8]))
+        return item[5] - radius, item[6] - radius, item[5] + radius, item[6] + radius
+    elif kind == ('layer', 'circ'):
+        radius = abs(item[7])
+        return item[5] - radius, item[6] - radius, item[5] + radius, item[6] + radius
+    else:
+        raise ValueError(f"Unknown element: {item[0]} {item[1]}")
+    return min(ys), min(zs), max(ys), max(zs)
+
+
+# Function to create the index of the elements of the section
+def build_element_index(section, graphic_unit):
+    """
+    Args:
+        section (list): Section list (with units).
+        graphic_unit (str): Unit of the bounding boxes.
+
+    Returns:
+        dict: 'section', 'positions', 'kinds', 'mat_tags' and 'bbox' (n x 4, NaN if the element is not valid).
+    """
+    positions, kinds, mat_tags, bbox = [], [], [], []
+    for position, item in enumerate(section):
+        if item[0] not in ['patch', 'layer', 'instance']:
+            continue
+        positions.append(position)
+        try:
+            base = item[1] if item[0] == 'instance' else item
+            kinds.append(f"{base[0]} {base[1]}")
+            mat_tags.append(int(base[2]))
+        except (IndexError, ValueError, TypeError):
+            kinds.append(str(item[0]))
+            mat_tags.append(-1)
+        try:
+            bbox.append(element_bbox(core.convert_element(item, graphic_unit)))
+        except (IndexError, ValueError, TypeError, KeyError):
+            bbox.append((math.nan,) * 4)
+    return {'section': section, 'positions': np.array(positions, dtype=int), 'kinds': np.array(kinds, dtype=str),
+            'mat_tags': np.array(mat_tags, dtype=int), 'bbox': np.array(bbox, dtype=float).reshape(-1, 4)}
+
+
+# Function to filter the elements of the index
+def filter_elements(index, kind=None, mat_tag=None, bbox=None):
+    """
+    Args:
+        kind (str): Type of element (see ELEMENT_TYPES). None doesn't filter.
+        mat_tag (int): Material tag. None doesn't filter.
+        bbox (tuple): (ymin, zmin, ymax, zmax). None doesn't filter.
+
+    Returns:
+        np.ndarray: Positions of the elements that satisfy all the filters.
+    """
+    mask = np.ones(len(index['positions']), dtype=bool)
+    if kind is not None:
+        mask &= index['kinds'] == kind
+    if mat_tag is not None:
+        mask &= index['mat_tags'] == mat_tag
+    if bbox is not None:
+        ymin, zmin, ymax, zmax = bbox
+        boxes = index['bbox']
+        mask &= (boxes[:, 0] <= ymax) & (boxes[:, 2] >= ymin) & (boxes[:, 1] <= zmax) & (boxes[:, 3] >= zmin)
+    return index['positions'][mask]
+
+
+# Function to create the options of one page of the selector
+def page_options(index, positions, page=0, page_size=PAGE_SIZE):
+    """
+    Returns:
+        tuple: (options, page, n_pages). options are the (label, position) of the elements of the page, and page
+            is limited to the pages available.
+    """
+    n_pages = max(1, math.ceil(len(positions) / page_size))
+    page = min(max(page, 0), n_pages - 1)
+    options = []
+    for position in positions[page * page_size:(page + 1) * page_size]:
+        position = int(position)
+        try:
+            label = core.element_label(position, index['section'][position])
+        except (IndexError, ValueError, TypeError):
+            label = f"{position}: {index['section'][position]}"
+        options.append((label, position))
+    return options, page, n_pages
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    # Rectangular section with a grid of 20 x 20 bars, units [cm]
+    section_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 10, 10, '-50.0*cm', '-50.0*cm', '50.0*cm', '50.0*cm']]
+    for i in range(20):
+        for j in range(20):
+            y, z = -45.0 + 90.0 * i / 19, -45.0 + 90.0 * j / 19
+            section_1.append(['layer', 'straight', 3, 1, '2.0*cm**2', f'{y:.2f}*cm', f'{z:.2f}*cm', f'{y:.2f}*cm',
+                              f'{z:.2f}*cm'])
+    index_1 = build_element_index(section_1, 'cm')
+    positions_1 = filter_elements(index_1, kind='layer straight', bbox=(-50.0, -50.0, 0.0, 0.0))
+    options_1, page_1, n_pages_1 = page_options(index_1, positions_1, page=1)
+    print(f"Elements: {len(index_1['positions'])}, filtered: {len(positions_1)}, pages: {n_pages_1}")
+    print(options_1[:3])
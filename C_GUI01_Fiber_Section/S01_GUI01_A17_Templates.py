@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A17_Templates.py
+COMENTARIOS:    Plantillas de secciones de hormigon armado (rectangular, circular, T, cajon y muro con elementos
+                de borde): crean la lista completa de la seccion (nucleo, recubrimiento y barras) con pocos
+                parametros, desde la GUI o sin ella para generar muchas secciones.
+"""
+
+# %% [00] INTRODUCTION
+# Each template is a function of the dimensions, the cover, the bars and the fiber size (mesh density). The
+# template 'steel' is a shape of the table of S01_GUI01_A18_SteelShapes (designation and fiber size):
+#
+#   section = template_section('rectangular', unit='cm', b=40.0, h=60.0, cover=4.0, n_bars_y=4, n_bars_z=3,
+#                              bar_area=5.07, fiber_size=4.0)
+#   sections = template_sections('rectangular', unit='cm', b=[40.0, 50.0, 60.0], h=60.0, cover=4.0, n_bars_y=4,
+#                                n_bars_z=3, bar_area=5.07, fiber_size=4.0)
+#
+# The sections are centered in (y, z) = (0, 0), with y vertical (height h) and z horizontal (width b), and use
+# the material tags of the GUI: core mat_core (1), cover and unconfined concrete mat_core + 1 (2), bars
+# mat_steel (3). The bars are in the limit between the cover and the core.
+# The concrete is a grid of rectangular cells; the cover is added only in the sides of the cells that are in
+# the border of the section (see grid_patches). The lengths are in 'unit' and the areas in 'unit'**2.
+
+
+# %%  [01] LIBRERIAS
+import math
+
+import numpy as np
+
+import S01_GUI01_A13_Core as core
+import S01_GUI01_A18_SteelShapes as SH
+
+
+# %%  [02] FUNCIONES
+# Function to create a rect patch
+def _rect(mat_tag, n_y, n_z, y0, z0, y1, z1, unit):
+    return ['patch', 'rect', int(mat_tag), int(n_y), int(n_z)] + \
+        [core.rounded_unit_value(v, unit) for v in (y0, z0, y1, z1)]
+
+
+# Function to create a straight layer
+def _layer(mat_tag, n_bars, bar_area, y0, z0, y1, z1, unit):
+    return ['layer', 'straight', int(mat_tag), int(n_bars), core.rounded_unit_value(bar_area, unit, 2)] + \
+        [core.rounded_unit_value(v, unit) for v in (y0, z0, y1, z1)]
+
+
+# Function to calculate the number of fibers along a length
+def _num_fibers(length, fiber_size):
+    return np.maximum(1, np.ceil(np.asarray(length, dtype=float) / fiber_size - 1e-9)).astype(int)
+
+
+# Function to create the patches of a section made of rectangular cells
+def grid_patches(y_breaks, z_breaks, mat_tags, cover, fiber_size, mat_core=1, unit='-'):
+    """
+    Args:
+        y_breaks, z_breaks (array): Coordinates of the lines of the grid (increasing).
+        mat_tags (array): (len(y_breaks) - 1) x (len(z_breaks) - 1) matTag of each cell, 0 without concrete. The
+            first row is the lowest.
+        cover (float): Cover of the sides of the cells with mat_core that are in the border of the section.
+
+    Returns:
+        list: Rect patches of the cells. The cells with mat_core are divided in core and cover (mat_core + 1).
+    """
+    mat_tags = np.asarray(mat_tags, dtype=int)
+    solid = np.pad(mat_tags > 0, 1)
+    # Sides of all the cells in the border of the section
+    border = {'below': ~solid[:-2, 1:-1], 'up': ~solid[2:, 1:-1], 'left': ~solid[1:-1, :-2],
+              'right': ~solid[1:-1, 2:]}
+    n_y, n_z = _num_fibers(np.diff(y_breaks), fiber_size), _num_fibers(np.diff(z_breaks), fiber_size)
+
+    patches = []
+    for i, j in zip(*np.nonzero(mat_tags)):
+        rect = _rect(mat_tags[i, j], n_y[i], n_z[j], y_breaks[i], z_breaks[j], y_breaks[i + 1], z_breaks[j + 1],
+                     unit)
+        if mat_tags[i, j] == mat_core and cover > 0:
+            patches += core.cover_element(rect, **{side: cover * float(mask[i, j]) for side, mask in border.items()})
+        else:
+            patches.append(rect)
+    return patches
+
+
+# Function to create the layers of bars in the sides of a rectangle
+def ring_layers(y_c, z_c, n_bars_y, n_bars_z, bar_area, mat_steel=3, unit='-'):
+    """
+    Bars in the rectangle (-y_c, -z_c) - (y_c, z_c): n_bars_z in the lower and upper sides (with the corners) and
+    n_bars_y in the left and right sides (with the corners, which are written only once).
+    """
+    layers = [_layer(mat_steel, n_bars_z, bar_area, y, -z_c, y, z_c, unit) for y in (-y_c, y_c)]
+    if n_bars_y > 2:
+        spacing = 2.0 * y_c / (n_bars_y - 1)
+        layers += [_layer(mat_steel, n_bars_y - 2, bar_area, -y_c + spacing, z, y_c - spacing, z, unit)
+                   for z in (-z_c, z_c)]
+    return layers
+
+
+# Function to obtain the number of bars in a length with a maximum spacing (with the bars of the ends)
+def _bars_spacing(length, spacing):
+    return max(2, math.ceil(length / spacing - 1e-9) + 1)
+
+
+# Function to create a rectangular section
+def rectangular_section(b, h, cover, n_bars_y, n_bars_z, bar_area, fiber_size, mat_core=1, mat_steel=3, unit='-'):
+    """
+    Args:
+        b, h (float): Width (z) and height (y).
+        n_bars_y, n_bars_z (int): Bars in the sides parallel to y and to z (with the corners).
+    """
+    patches = grid_patches([-h / 2.0, h / 2.0], [-b / 2.0, b / 2.0], [[mat_core]], cover, fiber_size, mat_core, unit)
+    return patches + ring_layers(h / 2.0 - cover, b / 2.0 - cover, n_bars_y, n_bars_z, bar_area, mat_steel, unit)
+
+
+# Function to create a circular section
+def circular_section(diameter, cover, n_bars, bar_area, fiber_size, mat_core=1, mat_steel=3, unit='-'):
+    radius = diameter / 2.0
+    n_circ = int(_num_fibers(2.0 * math.pi * radius, fiber_size))
+    n_rad = int(_num_fibers(radius - cover, fiber_size))
+    patch = ['patch', 'circ', int(mat_core), n_circ, n_rad] + \
+        [core.rounded_unit_value(v, unit) for v in (0.0, 0.0, 0.0, radius)] + [0.0, 360.0]
+    patches = core.cover_element(patch, outer=cover) if cover > 0 else [patch]
+    bars = ['layer', 'circ', int(mat_steel), int(n_bars), core.rounded_unit_value(bar_area, unit, 2)] + \
+        [core.rounded_unit_value(v, unit) for v in (0.0, 0.0, radius - cover)] + [0.0, 360.0]
+    return patches + [bars]
+
+
+# Function to create a T section
+def t_section(b_flange, t_flange, b_web, h, cover, n_bars_flange, n_bars_web, bar_area, fiber_size, mat_core=1,
+              mat_steel=3, unit='-'):
+    """
+    Args:
+        b_flange, t_flange (float): Width and thickness of the flange (upper side).
+        b_web, h (float): Width of the web and total height.
+        n_bars_flange, n_bars_web (int): Bars in the upper side of the flange and in the lower side of the web.
+    """
+    y_breaks = [-h / 2.0, h / 2.0 - t_flange, h / 2.0]
+    z_breaks = [-b_flange / 2.0, -b_web / 2.0, b_web / 2.0, b_flange / 2.0]
+    mat_tags = [[0, mat_core, 0], [mat_core, mat_core, mat_core]]
+    patches = grid_patches(y_breaks, z_breaks, mat_tags, cover, fiber_size, mat_core, unit)
+    y_top, z_top, y_bottom, z_bottom = h / 2.0 - cover, b_flange / 2.0 - cover, -h / 2.0 + cover, b_web / 2.0 - cover
+    return patches + [_layer(mat_steel, n_bars_flange, bar_area, y_top, -z_top, y_top, z_top, unit),
+                      _layer(mat_steel, n_bars_web, bar_area, y_bottom, -z_bottom, y_bottom, z_bottom, unit)]
+
+
+# Function to create a box section (one cell)
+def box_section(b, h, t_flange, t_web, cover, bar_spacing, bar_area, fiber_size, mat_core=1, mat_steel=3,
+                unit='-'):
+    """
+    Args:
+        b, h (float): Outer width and height.
+        t_flange, t_web (float): Thickness of the upper and lower slabs, and of the webs.
+        bar_spacing (float): Maximum spacing of the bars in the outer and inner faces.
+    """
+    y_breaks = [-h / 2.0, -h / 2.0 + t_flange, h / 2.0 - t_flange, h / 2.0]
+    z_breaks = [-b / 2.0, -b / 2.0 + t_web, b / 2.0 - t_web, b / 2.0]
+    mat_tags = [[mat_core] * 3, [mat_core, 0, mat_core], [mat_core] * 3]
+    patches = grid_patches(y_breaks, z_breaks, mat_tags, cover, fiber_size, mat_core, unit)
+    layers = []
+    for y_c, z_c in [(h / 2.0 - cover, b / 2.0 - cover), (h / 2.0 - t_flange + cover, b / 2.0 - t_web + cover)]:
+        layers += ring_layers(y_c, z_c, _bars_spacing(2.0 * y_c, bar_spacing), _bars_spacing(2.0 * z_c, bar_spacing),
+                              bar_area, mat_steel, unit)
+    return patches + layers
+
+
+# Function to create a wall with boundary elements
+def wall_section(length, thickness, boundary_length, cover, n_bars_boundary, bar_area, web_bar_spacing,
+                 web_bar_area, fiber_size, mat_core=1, mat_steel=3, unit='-'):
+    """
+    Args:
+        length, thickness (float): Length (z) and thickness (y) of the wall.
+        boundary_length (float): Length of each boundary element (confined concrete, mat_core). The web is
+            unconfined concrete (mat_core + 1) without cover.
+        n_bars_boundary (int): Bars in each face of each boundary element.
+        web_bar_spacing, web_bar_area (float): Maximum spacing and area of the bars of the web (in each face).
+    """
+    z_breaks = [-length / 2.0, -length / 2.0 + boundary_length, length / 2.0 - boundary_length, length / 2.0]
+    mat_tags = [[mat_core, mat_core + 1, mat_core]]
+    patches = grid_patches([-thickness / 2.0, thickness / 2.0], z_breaks, mat_tags, cover, fiber_size, mat_core,
+                           unit)
+    y_c = thickness / 2.0 - cover
+    layers = []
+    for y in (-y_c, y_c):
+        for sign in (-1.0, 1.0):
+            z_end, z_web = sign * (length / 2.0 - cover), sign * (length / 2.0 - boundary_length + cover)
+            layers.append(_layer(mat_steel, n_bars_boundary, bar_area, y, min(z_end, z_web), y, max(z_end, z_web),
+                                 unit))
+        # Bars of the web, between the bars of the boundary elements
+        web_length = length - 2.0 * boundary_length + 2.0 * cover
+        n_web = _bars_spacing(web_length, web_bar_spacing) - 2
+        if n_web > 0:
+            spacing = web_length / (n_web + 1)
+            z_web = length / 2.0 - boundary_length + cover - spacing
+            layers.append(_layer(mat_steel, n_web, web_bar_area, y, -z_web, y, z_web, unit))
+    return patches + layers
+
+
+# Function to create a steel shape (see S01_GUI01_A18_SteelShapes)
+def steel_section(designation, fiber_size, mat_steel=4, unit='-'):
+    if unit != '-':
+        return SH.steel_shape(designation, mat_steel, fiber_size, unit)
+    # Values in cm without unit, like the other templates
+    return [core.strip_units(patch)[0] for patch in SH.steel_shape(designation, mat_steel, fiber_size, 'cm')]
+
+
+# Templates and their parameters (values in cm and cm**2)
+TEMPLATES = {'rectangular': rectangular_section, 'circular': circular_section, 'T': t_section, 'box': box_section,
+             'wall': wall_section, 'steel': steel_section}
+
+DEFAULTS = {
+    'rectangular': {'b': 40.0, 'h': 60.0, 'cover': 4.0, 'n_bars_y': 4, 'n_bars_z': 3, 'bar_area': 5.07,
+                    'fiber_size': 4.0},
+    'circular': {'diameter': 60.0, 'cover': 4.0, 'n_bars': 8, 'bar_area': 5.07, 'fiber_size': 4.0},
+    'T': {'b_flange': 120.0, 't_flange': 15.0, 'b_web': 30.0, 'h': 70.0, 'cover': 4.0, 'n_bars_flange': 8,
+          'n_bars_web': 3, 'bar_area': 2.84, 'fiber_size': 4.0},
+    'box': {'b': 200.0, 'h': 150.0, 't_flange': 20.0, 't_web': 25.0, 'cover': 4.0, 'bar_spacing': 20.0,
+            'bar_area': 2.0, 'fiber_size': 5.0},
+    'wall': {'length': 300.0, 'thickness': 25.0, 'boundary_length': 50.0, 'cover': 3.0, 'n_bars_boundary': 4,
+             'bar_area': 2.84, 'web_bar_spacing': 20.0, 'web_bar_area': 1.29, 'fiber_size': 5.0},
+    'steel': {'designation': 'W14X90', 'fiber_size': 1.0}
+}
+
+
+# Function to obtain the default parameters of a template in a unit
+def default_parameters(kind, unit='-'):
+    """
+    Returns:
+        dict: DEFAULTS[kind] with the lengths and areas in the unit ('-' uses the values in cm).
+    """
+    factor = 1.0 if unit == '-' else core.UNIT_FACTORS[unit]['cm']
+    parameters = {}
+    for name, value in DEFAULTS[kind].items():
+        if isinstance(value, (int, str)):
+            parameters[name] = value
+        else:
+            parameters[name] = core.rounded_unit_value(value * factor ** (2 if 'area' in name else 1), '-')
+    return parameters
+
+
+# Function to create a section with a template
+def template_section(kind, sec_tag=1, GJ=1.0e6, unit='-', **parameters):
+    """
+    Args:
+        kind (str): Template (see TEMPLATES).
+        parameters: Parameters of the template function (see DEFAULTS).
+
+    Returns:
+        list: Section list with the 'section' definition. A ValueError is raised if the template or the
+            parameters are not valid.
+    """
+    if kind not in TEMPLATES:
+        raise ValueError(f"Unknown template: {kind}")
+    if any(not isinstance(value, str) and value < 0 for value in parameters.values()) or parameters.get('fiber_size', 1.0) <= 0:
+        raise ValueError(f"The parameters of the template '{kind}' must be positive.")
+    try:
+        elements = TEMPLATES[kind](unit=unit, **parameters)
+    except TypeError as e:
+        raise ValueError(f"Invalid parameters of the template '{kind}': {e}")
+    return [['section', 'Fiber', sec_tag, '-GJ', GJ]] + elements
+
+
+# Function to create many sections with a template
+def template_sections(kind, sec_tag=1, GJ=1.0e6, unit='-', **parameters):
+    """
+    The parameters can be arrays, which are broadcast (as in NumPy), e.g. b=[40, 50, 60] and h=[[60], [80]]
+    create 6 sections.
+
+    Returns:
+        list: Sections (flattened in the order of the broadcast), with the parameters of each one.
+    """
+    names = list(parameters)
+    arrays = np.broadcast_arrays(*[np.asarray(parameters[name]) for name in names])
+    sections = []
+    for values in zip(*[array.ravel() for array in arrays]):
+        variant = {name: value.item() for name, value in zip(names, values)}
+        sections.append({'parameters': variant, 'section': template_section(kind, sec_tag, GJ, unit, **variant)})
+    return sections
+
+
+# Function to write the parameters of a template (one 'name = value' per line)
+def format_parameters(parameters):
+    return "\n".join(f"{name} = {value}" for name, value in parameters.items())
+
+
+# Function to read the parameters of a template written with format_parameters
+def parse_parameters(text):
+    """
+    Returns:
+        dict: Parameters; the names that begin with 'n_' are integers and 'designation' is a text. A ValueError
+            is raised if a line is not valid.
+    """
+    parameters = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        name, sep, value = line.partition('=')
+        name = name.strip()
+        try:
+            if not sep or not name.isidentifier():
+                raise ValueError
+            if name == 'designation':
+                parameters[name] = value.strip()
+            else:
+                parameters[name] = int(value) if name.startswith('n_') else float(value)
+        except ValueError:
+            raise ValueError(f"Invalid parameter: '{line.strip()}'")
+    return parameters
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import S01_GUI01_A06_FiberTable as FT
+
+    for kind_1 in TEMPLATES:
+        section_1 = template_section(kind_1, unit='cm', **default_parameters(kind_1, 'cm'))
+        fibers_1 = FT.fiber_table(core.convert_units(section_1, 'cm'))
+        areas_1 = {int(tag): round(float(fibers_1['area'][fibers_1['matTag'] == tag].sum()), 2)
+                   for tag in np.unique(fibers_1['matTag'])}
+        print(f"{kind_1:<12} elements: {len(section_1) - 1:3d}  fibers: {len(fibers_1['y']):5d}  area: {areas_1}")
+
+    # Columns with 3 widths and 2 heights
+    sections_1 = template_sections('rectangular', unit='cm', b=[40.0, 50.0, 60.0], h=[[60.0], [80.0]], cover=4.0,
+                                   n_bars_y=4, n_bars_z=3, bar_area=5.07, fiber_size=4.0)
+    print([(variant['parameters']['b'], variant['parameters']['h']) for variant in sections_1])
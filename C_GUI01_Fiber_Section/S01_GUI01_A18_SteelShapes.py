@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A18_SteelShapes.py
+COMENTARIOS:    Perfiles de acero (W, HSS rectangular, Pipe y canal C) desde una tabla local de dimensiones
+                (Steel_Shapes.csv, en pulgadas): crea los patch quad y circ del perfil con la densidad de malla
+                elegida.
+"""
+
+# %% [00] INTRODUCTION
+# The table C_GUI01_Fiber_Section/Steel_Shapes.csv has one row per shape: designation, type (W, HSS, PIPE or C)
+# and the dimensions in inches (d, bf, tw, tf for W and C; d, bf and the design wall thickness t for HSS; the
+# outer diameter d and t for PIPE). The table is read the first time that a shape is used, and the shapes are
+# indexed by their designation ('W14X90', 'HSS8X8X1/2', 'PIPE6STD', 'C10X15.3'; spaces and case are ignored).
+#
+#   section = [['section', 'Fiber', 1, '-GJ', 1.0e6]] + steel_shape('W14X90', mat_tag=4, fiber_size=0.5,
+#                                                                  unit='cm')
+#
+# The shapes are centered in their bounding box (y vertical along d, z horizontal along bf), and the web of the
+# channel is in the left side. The corner radii of the HSS and the slope of the flanges of the channels are not
+# modeled. The plates are quad patches (they can be rotated) and the pipes are circ patches.
+
+
+# %%  [01] LIBRERIAS
+import csv
+import math
+import os
+
+import S01_GUI01_A13_Core as core
+
+
+# %%  [02] FUNCIONES
+# Table of dimensions and its unit
+SHAPES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'C_GUI01_Fiber_Section', 'Steel_Shapes.csv')
+SHAPES_UNIT = 'IN'
+
+# Shapes of the table, indexed by designation (read by load_shapes)
+_shapes = {}
+
+
+# Function to normalize a designation
+def shape_key(designation):
+    return str(designation).replace(' ', '').upper()
+
+
+# Function to read the table of shapes (only the first time)
+def load_shapes(path=SHAPES_PATH):
+    """
+    Returns:
+        dict: Shapes indexed by designation (see shape_key), with 'designation', 'type' and the dimensions
+            (float, None if they are empty).
+    """
+    if path not in _shapes:
+        shapes = {}
+        with open(path, 'r', newline='') as file:
+            for row in csv.DictReader(file):
+                shape = {'designation': row['designation'].strip(), 'type': row['type'].strip().upper()}
+                for name in ['d', 'bf', 'tw', 'tf', 't']:
+                    shape[name] = float(row[name]) if row[name].strip() else None
+                shapes[shape_key(shape['designation'])] = shape
+        _shapes[path] = shapes
+    return _shapes[path]
+
+
+# Function to obtain the designations of the table
+def shape_designations(shape_type=None):
+    """
+    Args:
+        shape_type (str): 'W', 'HSS', 'PIPE' or 'C'. None returns all the shapes.
+    """
+    return [shape['designation'] for shape in load_shapes().values()
+            if shape_type is None or shape['type'] == shape_type.upper()]
+
+
+# Function to obtain the dimensions of a shape
+def shape_dimensions(designation):
+    try:
+        return load_shapes()[shape_key(designation)]
+    except KeyError:
+        raise ValueError(f"Unknown steel shape: {designation}")
+
+
+# Function to create the quad patch of a rectangular plate (I, J, K, L counterclockwise from (y0, z0))
+def plate_patch(mat_tag, y0, z0, y1, z1, fiber_size, unit='-'):
+    n_ij = max(1, math.ceil((y1 - y0) / fiber_size - 1e-9))
+    n_jk = max(1, math.ceil((z1 - z0) / fiber_size - 1e-9))
+    points = [(y0, z0), (y1, z0), (y1, z1), (y0, z1)]
+    return ['patch', 'quad', int(mat_tag), n_ij, n_jk] + \
+        [core.rounded_unit_value(value, unit) for point in points for value in point]
+
+
+# Function to create the patches of a steel shape
+def steel_shape(designation, mat_tag=4, fiber_size=None, unit='IN', y0=0.0, z0=0.0):
+    """
+    Args:
+        designation (str): Designation of the shape in the table.
+        mat_tag (int): Material tag of the steel.
+        fiber_size (float): Maximum size of the fibers, in 'unit'. None uses the thickness of the thinnest plate.
+        unit (str): Unit of the patches ('-' writes the values in inches without unit).
+        y0, z0 (float): Center of the bounding box of the shape, in 'unit'.
+
+    Returns:
+        list: Quad patches of the plates (W, HSS and C) or a circ patch (PIPE).
+    """
+    shape = shape_dimensions(designation)
+    factor = 1.0 if unit in ['-', SHAPES_UNIT] else core.UNIT_FACTORS[unit][SHAPES_UNIT]
+    dims = {name: value * factor for name, value in shape.items() if isinstance(value, float)}
+    d = dims['d']
+    if fiber_size is None:
+        fiber_size = min(value for name, value in dims.items() if name in ['tw', 'tf', 't'])
+    if fiber_size <= 0:
+        raise ValueError("The fiber size must be positive.")
+
+    plates = []
+    if shape['type'] == 'W':
+        bf, tw, tf = dims['bf'], dims['tw'], dims['tf']
+        plates = [(d / 2 - tf, -bf / 2, d / 2, bf / 2), (-d / 2 + tf, -tw / 2, d / 2 - tf, tw / 2),
+                  (-d / 2, -bf / 2, -d / 2 + tf, bf / 2)]
+    elif shape['type'] == 'HSS':
+        bf, t = dims['bf'], dims['t']
+        plates = [(d / 2 - t, -bf / 2, d / 2, bf / 2), (-d / 2 + t, -bf / 2, d / 2 - t, -bf / 2 + t),
+                  (-d / 2 + t, bf / 2 - t, d / 2 - t, bf / 2), (-d / 2, -bf / 2, -d / 2 + t, bf / 2)]
+    elif shape['type'] == 'C':
+        bf, tw, tf = dims['bf'], dims['tw'], dims['tf']
+        plates = [(d / 2 - tf, -bf / 2 + tw, d / 2, bf / 2), (-d / 2, -bf / 2, d / 2, -bf / 2 + tw),
+                  (-d / 2, -bf / 2 + tw, -d / 2 + tf, bf / 2)]
+    elif shape['type'] == 'PIPE':
+        r_end, t = d / 2, dims['t']
+        n_circ = max(1, math.ceil(2 * math.pi * r_end / fiber_size - 1e-9))
+        n_rad = max(1, math.ceil(t / fiber_size - 1e-9))
+        return [['patch', 'circ', int(mat_tag), n_circ, n_rad] +
+                [core.rounded_unit_value(v, unit) for v in (y0, z0, r_end - t, r_end)] + [0.0, 360.0]]
+    else:
+        raise ValueError(f"Unknown type of steel shape: {shape['type']}")
+    return [plate_patch(mat_tag, ya + y0, za + z0, yb + y0, zb + z0, fiber_size, unit) for ya, za, yb, zb in plates]
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import numpy as np
+
+    import S01_GUI01_A06_FiberTable as FT
+
+    # Area of the fibers of one shape of each type [in**2]
+    for designation_1 in ['W14X90', 'HSS8X8X1/2', 'Pipe 6 STD', 'C10X15.3']:
+        patches_1 = steel_shape(designation_1, fiber_size=0.25)
+        fibers_1 = FT.fiber_table(core.convert_units([['section', 'Fiber', 1, '-GJ', 1.0e6]] + patches_1, 'IN'))
+        print(f"{designation_1:<12} patches: {len(patches_1)}  fibers: {len(fibers_1['y']):4d}  "
+              f"area: {float(np.sum(fibers_1['area'])):.2f} in**2")
+    print(steel_shape('W14X90', fiber_size=2.0, unit='cm')[1])
+    print(len(shape_designations()), shape_designations('PIPE'))
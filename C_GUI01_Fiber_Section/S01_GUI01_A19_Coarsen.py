@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A19_Coarsen.py
+COMENTARIOS:    Reduccion del numero de fibras de la seccion: une las fibras de cada material en celdas, con un
+                error acotado en los momentos de inercia, y escribe las fibras como comandos 'fiber' de OpenSeesPy.
+"""
+
+# %% [00] INTRODUCTION
+# The fibers of each matTag (see S01_GUI01_A06_FiberTable.fiber_table) are grouped in the cells of a square grid,
+# and each group is replaced by one fiber with the sum of the areas in the centroid of the group:
+#
+#   coarse = coarsen_fibers(fibers, tolerance=0.01)
+#   code = fiber_commands(coarse, sec_tag=1, GJ=1.0e6)
+#
+# The area and the first moments of each material don't change. The second moments decrease by the inertia of
+# each group about its centroid; the size of the cells of each material is the largest one (bisection) with
+# errors of Iz = sum(A y^2), Iy = sum(A z^2) and Iyz = sum(A y z) smaller than the tolerance. The moments are
+# calculated about the centroid of the section, and the error of Iyz is relative to sqrt(Iy Iz).
+
+
+# %%  [01] LIBRERIAS
+import numpy as np
+
+
+# %%  [02] FUNCIONES
+# Function to calculate the area, first and second moments of each material
+def section_properties(fibers, center=None):
+    """
+    Args:
+        fibers (dict): Fiber table ('y', 'z', 'area' and 'matTag').
+        center (tuple): Point (y, z) of the second moments. None uses the centroid of the fibers.
+
+    Returns:
+        dict: {matTag: {'A', 'Qz', 'Qy', 'Iz', 'Iy', 'Iyz'}}, with Qz = sum(A y), Qy = sum(A z), Iz = sum(A y^2),
+            Iy = sum(A z^2) and Iyz = sum(A y z) (y and z measured from the center).
+    """
+    y, z, area = fibers['y'], fibers['z'], fibers['area']
+    if center is None:
+        center = (np.sum(area * y) / np.sum(area), np.sum(area * z) / np.sum(area))
+    dy, dz = y - center[0], z - center[1]
+    properties = {}
+    for mat_tag in np.unique(fibers['matTag']):
+        mask = fibers['matTag'] == mat_tag
+        a, v, w = area[mask], dy[mask], dz[mask]
+        properties[int(mat_tag)] = {'A': a.sum(), 'Qz': np.sum(a * v), 'Qy': np.sum(a * w),
+                                    'Iz': np.sum(a * v * v), 'Iy': np.sum(a * w * w), 'Iyz': np.sum(a * v * w)}
+    return properties
+
+
+# Function to group the fibers in the cells of a grid
+def _group_fibers(y, z, area, cell_size):
+    """
+    Returns:
+        tuple: (y, z, area) of the groups and the group of each fiber.
+    """
+    cell_y = np.floor((y - y.min()) / cell_size).astype(np.int64)
+    cell_z = np.floor((z - z.min()) / cell_size).astype(np.int64)
+    _, groups = np.unique(cell_y * (cell_z.max() + 1) + cell_z, return_inverse=True)
+    groups = groups.ravel()
+    group_area = np.bincount(groups, area)
+    return (np.bincount(groups, area * y) / group_area, np.bincount(groups, area * z) / group_area, group_area,
+            groups)
+
+
+# Function to calculate the errors of the second moments of a grouping
+def _group_errors(y, z, area, group_y, group_z, groups, inertia):
+    """
+    Args:
+        inertia (tuple): (Iz, Iy) of the material, about the centroid of the section.
+
+    Returns:
+        np.ndarray: Relative errors of Iz, Iy and Iyz.
+    """
+    dy, dz = y - group_y[groups], z - group_z[groups]
+    lost = np.array([np.sum(area * dy * dy), np.sum(area * dz * dz), np.sum(area * dy * dz)])
+    scale = np.array([inertia[0], inertia[1], np.sqrt(inertia[0] * inertia[1])])
+    return np.abs(lost) / np.where(scale > 0.0, scale, np.inf)
+
+
+# Function to reduce the number of fibers with a bounded error in the moments of each material
+def coarsen_fibers(fibers, tolerance=0.01, n_iterations=40):
+    """
+    Args:
+        fibers (dict): Fiber table ('y', 'z', 'area' and 'matTag').
+        tolerance (float): Maximum relative error of Iz, Iy and Iyz of each material.
+
+    Returns:
+        dict: Fiber table with 'y', 'z', 'area' and 'matTag' of the new fibers, 'cell_size' (size of the cells of
+            each matTag) and 'errors' (relative errors of Iz, Iy and Iyz of each matTag).
+    """
+    if tolerance < 0:
+        raise ValueError("The tolerance must be positive.")
+    y_all, z_all, area_all = (np.asarray(fibers[name], dtype=float) for name in ['y', 'z', 'area'])
+    properties = section_properties(fibers)
+    y_list, z_list, area_list, mat_list, cell_sizes, errors = [], [], [], [], {}, {}
+    for mat_tag, props in properties.items():
+        mask = fibers['matTag'] == mat_tag
+        y, z, area = y_all[mask], z_all[mask], area_all[mask]
+        inertia = (props['Iz'], props['Iy'])
+        extent = max(np.ptp(y), np.ptp(z))
+
+        # Largest cell size with errors within the tolerance (bisection)
+        best = None
+        if extent == 0.0:
+            # All the fibers in the same point
+            best = (0.0, _group_fibers(y, z, area, 1.0), np.zeros(3))
+        else:
+            low, high = np.log(extent * 1e-9), np.log(extent * 2.0)
+            for _ in range(n_iterations):
+                middle = (low + high) / 2.0
+                grouped = _group_fibers(y, z, area, np.exp(middle))
+                group_errors = _group_errors(y, z, area, *grouped[:2], grouped[3], inertia)
+                if np.all(group_errors <= tolerance):
+                    low, best = middle, (np.exp(middle), grouped, group_errors)
+                else:
+                    high = middle
+        if best is None:
+            # The original fibers
+            best = (0.0, (y, z, area, None), np.zeros(3))
+        cell_size, (group_y, group_z, group_area, _), group_errors = best
+        y_list.append(group_y)
+        z_list.append(group_z)
+        area_list.append(group_area)
+        mat_list.append(np.full(len(group_y), mat_tag))
+        cell_sizes[mat_tag] = float(cell_size)
+        errors[mat_tag] = {'Iz': float(group_errors[0]), 'Iy': float(group_errors[1]), 'Iyz': float(group_errors[2])}
+
+    if not y_list:
+        empty = np.zeros(0)
+        return {'y': empty, 'z': empty, 'area': empty, 'matTag': empty.astype(int), 'cell_size': {}, 'errors': {}}
+    return {'y': np.concatenate(y_list), 'z': np.concatenate(z_list), 'area': np.concatenate(area_list),
+            'matTag': np.concatenate(mat_list), 'cell_size': cell_sizes, 'errors': errors}
+
+
+# Function to write the fibers as commands of OpenSeesPy
+def fiber_commands(fibers, sec_tag=1, GJ=1.0e6, unit='-', n_original=None):
+    """
+    Args:
+        fibers (dict): Fiber table (e.g. the result of coarsen_fibers).
+        unit (str): Unit of the coordinates (written in a comment).
+        n_original (int): Number of fibers before the coarsening (written in a comment).
+
+    Returns:
+        str: Code with ops.section('Fiber', ...) and one ops.fiber(y, z, A, matTag) per fiber.
+    """
+    lines = ["import openseespy.opensees as ops", ""]
+    description = f"{len(fibers['y'])} fibers"
+    if n_original is not None:
+        description += f" (coarsened from {n_original})"
+    lines.append(f"# Fiber section: {description}. Coordinates [{unit}], areas [{unit}**2].")
+    for mat_tag, error in fibers.get('errors', {}).items():
+        lines.append(f"# matTag {mat_tag}: errors Iz {error['Iz']:.2e}, Iy {error['Iy']:.2e}, "
+                     f"Iyz {error['Iyz']:.2e}")
+    lines.append("# Define the materials before the section.")
+    lines.append(f"ops.section('Fiber', {sec_tag}, '-GJ', {GJ})")
+    for y, z, area, mat_tag in zip(fibers['y'].tolist(), fibers['z'].tolist(), fibers['area'].tolist(),
+                                   fibers['matTag'].tolist()):
+        lines.append(f"ops.fiber({y:.6g}, {z:.6g}, {area:.6g}, {int(mat_tag)})")
+    return "\n".join(lines)
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import S01_GUI01_A06_FiberTable as FT
+
+    # Rectangular column 40x60 with a fine mesh and 3 + 3 bars [cm]
+    fib_sec_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 60, 40, -30.0, -20.0, 30.0, 20.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 15.0]]
+    fibers_1 = FT.fiber_table(fib_sec_1)
+    for tolerance_1 in [0.001, 0.01, 0.05]:
+        coarse_1 = coarsen_fibers(fibers_1, tolerance_1)
+        print(f"Tolerance {tolerance_1}: {len(fibers_1['y'])} -> {len(coarse_1['y'])} fibers, "
+              f"errors {coarse_1['errors']}")
+    print(fiber_commands(coarsen_fibers(fibers_1, 0.05), unit='cm', n_original=len(fibers_1['y']))[:600])
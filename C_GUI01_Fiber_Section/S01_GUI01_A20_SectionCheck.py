@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""
+ACTUALIZACION:  2026-10-19
+AUTOR:          Marcelo Ortiz Á.
+SCRIPT:         S01_GUI01_A20_SectionCheck.py
+COMENTARIOS:    Revision de la geometria de la seccion con un indice espacial (grilla de los bounding boxes):
+                patch superpuestos (area contada dos veces), separaciones pequeñas entre patch y barras fuera de
+                los patch.
+"""
+
+# %% [00] INTRODUCTION
+# The patches of the section (the copies of the instances are separate patches) are indexed in a uniform grid of
+# their bounding boxes, so each patch is compared only with the patches of the near cells, and each bar only with
+# the patches of its cell:
+#
+#   check = check_section(core.convert_units(section, 'cm'), gap_size=0.5)
+#   print(check_report(check, section, 'cm'))
+#
+# - Overlap: area of a patch inside another patch. It is exact for two rect or quad patches (clipping of the
+#   polygons), and it is estimated with a fine grid of points of the smaller patch (at least SAMPLE_DIVISIONS per
+#   side) for the circ patches.
+# - Gap: two patches that don't touch, with a distance between their boundaries smaller than gap_size (holes of
+#   the section that are larger than gap_size are not reported).
+# - Bar outside: bar of a layer that is not inside (or in the boundary of) any patch.
+# The positions of the results are the positions of the elements in the section list.
+
+
+# %%  [01] LIBRERIAS
+import math
+
+import numpy as np
+
+import S01_GUI01_A06_FiberTable as FT
+import S01_GUI01_A13_Core as core
+import S01_GUI01_A16_ElementIndex as EI
+
+
+# %%  [02] FUNCIONES
+# Minimum subdivisions of each side of a patch to estimate the overlaps
+SAMPLE_DIVISIONS = 20
+
+# Default gap size, relative to the size of the section
+GAP_SIZE = 0.01
+
+# Minimum overlap area reported, relative to the area of the smaller patch
+OVERLAP_TOLERANCE = 1e-3
+
+
+# Function to separate the patches and layers of the section (the copies of an instance are separate elements)
+def section_parts(section_values):
+    """
+    Args:
+        section_values (list): Section list with numeric values (see core.convert_units).
+
+    Returns:
+        tuple: (patches, layers), lists of (position, element) with the position of the element in the section.
+    """
+    patches, layers = [], []
+    for position, item in enumerate(section_values):
+        if item[0] not in ['patch', 'layer', 'instance']:
+            continue
+        elements = core.expand_instance(item) if item[0] == 'instance' else [item]
+        for element in elements:
+            values = core.strip_units(element)[0]
+            n_integers = 5 if values[0] == 'patch' else 4
+            element = values[:2] + [int(value) for value in values[2:n_integers]] + \
+                [float(value) for value in values[n_integers:]]
+            (patches if element[0] == 'patch' else layers).append((position, element))
+    return patches, layers
+
+
+# Function to create a uniform grid with the bounding boxes
+def build_grid(boxes, cell_size=None):
+    """
+    Args:
+        boxes (np.ndarray): n x 4 bounding boxes (ymin, zmin, ymax, zmax).
+        cell_size (float): Size of the cells. None uses the median size of the boxes.
+
+    Returns:
+        dict: 'boxes', 'cell_size', 'origin' and 'cells' ({(i, j): array of the boxes that intersect the cell}).
+    """
+    boxes = np.asarray(boxes, dtype=float).reshape(-1, 4)
+    origin = boxes[:, :2].min(axis=0) if len(boxes) else np.zeros(2)
+    if cell_size is None:
+        sizes = np.maximum(boxes[:, 2] - boxes[:, 0], boxes[:, 3] - boxes[:, 1]) if len(boxes) else np.ones(1)
+        cell_size = float(np.median(sizes)) if np.any(sizes > 0) else 1.0
+        cell_size = cell_size if cell_size > 0 else float(sizes.max())
+    low = np.floor((boxes[:, :2] - origin) / cell_size).astype(np.int64)
+    high = np.floor((boxes[:, 2:] - origin) / cell_size).astype(np.int64)
+
+    # Cells of all the boxes, sorted by cell
+    counts = (high[:, 0] - low[:, 0] + 1) * (high[:, 1] - low[:, 1] + 1)
+    owners = np.repeat(np.arange(len(boxes)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    n_j = np.repeat(high[:, 1] - low[:, 1] + 1, counts)
+    cell_i = np.repeat(low[:, 0], counts) + local // n_j
+    cell_j = np.repeat(low[:, 1], counts) + local % n_j
+    order = np.lexsort((cell_j, cell_i))
+    cell_i, cell_j, owners = cell_i[order], cell_j[order], owners[order]
+    starts = np.flatnonzero(np.r_[True, (np.diff(cell_i) != 0) | (np.diff(cell_j) != 0)]) if len(owners) else []
+    cells = {(int(i), int(j)): group for i, j, group in zip(cell_i[starts], cell_j[starts],
+                                                          np.split(owners, starts[1:]))}
+    return {'boxes': boxes, 'cell_size': cell_size, 'origin': origin, 'cells': cells}
+
+
+# Function to find the pairs of boxes of the grid that intersect
+def grid_pairs(grid):
+    """
+    Returns:
+        np.ndarray: k x 2 indexes (a, b) of the boxes that intersect, with a < b (each pair once). Only the boxes of
+            the same cell are compared.
+    """
+    pairs = [np.column_stack([group[i], group[j]]) for group in grid['cells'].values() if len(group) > 1
+             for i, j in [np.triu_indices(len(group), 1)]]
+    if not pairs:
+        return np.zeros((0, 2), dtype=int)
+    pairs = np.unique(np.sort(np.concatenate(pairs), axis=1), axis=0)
+    box_a, box_b = grid['boxes'][pairs[:, 0]], grid['boxes'][pairs[:, 1]]
+    mask = ((box_a[:, 0] <= box_b[:, 2]) & (box_a[:, 2] >= box_b[:, 0]) & (box_a[:, 1] <= box_b[:, 3])
+            & (box_a[:, 3] >= box_b[:, 1]))
+    return pairs[mask]
+
+
+# Function to calculate the distance from points to a segment
+def _segment_distance(y, z, start, end):
+    """
+    Returns:
+        tuple: Distances and (y, z) of the nearest points of the segment.
+    """
+    direction = np.subtract(end, start)
+    length_2 = float(direction @ direction)
+    t = 0.0 if length_2 == 0.0 else np.clip(((y - start[0]) * direction[0] + (z - start[1]) * direction[1])
+                                             / length_2, 0.0, 1.0)
+    near_y, near_z = start[0] + t * direction[0], start[1] + t * direction[1]
+    return np.hypot(y - near_y, z - near_z), (near_y, near_z)
+
+
+# Function to obtain the boundary of a patch as a closed polygon
+def patch_boundary(item, n_arc=90):
+    """
+    Args:
+        n_arc (int): Number of segments of a circle (the arcs of circ patches).
+
+    Returns:
+        np.ndarray: m x 2 points (y, z) of the boundary.
+    """
+    if item[1] == 'rect':
+        (y1, z1, y2, z2) = item[5:9]
+        return np.array([[y1, z1], [y2, z1], [y2, z2], [y1, z2]])
+    elif item[1] in ['quad', 'quadr']:
+        return np.array(item[5:13]).reshape(4, 2)
+    y_c, z_c, r_int, r_ext, ang_ini, ang_end = item[5:11]
+    n_points = max(2, math.ceil(abs(ang_end - ang_ini) / 360.0 * n_arc)) + 1
+    theta = np.radians(np.linspace(ang_ini, ang_end, n_points))
+    outer = np.column_stack([y_c + r_ext * np.cos(theta), z_c + r_ext * np.sin(theta)])
+    inner = np.column_stack([y_c + r_int * np.cos(theta), z_c + r_int * np.sin(theta)])[::-1]
+    return np.vstack([outer, inner])
+
+
+# Function to find the points inside a patch
+def inside_patch(item, y, z, tolerance=0.0):
+    """
+    Args:
+        item (list): Patch rect, quad or circ with numeric values.
+        y, z (np.ndarray): Points.
+        tolerance (float): Points outside the patch at a distance smaller than tolerance are inside.
+
+    Returns:
+        np.ndarray: True for the points inside the patch.
+    """
+    y, z = np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+    if item[1] == 'rect':
+        y1, z1, y2, z2 = item[5:9]
+        return ((y >= min(y1, y2) - tolerance) & (y <= max(y1, y2) + tolerance) & (z >= min(z1, z2) - tolerance)
+                & (z <= max(z1, z2) + tolerance))
+    elif item[1] in ['quad', 'quadr']:
+        points = np.array(item[5:13]).reshape(4, 2)
+        inside = np.zeros(y.shape, dtype=bool)
+        near = np.zeros(y.shape, dtype=bool)
+        for (y_a, z_a), (y_b, z_b) in zip(points, np.roll(points, -1, axis=0)):
+            # Even-odd rule with a ray in the direction +z
+            crosses = (y_a > y) != (y_b > y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z_cross = z_a + (y - y_a) * (z_b - z_a) / (y_b - y_a)
+            inside ^= crosses & (z < z_cross)
+            if tolerance > 0.0:
+                near |= _segment_distance(y, z, (y_a, z_a), (y_b, z_b))[0] <= tolerance
+        return inside | near
+    y_c, z_c, r_int, r_ext, ang_ini, ang_end = item[5:11]
+    radius = np.hypot(y - y_c, z - z_c)
+    inside = (radius >= min(r_int, r_ext) - tolerance) & (radius <= max(r_int, r_ext) + tolerance)
+    span = abs(ang_end - ang_ini)
+    if span < 360.0:
+        angle = np.mod(np.degrees(np.arctan2(z - z_c, y - y_c)) - min(ang_ini, ang_end), 360.0)
+        margin = np.degrees(tolerance / np.maximum(radius, 1e-300))
+        inside &= (angle <= span + margin) | (angle >= 360.0 - margin)
+    return inside
+
+
+# Function to calculate the area of a patch (without its fibers)
+def patch_area(item):
+    if item[1] == 'rect':
+        return abs((item[7] - item[5]) * (item[8] - item[6]))
+    elif item[1] in ['quad', 'quadr']:
+        y, z = np.array(item[5:13:2]), np.array(item[6:13:2])
+        return abs(float(np.dot(y, np.roll(z, -1)) - np.dot(z, np.roll(y, -1)))) / 2.0
+    r_int, r_ext, ang_ini, ang_end = item[7:11]
+    return abs(r_ext ** 2 - r_int ** 2) * min(abs(np.radians(ang_end - ang_ini)), 2.0 * np.pi) / 2.0
+
+
+# Function to calculate the signed area of a polygon (positive if it is counterclockwise)
+def _polygon_area(points):
+    if len(points) < 3:
+        return 0.0
+    y, z = points[:, 0], points[:, 1]
+    return float(np.dot(y, np.roll(z, -1)) - np.dot(z, np.roll(y, -1))) / 2.0
+
+
+# Function to clip a polygon with a convex polygon (Sutherland-Hodgman)
+def _clip_polygon(subject, clip):
+    """
+    Args:
+        subject, clip (np.ndarray): m x 2 points of the polygons. clip must be convex.
+
+    Returns:
+        np.ndarray: Points of the intersection of the polygons (empty if they don't intersect).
+    """
+    if _polygon_area(clip) < 0.0:
+        clip = clip[::-1]
+    output = np.asarray(subject, dtype=float)
+    for start, end in zip(clip, np.roll(clip, -1, axis=0)):
+        if len(output) == 0:
+            break
+        edge = end - start
+        # Positive side: left of the edge of the counterclockwise polygon
+        side = edge[0] * (output[:, 1] - start[1]) - edge[1] * (output[:, 0] - start[0])
+        points = []
+        for k in range(len(output)):
+            current, previous = output[k], output[k - 1]
+            if side[k] >= 0.0:
+                if side[k - 1] < 0.0:
+                    points.append(previous + (current - previous) * side[k - 1] / (side[k - 1] - side[k]))
+                points.append(current)
+            elif side[k - 1] >= 0.0:
+                points.append(previous + (current - previous) * side[k - 1] / (side[k - 1] - side[k]))
+        output = np.array(points).reshape(-1, 2)
+    return output
+
+
+# Function to check if a polygon is convex
+def _is_convex(points):
+    edges = np.roll(points, -1, axis=0) - points
+    cross = edges[:, 0] * np.roll(edges[:, 1], -1) - edges[:, 1] * np.roll(edges[:, 0], -1)
+    return bool(np.all(cross >= 0.0) or np.all(cross <= 0.0))
+
+
+# Function to calculate the overlap area of two patches
+def overlap_area(item_a, item_b):
+    """
+    Returns:
+        float: Area of item_a inside item_b. It is exact for two rect or quad patches (one of them convex), and for
+            the circ patches it is estimated with a fine grid of points of the smaller patch (at most the area of
+            the smaller patch).
+    """
+    if item_a[1] == 'rect' and item_b[1] == 'rect':
+        box_a, box_b = EI.element_bbox(item_a), EI.element_bbox(item_b)
+        d_y = min(box_a[2], box_b[2]) - max(box_a[0], box_b[0])
+        d_z = min(box_a[3], box_b[3]) - max(box_a[1], box_b[1])
+        return max(d_y, 0.0) * max(d_z, 0.0)
+    if item_a[1] != 'circ' and item_b[1] != 'circ':
+        polygon_a, polygon_b = patch_boundary(item_a), patch_boundary(item_b)
+        if _is_convex(polygon_b):
+            return abs(_polygon_area(_clip_polygon(polygon_a, polygon_b)))
+        if _is_convex(polygon_a):
+            return abs(_polygon_area(_clip_polygon(polygon_b, polygon_a)))
+    area_a, area_b = patch_area(item_a), patch_area(item_b)
+    first, second = (item_a, item_b) if area_a <= area_b else (item_b, item_a)
+    sample = list(first)
+    sample[3], sample[4] = max(int(first[3]), SAMPLE_DIVISIONS), max(int(first[4]), SAMPLE_DIVISIONS)
+    y, z, area = FT.element_fibers(sample)
+    return min(float(np.sum(np.abs(area)[inside_patch(second, y, z)])), area_a, area_b)
+
+
+# Function to calculate the distance between the boundaries of two patches
+def boundary_distance(item_a, item_b):
+    """
+    Returns:
+        tuple: (distance, (y, z)), with (y, z) the middle point between the nearest points of the boundaries.
+    """
+    distance, middle = math.inf, (0.0, 0.0)
+    for first, second in [(patch_boundary(item_a), patch_boundary(item_b)),
+                          (patch_boundary(item_b), patch_boundary(item_a))]:
+        for start, end in zip(second, np.roll(second, -1, axis=0)):
+            distances, (near_y, near_z) = _segment_distance(first[:, 0], first[:, 1], start, end)
+            k = int(np.argmin(distances))
+            if distances[k] < distance:
+                near_y, near_z = np.broadcast_to(near_y, distances.shape), np.broadcast_to(near_z, distances.shape)
+                distance = float(distances[k])
+                middle = ((first[k, 0] + near_y[k]) / 2.0, (first[k, 1] + near_z[k]) / 2.0)
+    return distance, middle
+
+
+# Function to find the points inside the patches of a grid
+def covered_points(patches, grid, y, z, tolerance=0.0):
+    """
+    Args:
+        patches (list): (position, patch) of the boxes of the grid (see section_parts).
+        y, z (np.ndarray): Points.
+
+    Returns:
+        np.ndarray: True for the points inside (or at a distance smaller than tolerance of) a patch. Each point is
+            compared only with the patches of its cell.
+    """
+    y, z = np.asarray(y, dtype=float), np.asarray(z, dtype=float)
+    inside = np.zeros(len(y), dtype=bool)
+    if len(y) == 0 or not patches:
+        return inside
+    keys = np.floor((np.column_stack([y, z]) - grid['origin']) / grid['cell_size']).astype(np.int64)
+    cells, cell_of_point = np.unique(keys, axis=0, return_inverse=True)
+    order = np.argsort(cell_of_point.ravel(), kind='stable')
+    starts = np.searchsorted(cell_of_point.ravel()[order], np.arange(len(cells) + 1))
+    for k, (i, j) in enumerate(cells.tolist()):
+        in_cell = order[starts[k]:starts[k + 1]]
+        for b in grid['cells'].get((i, j), []):
+            pending = in_cell[~inside[in_cell]]
+            if len(pending) == 0:
+                break
+            inside[pending] = inside_patch(patches[b][1], y[pending], z[pending], tolerance)
+    return inside
+
+
+# Function to check the overlaps, gaps and bars outside the patches of the section
+def check_section(section_values, gap_size=None, overlap_tolerance=OVERLAP_TOLERANCE):
+    """
+    Args:
+        section_values (list): Section list with numeric values (see core.convert_units).
+        gap_size (float): Maximum distance between two patches reported as a gap. None uses GAP_SIZE times the
+            size of the section.
+        overlap_tolerance (float): Minimum overlap area, relative to the area of the smaller patch.
+
+    Returns:
+        dict: 'overlaps' [(position_a, position_b, area)], 'gaps' [(position_a, position_b, distance)],
+            'outside_bars' [(position, bars outside, bars)], 'positions' (all the positions with problems) and
+            'gap_size'. Two copies of the same instance have position_a == position_b.
+    """
+    patches, layers = section_parts(section_values)
+    boxes = np.array([EI.element_bbox(item) for _, item in patches + layers], dtype=float).reshape(-1, 4)
+    if len(boxes) == 0:
+        return {'overlaps': [], 'gaps': [], 'outside_bars': [], 'positions': [], 'gap_size': gap_size or 0.0}
+    size = max(boxes[:, 2].max() - boxes[:, 0].min(), boxes[:, 3].max() - boxes[:, 1].min())
+    gap_size = float(GAP_SIZE * size if gap_size is None else gap_size)
+    touch = 1e-9 * max(size, 1.0)
+    patch_boxes = boxes[:len(patches)]
+    areas = np.array([patch_area(item) for _, item in patches])
+
+    # Pairs of patches with a distance between their boxes smaller than gap_size
+    grid = build_grid(patch_boxes + np.array([-1.0, -1.0, 1.0, 1.0]) * gap_size / 2.0)
+    pairs = grid_pairs(grid)
+    box_a, box_b = patch_boxes[pairs[:, 0]], patch_boxes[pairs[:, 1]]
+    d_y = np.minimum(box_a[:, 2], box_b[:, 2]) - np.maximum(box_a[:, 0], box_b[:, 0])
+    d_z = np.minimum(box_a[:, 3], box_b[:, 3]) - np.maximum(box_a[:, 1], box_b[:, 1])
+
+    # Two rect patches: overlap area, distance of the boxes and middle point of the space between the boxes (all
+    # the pairs together)
+    is_rect = np.array([item[1] == 'rect' for _, item in patches], dtype=bool)
+    rect_pair = is_rect[pairs[:, 0]] & is_rect[pairs[:, 1]]
+    pair_area = np.maximum(d_y, 0.0) * np.maximum(d_z, 0.0)
+    pair_distance = np.hypot(np.maximum(-d_y, 0.0), np.maximum(-d_z, 0.0))
+    middle_y = (np.minimum(box_a[:, 2], box_b[:, 2]) + np.maximum(box_a[:, 0], box_b[:, 0])) / 2.0
+    middle_z = (np.minimum(box_a[:, 3], box_b[:, 3]) + np.maximum(box_a[:, 1], box_b[:, 1])) / 2.0
+
+    # Other pairs: overlap estimated with points, and distance of the boundaries
+    for k in np.flatnonzero(~rect_pair).tolist():
+        item_a, item_b = patches[pairs[k, 0]][1], patches[pairs[k, 1]][1]
+        pair_area[k] = overlap_area(item_a, item_b)
+        if pair_area[k] == 0.0:
+            pair_distance[k], (middle_y[k], middle_z[k]) = boundary_distance(item_a, item_b)
+        else:
+            pair_distance[k] = 0.0
+    owners = np.array([position for position, _ in patches], dtype=int).reshape(-1)
+    is_overlap = pair_area > overlap_tolerance * np.minimum(areas[pairs[:, 0]], areas[pairs[:, 1]])
+
+    # Gaps: the space between the patches is not inside other patch
+    is_gap = ~is_overlap & (pair_distance > touch) & (pair_distance <= gap_size)
+    is_gap[is_gap] = ~covered_points(patches, grid, middle_y[is_gap], middle_z[is_gap])
+    overlaps = [(int(owners[a]), int(owners[b]), float(area))
+                for (a, b), area in zip(pairs[is_overlap].tolist(), pair_area[is_overlap].tolist())]
+    gaps = [(int(owners[a]), int(owners[b]), float(distance))
+            for (a, b), distance in zip(pairs[is_gap].tolist(), pair_distance[is_gap].tolist())]
+
+    # Bars of the layers, compared with the patches of their cell
+    outside_bars = {}
+    if layers:
+        bars = [FT.element_fibers(item)[:2] for _, item in layers]
+        bar_y, bar_z = np.concatenate([y for y, _ in bars]), np.concatenate([z for _, z in bars])
+        bar_layer = np.repeat(np.arange(len(layers)), [len(y) for y, _ in bars])
+        inside = covered_points(patches, grid, bar_y, bar_z, touch)
+        n_outside = np.bincount(bar_layer, ~inside, minlength=len(layers))
+        n_bars = np.bincount(bar_layer, minlength=len(layers))
+        for (position, _), outside, total in zip(layers, n_outside.tolist(), n_bars.tolist()):
+            previous = outside_bars.get(position, (position, 0, 0))
+            outside_bars[position] = (position, previous[1] + int(outside), previous[2] + total)
+        outside_bars = {position: value for position, value in outside_bars.items() if value[1] > 0}
+
+    positions = sorted({position for overlap in overlaps + gaps for position in overlap[:2]} | set(outside_bars))
+    return {'overlaps': overlaps, 'gaps': gaps, 'outside_bars': list(outside_bars.values()), 'positions': positions,
+            'gap_size': gap_size}
+
+
+# Function to write the results of the check
+def check_report(check, section, unit='-'):
+    """
+    Args:
+        check (dict): Result of check_section.
+        section (list): Section list (for the labels of the elements).
+        unit (str): Unit of the coordinates of the check.
+    """
+    def label(position):
+        try:
+            return core.element_label(position, section[position])
+        except (IndexError, ValueError, TypeError):
+            return str(position)
+
+    unit_text = '' if unit == '-' else f" {unit}"
+    area_text = '' if unit == '-' else f" {unit}²"
+    if not check['positions']:
+        return (f"Section check: no overlaps, no gaps smaller than {check['gap_size']:.4g}{unit_text} and no bars "
+                f"outside the patches.")
+    lines = [f"Section check: {len(check['overlaps'])} overlaps, {len(check['gaps'])} gaps (< "
+             f"{check['gap_size']:.4g}{unit_text}), {len(check['outside_bars'])} layers with bars outside the patches."]
+    if check['overlaps']:
+        lines.append("Overlaps (area counted twice):")
+        for position_a, position_b, area in check['overlaps']:
+            pair = f"copies of {label(position_a)}" if position_a == position_b else \
+                f"{label(position_a)} / {label(position_b)}"
+            lines.append(f"  {pair}: {area:.4g}{area_text}")
+    if check['gaps']:
+        lines.append("Gaps:")
+        for position_a, position_b, distance in check['gaps']:
+            pair = f"copies of {label(position_a)}" if position_a == position_b else \
+                f"{label(position_a)} / {label(position_b)}"
+            lines.append(f"  {pair}: {distance:.4g}{unit_text}")
+    if check['outside_bars']:
+        lines.append("Bars outside the patches:")
+        for position, n_outside, n_bars in check['outside_bars']:
+            lines.append(f"  {label(position)}: {n_outside} of {n_bars} bars")
+    return "\n".join(lines)
+
+
+# %%  [03] TEST
+if __name__ == '__main__':
+    import time
+
+    # Column 40x60 with an overlap, a gap of 0.2 cm and a bar outside the concrete [cm]
+    section_1 = [['section', 'Fiber', 1, '-GJ', 1.0e6],
+                 ['patch', 'rect', 1, 10, 10, -30.0, -20.0, 0.0, 20.0],
+                 ['patch', 'rect', 1, 10, 10, -2.0, -20.0, 30.0, 20.0],
+                 ['patch', 'rect', 2, 2, 10, 30.2, -20.0, 35.0, 20.0],
+                 ['patch', 'circ', 2, 16, 2, 0.0, 0.0, 0.0, 8.0, 0.0, 360.0],
+                 ['layer', 'straight', 3, 3, 5.07, 25.0, -15.0, 25.0, 15.0],
+                 ['layer', 'straight', 3, 3, 5.07, -25.0, -15.0, -25.0, 25.0]]
+    check_1 = check_section(section_1, gap_size=0.5)
+    print(check_report(check_1, section_1, 'cm'))
+
+    # Grid of 100 x 100 rect patches and 20000 bars, without problems
+    section_2 = [['section', 'Fiber', 1, '-GJ', 1.0e6]]
+    for i in range(100):
+        for j in range(100):
+            section_2.append(['patch', 'rect', 1, 2, 2, 10.0 * i, 10.0 * j, 10.0 * i + 10.0, 10.0 * j + 10.0])
+    for i in range(200):
+        section_2.append(['layer', 'straight', 3, 100, 1.0, 5.0 * i + 2.5, 2.5, 5.0 * i + 2.5, 997.5])
+    time_1 = time.perf_counter()
+    check_2 = check_section(section_2)
+    print(f"Patches: 10000, bars: 20000, problems: {len(check_2['positions'])}, "
+          f"time: {time.perf_counter() - time_1:.2f} s")
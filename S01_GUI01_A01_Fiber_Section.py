@@ -21,13 +21,22 @@ from IPython.display import display, Image, Video
 import os
 import shutil
 import math
+from contextlib import ExitStack
 
 import sys
 sys.path.insert(0, './C_GUI01_Fiber_Section')
 import S01_GUI01_A02_Graf_Sec_OPSVIS as opsv1
-import S01_GUI01_A03_Video as vid
 import S01_GUI01_A04_CP as CP
-import S01_GUI01_A05_CenterFiber as CF
+import S01_GUI01_A06_FiberTable as FT
+import S01_GUI01_A10_SectionState as SS
+import S01_GUI01_A12_Cache as RC
+import S01_GUI01_A13_Core as core
+import S01_GUI01_A16_ElementIndex as EI
+import S01_GUI01_A17_Templates as TP
+import S01_GUI01_A19_Coarsen as CO
+import S01_GUI01_A20_SectionCheck as SC
+# S01_GUI01_A03_Video (imageio) and S01_GUI01_A05_CenterFiber are imported in show_video and show_center_section,
+# the first time that they are used.
 
 # %% [02] INITIALIZATION
 # Create directories for the GUI in case it doesn't exist.
@@ -47,6 +56,12 @@ directories = ['C_GUI01_Fiber_Section/C_GUI01_Fiber_Section',
 for dir_i in directories:
     create_directory(dir_i)
 
+# Cached contributions of the elements of the section (see S01_GUI01_A10_SectionState.py)
+section_state = SS.new_section_state()
+
+# Results saved in disk between sessions (see S01_GUI01_A12_Cache.py)
+result_cache = RC.open_cache()
+
 
 # %% [03] FUNCTIONS
 
@@ -72,17 +87,102 @@ def update_unit_options(change):
     update_input_widgets()
 
 
+# Index of the elements of the section: the section of the textarea is read again only when the text changes,
+# and the elements are selected by their position in the section. The dropdown shows only one page of the
+# elements that satisfy the filters (type, matTag and zone).
+element_index = {'text': None, 'section': [], 'unit': None, 'elements': None, 'page': 0}
+
+
+# Function to obtain the section of the textarea (a ValueError is raised if the text is not a list)
+def indexed_section():
+    text = section_params_output.value
+    if text != element_index['text']:
+        element_index['section'] = core.parse_section(text)
+        element_index['text'] = text
+    return element_index['section']
+
+
+# State of the writing of the section in the textarea: the changes made by the program don't update the dropdown
+# through the observer of the textarea (set_section_text updates it once)
+section_sync = {'quiet': False}
+
+
+# Function to write the section in the textarea
+def set_section_text(text, section=None):
+    """
+    Args:
+        text (str): Text of the section (see core.format_section and core.append_element).
+        section (list): Section of the text, if it is known (the text is not read again).
+    """
+    if text == section_params_output.value:
+        return
+    if section is not None:
+        element_index['text'], element_index['section'] = text, section
+    section_sync['quiet'] = True
+    try:
+        section_params_output.value = text
+    finally:
+        section_sync['quiet'] = False
+    update_edit_patch_layer_options()
+
+
+# Function to update the dropdown when the user writes in the textarea
+def section_text_changed(change):
+    if not section_sync['quiet']:
+        update_edit_patch_layer_options()
+
+
+# Function to obtain the index of the elements to filter them (see S01_GUI01_A16_ElementIndex.py)
+def indexed_elements():
+    section = indexed_section()
+    elements = element_index['elements']
+    if elements is None or elements['section'] is not section or element_index['unit'] != graphic_unit_dropdown.value:
+        element_index['elements'] = EI.build_element_index(section, graphic_unit_dropdown.value)
+        element_index['unit'] = graphic_unit_dropdown.value
+    return element_index['elements']
+
+
+# Function to read the filters of the elements
+def element_filters():
+    """
+    Returns:
+        dict: 'kind', 'mat_tag' and 'bbox' for EI.filter_elements. A ValueError is raised if a filter is not valid.
+    """
+    kind = None if filter_type_dropdown.value == 'All' else filter_type_dropdown.value
+    mat_tag = int(filter_mat_input.value) if filter_mat_input.value.strip() else None
+    bbox = None
+    if filter_bbox_input.value.strip():
+        bbox = tuple(float(value) for value in filter_bbox_input.value.split(','))
+        if len(bbox) != 4:
+            raise ValueError("The zone must be 'ymin, zmin, ymax, zmax'")
+    return {'kind': kind, 'mat_tag': mat_tag, 'bbox': bbox}
+
+
+# Function to obtain the element selected in the edit_patch_layer_dropdown
+def selected_element():
+    """
+    Returns:
+        tuple: (position, element) in the section (the element is a copy), or (None, None) if there isn't an
+            element selected or the section is not valid.
+    """
+    position = edit_patch_layer_dropdown.value
+    if position == '-':
+        return None, None
+    try:
+        return position, list(indexed_section()[position])
+    except (ValueError, IndexError):
+        # The text of the section is not valid, or the options of the dropdown are not updated yet
+        return None, None
+
+
 # Function to update the "Edit Patch/Layer" dropdown based on the actual section
-def update_edit_patch_layer_options(change):
+def update_edit_patch_layer_options(change=None):
     if code_params_output.value == '':
         return
     
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
-        actual = section_params_output.value
+        params = indexed_section()
+    except ValueError:
         # section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
@@ -90,26 +190,41 @@ def update_edit_patch_layer_options(change):
     if len(params) > 1:
         edit_patch_layer_dropdown.disabled = False
     
-        # Find all the patch and layer elements in the section
-        patch_layer_elements = []
-        for item in params:
-            if item[0] in ['patch', 'layer']:
-                patch_layer_elements.append(item)
-        
-        # Create the options for the dropdown
-        options = [str(item) for item in patch_layer_elements]
+        # Elements that satisfy the filters
+        elements = indexed_elements()
+        try:
+            positions = EI.filter_elements(elements, **element_filters())
+        except ValueError as e:
+            code_params_output.value = f"Error in the filters of the elements: {e}"
+            positions = elements['positions']
         
-        # Insert the option '-' in the 0 position
-        options.insert(0, '-')
+        # Short label and position of the elements of the page, with the option '-' in the 0 position
+        page_options, element_index['page'], n_pages = EI.page_options(elements, positions, element_index['page'])
+        page_text.value = f"{element_index['page'] + 1}/{n_pages} ({len(positions)})"
+        options = tuple([('-', '-')] + page_options)
         
-        # Update the dropdown options
-        edit_patch_layer_dropdown.options = options
+        # Update the dropdown options (only if they changed, to keep the selection)
+        if options != edit_patch_layer_dropdown.options:
+            edit_patch_layer_dropdown.options = options
     
     # If there are no patch or layer elements in the section, disable the dropdown
     else:
         edit_patch_layer_dropdown.disabled = True
-        edit_patch_layer_dropdown.options = ['-']
+        edit_patch_layer_dropdown.options = [('-', '-')]
         edit_patch_layer_dropdown.value = '-'
+        page_text.value = "1/1 (0)"
+
+
+# Function to change the page of the elements in the dropdown
+def change_element_page(button):
+    element_index['page'] += 1 if button is next_page_button else -1
+    update_edit_patch_layer_options()
+
+
+# Function to apply the filters of the elements (from the first page)
+def filter_element_options(change=None):
+    element_index['page'] = 0
+    update_edit_patch_layer_options()
 
 
 # %%% [03-01] INPUT DATA
@@ -184,39 +299,8 @@ def update_input_widgets(change=None):
 # Function to add a new section definition and delete actual section and image.
 def add_section_definition(change=None):
     if add_section_button.description == 'Add Section':
-        add_section_button.description = 'Delete Section'
-        add_section_button.style.button_color = 'red'
-        add_patch_layer_button.description = 'Define'
-        refresh_button.description = 'MatTag'
-        video_button.description = 'Video'
-        code_button.description = 'Code'
-        cover_button.description = 'Cover'
-        replicate_button.description = 'Replicate'
-        material_button.description = 'Strength'
-        CP_button.description = 'Solve PC'
-        center_button.description = 'Center'
-        edit_patch_layer_button.description = 'Edit'
-        cancel_patch_layer_button.description = 'Copy'
-
-        # Enable widgets to define and see patch and layer
-        add_patch_layer_button.disabled = False
-        refresh_button.disabled = False
-        video_button.disabled = False
-        code_button.disabled = False
-        cover_button.disabled = False
-        replicate_button.disabled = False
-        CP_button.disabled = False
-        material_button.disabled = False
-        center_button.disabled = False
-        edit_patch_layer_button.disabled = False
-        cancel_patch_layer_button.disabled = False
-        zoom_dropdown.disabled = False
-        fiber_plot_dropdown.disabled = False
-        
-        # Disable widgets to define the section
-        graphic_unit_dropdown.disabled = True
-        secTag_input.disabled = True
-        GJ_input.disabled = True
+        # Enable widgets to define and see patch and layer, and disable widgets to define the section
+        set_ui_mode('idle')
 
         # Add a new section_params_output.
         secTag = secTag_input.value
@@ -228,39 +312,8 @@ def add_section_definition(change=None):
         code_params_output.value = "Section added successfully"
 
     else:
-        # Unfreeze the unit graphic.
-        add_section_button.description = 'Add Section'
-        add_section_button.style.button_color = 'green'
-        add_patch_layer_button.description = '-'
-        refresh_button.description = '-'
-        video_button.description = '-'
-        code_button.description = '-'
-        cover_button.description = '-'
-        replicate_button.description = '-'
-        material_button.description = '-'
-        CP_button.description = '-'
-        center_button.description = '-'
-        cancel_patch_layer_button.description = '-'
-        edit_patch_layer_button.description = '-'
-        graphic_unit_dropdown.disabled = False
-        add_patch_layer_button.disabled = True
-        refresh_button.disabled = True
-        video_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        material_button.disabled = True
-        center_button.disabled = True
-        cancel_patch_layer_button.disabled = True
-        edit_patch_layer_button.disabled = True
-        patch_layer_type_dropdown.disabled = True
-        element_type_dropdown.disabled = True
-        unit_dropdown.disabled = True
-        zoom_dropdown.disabled = True
-        fiber_plot_dropdown.disabled = True
-        secTag_input.disabled = False
-        GJ_input.disabled = False
+        # Unfreeze the unit graphic and disable the actions on the section.
+        set_ui_mode('empty')
         # Delete the section_params_output.
         section_params_output.value = ""
         # Delete the code_params_output.
@@ -270,77 +323,133 @@ def add_section_definition(change=None):
         model_widgets.children = []
 
 
-# %%%% [03-02-01] ADD_PATCH_LAYER
-# Function auxiliar to add patch or layer definition
-def aux_add_patch_layer(change=None):
-    # Save the patch or layer definition
+# %%%% [03-02-00] TEMPLATE_SECTION
+# Section created with the template in the panel (text of the section, or None if the parameters are not valid)
+template_state = {'text': None}
+
+
+# Function to create the section of the template with the parameters of the panel
+def template_section_preview(change=None):
+    template_state['text'] = None
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
-        actual = section_params_output.value
-        section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
+        parameters = TP.parse_parameters(template_params_input.value)
+        section = TP.template_section(template_kind_dropdown.value, secTag_input.value, float(GJ_input.value),
+                                      graphic_unit_dropdown.value, **parameters)
+    except ValueError as e:
+        code_params_output.value = f"Error: {e}"
         return
+    template_state['text'] = core.format_section(section)
+    show_section(section=section)
+    code_params_output.value = (f"Template '{template_kind_dropdown.value}': {len(section) - 1} elements. "
+                                "Create the section using the button 'Create'")
+    if template_kind_dropdown.value == 'steel':
+        designations = ", ".join(TP.SH.shape_designations())
+        code_params_output.value += f"\nSteel shapes (matTag 4, or mat_steel = tag): {designations}"
+
+
+# Function to write the default parameters of the template selected
+def change_template_kind(change=None):
+    template_params_input.value = TP.format_parameters(
+        TP.default_parameters(template_kind_dropdown.value, graphic_unit_dropdown.value))
+
+
+# Function to create a section with a template
+def define_template(change=None):
+    if template_button.description == 'Template':
+        set_ui_mode('template')
+        build_template_panel()
+        text_template = widgets.HTML(value=f"Template [{graphic_unit_dropdown.value}]:")
+        text_template.style.font_size = '14px'
+        model_widgets.children = [text_template, template_kind_dropdown, template_params_input,
+                                  cancel_template_button]
+        change_template_kind()
+        template_section_preview()
 
+    else:
+        if template_state['text'] is None:
+            return
+        set_section_text(template_state['text'])
+        set_ui_mode('idle')
+        model_widgets.children = []
+        show_section()
+        code_params_output.value = "Section created with the template successfully"
+
+
+# Function to cancel the template
+def cancel_template(change=None):
+    set_ui_mode('empty')
+    model_widgets.children = []
+    out.clear_output()
+    code_params_output.value = ""
+
+
+# %%%% [03-02-01] ADD_PATCH_LAYER
+# Function to create the patch or layer defined in the input widgets
+def patch_layer_element():
     element_type = element_type_dropdown.value
     patch_layer_type = patch_layer_type_dropdown.value
     patch_layer_params = [element_type, patch_layer_type, material_tag_input.value]
     unit = unit_dropdown.value
 
-    # Function to add unit to the section definition.
-    def unit_patch_layer(value, unit_x, coef):
-        if unit_x == "-":
-            return value
-        else:
-            if coef == 1:
-                return str(value) + f"*{unit_x}"
-            if coef >= 2:
-                return str(value) + f"*{unit_x}**{coef}"
-
     if element_type == 'patch':
         if patch_layer_type == 'rect':
             patch_layer_params += [nFibY_input.value, nFibZ_input.value,
-                                unit_patch_layer(float(y1_input.value), unit, 1),
-                                unit_patch_layer(float(z1_input.value), unit, 1),
-                                unit_patch_layer(float(y2_input.value), unit, 1),
-                                unit_patch_layer(float(z2_input.value), unit, 1)]
+                                core.unit_value(float(y1_input.value), unit, 1),
+                                core.unit_value(float(z1_input.value), unit, 1),
+                                core.unit_value(float(y2_input.value), unit, 1),
+                                core.unit_value(float(z2_input.value), unit, 1)]
         elif patch_layer_type == 'quad':
             patch_layer_params += [numSubdivIJ_input.value, numSubdivJK_input.value,
-                                unit_patch_layer(float(yI_input.value), unit, 1),
-                                unit_patch_layer(float(zI_input.value), unit, 1),
-                                unit_patch_layer(float(yJ_input.value), unit, 1),
-                                unit_patch_layer(float(zJ_input.value), unit, 1),
-                                unit_patch_layer(float(yK_input.value), unit, 1),
-                                unit_patch_layer(float(zK_input.value), unit, 1),
-                                unit_patch_layer(float(yL_input.value), unit, 1),
-                                unit_patch_layer(float(zL_input.value), unit, 1)]
+                                core.unit_value(float(yI_input.value), unit, 1),
+                                core.unit_value(float(zI_input.value), unit, 1),
+                                core.unit_value(float(yJ_input.value), unit, 1),
+                                core.unit_value(float(zJ_input.value), unit, 1),
+                                core.unit_value(float(yK_input.value), unit, 1),
+                                core.unit_value(float(zK_input.value), unit, 1),
+                                core.unit_value(float(yL_input.value), unit, 1),
+                                core.unit_value(float(zL_input.value), unit, 1)]
         elif patch_layer_type == 'circ':
             patch_layer_params += [numSubdivCirc_input.value, numSubdivRad_input.value,
-                                unit_patch_layer(float(yc_input.value), unit, 1),
-                                unit_patch_layer(float(zc_input.value), unit, 1),
-                                unit_patch_layer(float(r_ini_input.value), unit, 1),
-                                unit_patch_layer(float(r_end_input.value), unit, 1), float(ang_ini_input.value),
+                                core.unit_value(float(yc_input.value), unit, 1),
+                                core.unit_value(float(zc_input.value), unit, 1),
+                                core.unit_value(float(r_ini_input.value), unit, 1),
+                                core.unit_value(float(r_end_input.value), unit, 1), float(ang_ini_input.value),
                                 float(ang_end_input.value)]
     elif element_type == 'layer':
         if patch_layer_type == 'straight':
-            patch_layer_params += [numFiber_input.value, unit_patch_layer(float(areaFiber_input.value), unit, 2),
-                                unit_patch_layer(float(y1_input.value), unit, 1),
-                                unit_patch_layer(float(z1_input.value), unit, 1),
-                                unit_patch_layer(float(y2_input.value), unit, 1),
-                                unit_patch_layer(float(z2_input.value), unit, 1)]
+            patch_layer_params += [numFiber_input.value, core.unit_value(float(areaFiber_input.value), unit, 2),
+                                core.unit_value(float(y1_input.value), unit, 1),
+                                core.unit_value(float(z1_input.value), unit, 1),
+                                core.unit_value(float(y2_input.value), unit, 1),
+                                core.unit_value(float(z2_input.value), unit, 1)]
         elif patch_layer_type == 'circ':
-            patch_layer_params += [numFiber_input.value, unit_patch_layer(float(areaFiber_input.value), unit, 2),
-                                unit_patch_layer(float(yc_input.value), unit, 1),
-                                unit_patch_layer(float(zc_input.value), unit, 1),
-                                unit_patch_layer(float(radius_input.value), unit, 1), float(ang_ini_input.value),
+            patch_layer_params += [numFiber_input.value, core.unit_value(float(areaFiber_input.value), unit, 2),
+                                core.unit_value(float(yc_input.value), unit, 1),
+                                core.unit_value(float(zc_input.value), unit, 1),
+                                core.unit_value(float(radius_input.value), unit, 1), float(ang_ini_input.value),
                                 float(ang_end_input.value)]
 
-    params.append(patch_layer_params)
-    params_string = str(params).replace("[[", "[\n[")
-    params_string = params_string.replace("], [", "],\n[")
-    params_string = params_string.replace("]]", "]\n]")
-    section_params_output.value = params_string
+    return patch_layer_params
+
+
+# Function auxiliar to add patch or layer definition
+def aux_add_patch_layer(change=None):
+    # Save the patch or layer definition
+    try:
+        params = indexed_section()
+    except ValueError:
+        actual = section_params_output.value
+        section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
+        return
+
+    # Only the new element is written at the end of the text
+    patch_layer_params = patch_layer_element()
+    params = params + [patch_layer_params]
+    try:
+        params_string = core.append_element(section_params_output.value, patch_layer_params)
+    except ValueError:
+        params_string = core.format_section(params)
+    set_section_text(params_string, params)
     show_section()
 
 
@@ -351,39 +460,8 @@ def add_patch_layer(change=None):
         # See patch or layer parameters
         update_input_widgets()
         
-        # Change the button description and color
-        add_patch_layer_button.description = 'Save'
-        add_patch_layer_button.style.button_color = 'green'
-        
-        # Disable the other buttons
-        add_section_button.disabled = True
-        refresh_button.disabled = True
-        video_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        material_button.disabled = True
-        center_button.disabled = True
-        edit_patch_layer_button.disabled = True
-        edit_patch_layer_dropdown.disabled = True
-        
-        # Enable the button to cancel the definition
-        cancel_patch_layer_button.disabled = False
-        # Modify the description of the cancel button and the color
-        cancel_patch_layer_button.description = 'Delete'
-        cancel_patch_layer_button.style.button_color = 'red'
-        
-        # Enable the button to show and hide the new patch or layer
-        edit_patch_layer_button.disabled = False
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Hide'
-        edit_patch_layer_button.style.button_color = 'blue'
-        
-        # Enable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = False
-        element_type_dropdown.disabled = False
-        unit_dropdown.disabled = False
+        # Disable the other actions and enable the buttons and dropdowns to define the patch or layer
+        set_ui_mode('editing')
         
         # Show the actual section with the new patch or layer
         show_section_update()
@@ -398,42 +476,8 @@ def add_patch_layer(change=None):
         # Hide the patch or layer parameters
         model_widgets.children = []
         
-        # Change the button description and color
-        add_patch_layer_button.description = 'Define'
-        add_patch_layer_button.style.button_color = None
-        
-        # Enable the other buttons
-        add_section_button.disabled = False
-        refresh_button.disabled = False
-        video_button.disabled = False
-        code_button.disabled = False
-        cover_button.disabled = False
-        replicate_button.disabled = False
-        CP_button.disabled = False
-        material_button.disabled = False
-        center_button.disabled = False
-        edit_patch_layer_button.disabled = False
-        edit_patch_layer_dropdown.disabled = False
-        
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Edit'
-        
-        # Disable the button to cancel the definition
-        cancel_patch_layer_button.disabled = False
-        # Modify the description of the cancel button and the color
-        cancel_patch_layer_button.description = 'Copy'
-        cancel_patch_layer_button.style.button_color = None
-        
-        # Disable the button to show and hide the new patch or layer
-        edit_patch_layer_button.disabled = False
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Edit'
-        edit_patch_layer_button.style.button_color = None
-        
-        # Disable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = True
-        element_type_dropdown.disabled = True
-        unit_dropdown.disabled = True   
+        # Enable the other actions and disable the dropdowns to define the patch or layer
+        set_ui_mode('idle')
         
         # Save the patch or layer definition
         aux_add_patch_layer()
@@ -442,41 +486,24 @@ def add_patch_layer(change=None):
 
 # %%%% [03-02-02] SHOW_SECTION
 # Function to show the section created
-def show_section(change=None):
-    try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
-        actual = section_params_output.value
-        section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
-        return
+def show_section(change=None, section=None):
+    """
+    Args:
+        section (list): Section to show. None shows the section of the textarea.
+    """
+    if section is not None:
+        params = section
+    else:
+        try:
+            params = indexed_section()
+        except ValueError:
+            actual = section_params_output.value
+            section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
+            return
 
     # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
     graphic_unit = graphic_unit_dropdown.value
-
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    params = core.convert_units(params, graphic_unit)
 
     with out:
         # See list to plot programmer window
@@ -499,61 +526,30 @@ def show_section(change=None):
 def show_section_update(change=None):
     # Obtain the actual section
     try:
-        params_old = eval(section_params_output.value)
-        if not isinstance(params_old, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
-    # Add the element in base the parameters of the patch or layer
-    aux_add_patch_layer()
-    
-    # Re-write the section with the patch layer original
-    params_string = str(params_old).replace("[[", "[\n[")
-    params_string = params_string.replace("], [", "],\n[")
-    params_string = params_string.replace("]]", "]\n]")
-    section_params_output.value = params_string
+    # Show the section with the element in base the parameters of the patch or layer (the textarea keeps the
+    # section without the element)
+    show_section(section=params + [patch_layer_element()])
 
 
 # %%%% [03-02-02] SHOW_MATERIAL_SECTION
 # Function to show the material in the section
 def show_material_section(change=None):
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
     # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
     graphic_unit = graphic_unit_dropdown.value
-
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    params = core.convert_units(params, graphic_unit)
 
     with out:
         # See list to plot programmer window
@@ -579,52 +575,21 @@ def edit_patch_layer(change=None):
     # in base of the values from the edit_patch_layer_dropdown.
     if edit_patch_layer_button.description == 'Edit':
         # Verify if there are selected a patch or layer to edit
-        if edit_patch_layer_dropdown.value == '-':
+        if selected_element()[1] is None:
             code_params_output.value = "Select a patch or layer to edit"
             return 
+        if selected_element()[1][0] == 'instance':
+            code_params_output.value = "An instance can't be edited. Edit it in the box Fiber Section."
+            return
         
         # See patch or layer parameters
         update_input_widgets()
         
-        # Change the button description and color
-        add_patch_layer_button.description = 'Save'
-        add_patch_layer_button.style.button_color = 'green'
+        # Disable the other actions and enable the buttons and dropdowns to define the patch or layer
+        set_ui_mode('editing')
         
-        # Disable the other buttons
-        add_section_button.disabled = True
-        refresh_button.disabled = True
-        video_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        material_button.disabled = True
-        center_button.disabled = True
-        edit_patch_layer_button.disabled = True
-        edit_patch_layer_dropdown.disabled = True
-        
-        # Enable the button to cancel the definition
-        cancel_patch_layer_button.disabled = False
-        # Modify the description of the cancel button and the color
-        cancel_patch_layer_button.description = 'Delete'
-        cancel_patch_layer_button.style.button_color = 'red'
-        
-        # Enable the button to show and hide the new patch or layer
-        edit_patch_layer_button.disabled = False
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Hide'
-        edit_patch_layer_button.style.button_color = 'blue'
-        
-        # Enable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = False
-        element_type_dropdown.disabled = False
-        unit_dropdown.disabled = False
-        
-        # Get the patch or layer to edit
-        patch_layer_to_edit = edit_patch_layer_dropdown.value
-        patch_layer_to_edit_recover = patch_layer_to_edit  # Save the patch or layer to edit to recover it later
-        # Transform the string to a list
-        patch_layer_to_edit = eval(patch_layer_to_edit)
+        # Get the patch or layer to edit, and its position in the section
+        position_to_edit, patch_layer_to_edit = selected_element()
         
         # Assign the values of the patch or layer to the dropdowns
         element_type_dropdown.value = patch_layer_to_edit[0]
@@ -708,30 +673,12 @@ def edit_patch_layer(change=None):
         show_section_update()
 
         # Show the actual element to edit (It's useful to debug the code)
-        # edit_patch_layer_dropdown.value = patch_layer_to_edit_recover
+        # edit_patch_layer_dropdown.value = position_to_edit
         
         # Delete the patch or layer to edit from the section
-        try:
-            params = eval(section_params_output.value)
-            if not isinstance(params, list):
-                raise ValueError("Invalid list format")
-        except Exception as e:
-            actual = section_params_output.value
-            section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
-            return
-
-        for item in params:
-            if str(item) == patch_layer_to_edit_recover:
-                params.remove(item)
-                break
-            
-        params_string = str(params).replace("[[", "[\n[")
-        params_string = params_string.replace("], [", "],\n[")
-        params_string = params_string.replace("]]", "]\n]")
-        section_params_output.value = params_string
-        
-        # Update the dropdown to edit the patch or layer
-        update_edit_patch_layer_options()
+        params = list(indexed_section())
+        del params[position_to_edit]
+        set_section_text(core.format_section(params), params)
         
         # Disable the dropdown to edit the patch or layer
         edit_patch_layer_dropdown.disabled = True
@@ -745,18 +692,8 @@ def edit_patch_layer(change=None):
         # Only show the actual section without the new patch or layer
         show_section()
         
-        # Change the button description and color
-        edit_patch_layer_button.description = 'Show'
-        edit_patch_layer_button.style.button_color = 'magenta'
-        
-        # Disable the buttons to save and cancel the patch or layer definition
-        add_patch_layer_button.disabled = True
-        cancel_patch_layer_button.disabled = True
-        
-        # Disable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = True
-        element_type_dropdown.disabled = True
-        unit_dropdown.disabled = True
+        # Disable the buttons and dropdowns to define the patch or layer
+        set_ui_mode('editing_hidden')
         
         # Disable the input widgets to define the patch or layer
         model_widgets.children = []
@@ -768,18 +705,8 @@ def edit_patch_layer(change=None):
         # Show the actual section with the new patch or layer
         show_section_update()
         
-        # Change the button description and color
-        edit_patch_layer_button.description = 'Hide'
-        edit_patch_layer_button.style.button_color = 'blue'
-        
-        # Enable the buttons to save and cancel the patch or layer definition
-        add_patch_layer_button.disabled = False
-        cancel_patch_layer_button.disabled = False
-        
-        # Enable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = False
-        element_type_dropdown.disabled = False
-        unit_dropdown.disabled = False
+        # Enable the buttons and dropdowns to define the patch or layer
+        set_ui_mode('editing')
         
         # Enable the input widgets to define the patch or layer
         update_input_widgets()
@@ -793,42 +720,8 @@ def cancel_patch_layer(change=None):
         # Hide the patch or layer parameters
         model_widgets.children = []
         
-        # Change the button description and color
-        add_patch_layer_button.description = 'Define'
-        add_patch_layer_button.style.button_color = None
-        
-        # Enable the other buttons
-        add_section_button.disabled = False
-        refresh_button.disabled = False
-        video_button.disabled = False
-        code_button.disabled = False
-        cover_button.disabled = False
-        replicate_button.disabled = False
-        CP_button.disabled = False
-        material_button.disabled = False
-        center_button.disabled = False
-        edit_patch_layer_button.disabled = False
-        edit_patch_layer_dropdown.disabled = False
-        
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Edit'
-        
-        # Disable the button to cancel the definition
-        cancel_patch_layer_button.disabled = False
-        # Modify the description of the cancel button and the color
-        cancel_patch_layer_button.description = 'Copy'
-        cancel_patch_layer_button.style.button_color = None
-        
-        # Disable the button to show and hide the new patch or layer
-        edit_patch_layer_button.disabled = False
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Edit'
-        edit_patch_layer_button.style.button_color = None
-        
-        # Disable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = True
-        element_type_dropdown.disabled = True
-        unit_dropdown.disabled = True   
+        # Enable the other actions and disable the dropdowns to define the patch or layer
+        set_ui_mode('idle')
         
         # Clear output
         with out:
@@ -841,48 +734,22 @@ def cancel_patch_layer(change=None):
     
     # If the button is in the 'Copy' state, the function will copy the patch or layer definition.
     elif cancel_patch_layer_button.description == 'Copy':
+        # Verify if there are selected a patch or layer to copy
+        if selected_element()[1] is None:
+            code_params_output.value = "Select a patch or layer to copy"
+            return
+        if selected_element()[1][0] == 'instance':
+            code_params_output.value = "An instance can't be copied. Copy it in the box Fiber Section."
+            return
+
         # See patch or layer parameters
         update_input_widgets()
         
-        # Change the button description and color
-        add_patch_layer_button.description = 'Save'
-        add_patch_layer_button.style.button_color = 'green'
+        # Disable the other actions and enable the buttons and dropdowns to define the patch or layer
+        set_ui_mode('editing')
         
-        # Disable the other buttons
-        add_section_button.disabled = True
-        refresh_button.disabled = True
-        video_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        material_button.disabled = True
-        center_button.disabled = True
-        edit_patch_layer_button.disabled = True
-        edit_patch_layer_dropdown.disabled = True
-        
-        # Enable the button to cancel the definition
-        cancel_patch_layer_button.disabled = False
-        # Modify the description of the cancel button and the color
-        cancel_patch_layer_button.description = 'Delete'
-        cancel_patch_layer_button.style.button_color = 'red'
-        
-        # Enable the button to show and hide the new patch or layer
-        edit_patch_layer_button.disabled = False
-        # Modify the description of the edit button
-        edit_patch_layer_button.description = 'Hide'
-        edit_patch_layer_button.style.button_color = 'blue'
-        
-        # Enable the dropdowns to define the patch or layer
-        patch_layer_type_dropdown.disabled = False
-        element_type_dropdown.disabled = False
-        unit_dropdown.disabled = False
-        
-        # Get the patch or layer to edit
-        patch_layer_to_edit = edit_patch_layer_dropdown.value
-        patch_layer_to_edit_recover = patch_layer_to_edit  # Save the patch or layer to edit to recover it later
-        # Transform the string to a list
-        patch_layer_to_edit = eval(patch_layer_to_edit)
+        # Get the patch or layer to edit, and its position in the section
+        position_to_edit, patch_layer_to_edit = selected_element()
         
         # Assign the values of the patch or layer to the dropdowns
         element_type_dropdown.value = patch_layer_to_edit[0]
@@ -966,7 +833,7 @@ def cancel_patch_layer(change=None):
         show_section_update()
 
         # Show the actual element to edit (It's useful to debug the code)
-        # edit_patch_layer_dropdown.value = patch_layer_to_edit_recover
+        # edit_patch_layer_dropdown.value = position_to_edit
         
         # Disable the dropdown to edit the patch or layer
         edit_patch_layer_dropdown.disabled = True
@@ -979,36 +846,18 @@ def cancel_patch_layer(change=None):
 # Function to save the replicate definition
 def save_replicate(change=None):
     # Copy the value in the cover parameters output into the section parameters output
-    section_params_output.value = replicate_params_output.value
+    set_section_text(replicate_params_output.value)
 
     # Hide the cover parameters
     model_widgets.children = []
     
-    # Enable the button
-    replicate_button.disabled = False
-
-    # Enable the other buttons
-    cover_button.disabled = False
-    add_section_button.disabled = False
-    add_patch_layer_button.disabled = False
-    refresh_button.disabled = False
-    video_button.disabled = False
-    code_button.disabled = False
-    CP_button.disabled = False
-    material_button.disabled = False
-    center_button.disabled = False
-    edit_patch_layer_button.disabled = False
-    edit_patch_layer_dropdown.disabled = False
-    cancel_patch_layer_button.disabled = False
-    section_params_output.disabled = False
+    # Enable the actions on the section
+    set_ui_mode('idle')
     
     # Show the section
     with out:
         out.clear_output()
         show_section()
-    
-    # Update button description
-    save_replicate_button.description = '-'
 
 
 # Function to cancel the replicate definition
@@ -1016,73 +865,38 @@ def delete_replicate(change=None):
     # Hide the cover parameters
     model_widgets.children = []
     
-    # Enable the button
-    replicate_button.disabled = False
-    
-    # Enable the other buttons
-    cover_button.disabled = False
-    add_section_button.disabled = False
-    add_patch_layer_button.disabled = False
-    refresh_button.disabled = False
-    video_button.disabled = False
-    code_button.disabled = False
-    CP_button.disabled = False
-    material_button.disabled = False
-    center_button.disabled = False
-    edit_patch_layer_button.disabled = False
-    edit_patch_layer_dropdown.disabled = False
-    cancel_patch_layer_button.disabled = False
-    section_params_output.disabled = False
+    # Enable the actions on the section
+    set_ui_mode('idle')
     
     # Show the section
     with out:
         out.clear_output()
         show_section()
-    
-    # Update button description
-    save_replicate_button.description = '-'
 
 
 # Function to show the replicate instructions
 def replicate_instructions(change=None):
-    code_params_output.value =  "Define the parameters of the section to replicate."
+    code_params_output.value = """Define the parameters of the section to replicate.
+- linear: #_rep copies, each one displaced (dis_y, dis_z) from the previous.
+- grid: #_rep + 1 rows every dis_y and #_col + 1 columns every dis_z.
+- polar: #_rep copies, each one rotated 'angle' [deg] around (c_y, c_z) from the previous. A rotated rect
+  patch is written as a quad patch.
+The distances are in the units of the element.
+Copies 'instance' writes one line with the element and the list of its copies [dy, dz, angle], instead of one
+line for each copy. The instance can have cover, but it can't be edited."""
 
 # Function to show the section created
 def show_section_replicate(change=None):
     try:
-        params = eval(replicate_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = core.parse_section(replicate_params_output.value)
+    except ValueError:
         actual = replicate_params_output.value
         replicate_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
     
     # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
     graphic_unit = graphic_unit_dropdown.value
-    
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    params = core.convert_units(params, graphic_unit)
                 
     with out:
         # See list to plot programmer window
@@ -1102,419 +916,316 @@ def show_section_replicate(change=None):
 
 # Function auxiliar to modify the fiber section with replicate element
 def fiber_section_replicate(change=None):
-    # This function is similar to fiber_section cover.
-    # Get displacements parameters
-    dis_y_value = float(dis_y.value)
-    dis_z_value = float(dis_z.value)
-    num_copies_value = int(num_copies.value)
-    
-    # Get the patch or layer to edit
-    patch_layer_original = edit_patch_layer_dropdown.value
-    patch_layer_original_recover = patch_layer_original  # Save the patch or layer to edit to recover it later
-    # Transform the string to a list
-    patch_layer_original = eval(patch_layer_original)
-    
-    # Obtain the units of the patch or layer
-    if graphic_unit_dropdown.value == '-':
-        unit = '-'
-    else:
-        parts = patch_layer_original[6].split('*')
-        unit = parts[1]
-    
-    # Function to add unit to the section definition.
-    def unit_patch_layer(value, unit_x, coef):
-        if unit_x == "-":
-            return value
-        else:
-            if coef == 1:
-                return str(value) + f"*{unit_x}"
-            if coef >= 2:
-                return str(value) + f"*{unit_x}**{coef}"
-    
-    # Delete the unit from the values of the patch or layer to operate
-    for term in patch_layer_original:
-        if isinstance(term, str) and '*' in term:
-            parts = term.split('*')
-            patch_layer_original[patch_layer_original.index(term)] = parts[0]
-    
-    # Add the replicate element to the section
-    patch_layer_type = patch_layer_original[0]
-    type_element = patch_layer_original[1]
-    
-    if patch_layer_type == 'patch' and type_element == 'rect':
-        matTag = int(patch_layer_original[2])
-        nFibY = int(patch_layer_original[3])
-        nFibZ = int(patch_layer_original[4])
-        y0 = float(patch_layer_original[5])
-        z0 = float(patch_layer_original[6])
-        y1 = float(patch_layer_original[7])
-        z1 = float(patch_layer_original[8])
-        
-        # Original section without replicate
-        patch_replicate = [['patch', 'rect', matTag, nFibY, nFibZ, 
-                            unit_patch_layer(y0, unit, 1), 
-                            unit_patch_layer(z0, unit, 1),
-                            unit_patch_layer(y1, unit, 1),
-                            unit_patch_layer(z1, unit, 1)]]
-        
-        # Calculate the new patch
-        y0_new, z0_new, y1_new, z1_new = y0, z0, y1, z1
-        for i in range(num_copies_value):
-            i += 1
-            y0_new = y0 + i * dis_y_value
-            z0_new = z0 + i * dis_z_value
-            y1_new = y1 + i * dis_y_value
-            z1_new = z1 + i * dis_z_value
-            
-            # Add the new patch to the section
-            patch_replicate.append(['patch', 'rect', matTag, nFibY, nFibZ,                                     
-                                    unit_patch_layer(y0_new, unit, 1),
-                                    unit_patch_layer(z0_new, unit, 1),
-                                    unit_patch_layer(y1_new, unit, 1),
-                                    unit_patch_layer(z1_new, unit, 1)])
-    
-    elif patch_layer_type == 'patch' and type_element == 'quad':
-        matTag = int(patch_layer_original[2])
-        numSubdivIJ = int(patch_layer_original[3])
-        numSubdivJK = int(patch_layer_original[4])
-        yI = float(patch_layer_original[5])
-        zI = float(patch_layer_original[6])
-        yJ = float(patch_layer_original[7])
-        zJ = float(patch_layer_original[8])
-        yK = float(patch_layer_original[9])
-        zK = float(patch_layer_original[10])
-        yL = float(patch_layer_original[11])
-        zL = float(patch_layer_original[12])
-        
-        # Original section without replicate
-        patch_replicate = [['patch', 'quad', matTag, numSubdivIJ, numSubdivJK,
-                            unit_patch_layer(yI, unit, 1),
-                            unit_patch_layer(zI, unit, 1),
-                            unit_patch_layer(yJ, unit, 1),
-                            unit_patch_layer(zJ, unit, 1),
-                            unit_patch_layer(yK, unit, 1),
-                            unit_patch_layer(zK, unit, 1),
-                            unit_patch_layer(yL, unit, 1),
-                            unit_patch_layer(zL, unit, 1)]]
-        
-        # Calculate the new patch
-        yI_new, zI_new, yJ_new, zJ_new, yK_new, zK_new, yL_new, zL_new = yI, zI, yJ, zJ, yK, zK, yL, zL
-        for i in range(num_copies_value):
-            i += 1
-            yI_new = yI + i * dis_y_value
-            zI_new = zI + i * dis_z_value
-            yJ_new = yJ + i * dis_y_value
-            zJ_new = zJ + i * dis_z_value
-            yK_new = yK + i * dis_y_value
-            zK_new = zK + i * dis_z_value
-            yL_new = yL + i * dis_y_value
-            zL_new = zL + i * dis_z_value
-            
-            # Add the new patch to the section
-            patch_replicate.append(['patch', 'quad', matTag, numSubdivIJ, numSubdivJK,
-                                    unit_patch_layer(yI_new, unit, 1),
-                                    unit_patch_layer(zI_new, unit, 1),
-                                    unit_patch_layer(yJ_new, unit, 1),
-                                    unit_patch_layer(zJ_new, unit, 1),
-                                    unit_patch_layer(yK_new, unit, 1),
-                                    unit_patch_layer(zK_new, unit, 1),
-                                    unit_patch_layer(yL_new, unit, 1),
-                                    unit_patch_layer(zL_new, unit, 1)])
-    
-    elif patch_layer_type == 'patch' and type_element == 'circ':
-        matTag = int(patch_layer_original[2])
-        numSubdivCirc = int(patch_layer_original[3])
-        numSubdivRad = int(patch_layer_original[4])
-        yc = float(patch_layer_original[5])
-        zc = float(patch_layer_original[6])
-        r_ini = float(patch_layer_original[7])
-        r_end = float(patch_layer_original[8])
-        ang_ini = float(patch_layer_original[9])
-        ang_end = float(patch_layer_original[10])
-        
-        # Original section without replicate
-        patch_replicate = [['patch', 'circ', matTag, numSubdivCirc, numSubdivRad,
-                            unit_patch_layer(yc, unit, 1),
-                            unit_patch_layer(zc, unit, 1),
-                            unit_patch_layer(r_ini, unit, 1),
-                            unit_patch_layer(r_end, unit, 1),
-                            unit_patch_layer(ang_ini, unit, 1),
-                            unit_patch_layer(ang_end, unit, 1)]]
-        
-        # Calculate the new patch
-        yc_new, zc_new, r_ini_new, r_end_new, ang_ini_new, ang_end_new = yc, zc, r_ini, r_end, ang_ini, ang_end
-        for i in range(num_copies_value):
-            i += 1
-            yc_new = yc + i * dis_y_value
-            zc_new = zc + i * dis_z_value
-            r_ini_new = r_ini
-            r_end_new = r_end
-            ang_ini_new = ang_ini
-            ang_end_new = ang_end
-            
-            # Add the new patch to the section
-            patch_replicate.append(['patch', 'circ', matTag, numSubdivCirc, numSubdivRad,
-                                    unit_patch_layer(yc_new, unit, 1),
-                                    unit_patch_layer(zc_new, unit, 1),
-                                    unit_patch_layer(r_ini_new, unit, 1),
-                                    unit_patch_layer(r_end_new, unit, 1),
-                                    unit_patch_layer(ang_ini_new, unit, 1),
-                                    unit_patch_layer(ang_end_new, unit, 1)])
-    
-    elif patch_layer_type == 'layer' and type_element == 'straight':
-        matTag = int(patch_layer_original[2])
-        numFiber = int(patch_layer_original[3])
-        areaFiber = float(patch_layer_original[4])
-        y1 = float(patch_layer_original[5])
-        z1 = float(patch_layer_original[6])
-        y2 = float(patch_layer_original[7])
-        z2 = float(patch_layer_original[8])
-        
-        # Original section without replicate
-        patch_replicate = [['layer', 'straight', matTag, numFiber, 
-                            unit_patch_layer(areaFiber, unit, 2),
-                            unit_patch_layer(y1, unit, 1),
-                            unit_patch_layer(z1, unit, 1),
-                            unit_patch_layer(y2, unit, 1),
-                            unit_patch_layer(z2, unit, 1)]]
-        
-        # Calculate the new patch
-        y1_new, z1_new, y2_new, z2_new = y1, z1, y2, z2
-        for i in range(num_copies_value):
-            i += 1
-            y1_new = y1 + i * dis_y_value
-            z1_new = z1 + i * dis_z_value
-            y2_new = y2 + i * dis_y_value
-            z2_new = z2 + i * dis_z_value
-            
-            # Add the new patch to the section
-            patch_replicate.append(['layer', 'straight', matTag, numFiber, 
-                                    unit_patch_layer(areaFiber, unit, 2),
-                                    unit_patch_layer(y1_new, unit, 1),
-                                    unit_patch_layer(z1_new, unit, 1),
-                                    unit_patch_layer(y2_new, unit, 1),
-                                    unit_patch_layer(z2_new, unit, 1)])
-    
-    elif patch_layer_type == 'layer' and type_element == 'circ':
-        matTag = int(patch_layer_original[2])
-        numFiber = int(patch_layer_original[3])
-        areaFiber = float(patch_layer_original[4])
-        yc = float(patch_layer_original[5])
-        zc = float(patch_layer_original[6])
-        radius = float(patch_layer_original[7])
-        ang_ini = float(patch_layer_original[8])
-        ang_end = float(patch_layer_original[9])
-        
-        # Original section without replicate
-        patch_replicate = [['layer', 'circ', matTag, numFiber,
-                            unit_patch_layer(areaFiber, unit, 2),
-                            unit_patch_layer(yc, unit, 1),
-                            unit_patch_layer(zc, unit, 1),
-                            unit_patch_layer(radius, unit, 1),
-                            unit_patch_layer(ang_ini, unit, 1),
-                            unit_patch_layer(ang_end, unit, 1)]]
-        
-        # Calculate the new patch
-        yc_new, zc_new = yc, zc
-        for i in range(num_copies_value):
-            i += 1
-            yc_new = yc + i * dis_y_value
-            zc_new = zc + i * dis_z_value
-            
-            # Add the new patch to the section
-            patch_replicate.append(['layer', 'circ', matTag, numFiber,
-                                    unit_patch_layer(areaFiber, unit, 2),
-                                    unit_patch_layer(yc_new, unit, 1),
-                                    unit_patch_layer(zc_new, unit, 1),
-                                    unit_patch_layer(radius, unit, 1),
-                                    unit_patch_layer(ang_ini, unit, 1),
-                                    unit_patch_layer(ang_end, unit, 1)])
-    
-    else:
-        code_params_output.value = "Error: The replicate element is not a rectangular patch"
-        return
-    
-    # Delete the patch or layer to edit from the section
+    # Get the patch or layer to edit, and its position in the section
+    position, patch_layer_original = selected_element()
+
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = core.parse_section(section_params_output.value)
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
-    for item in params:
-        if str(item) == patch_layer_original_recover:
-            params.remove(item)
-            break
-    
-    # Add the replicate element to the section
-    params = params + patch_replicate
-    
+    # Replace the patch or layer by the replicates (pattern linear, grid or polar)
+    try:
+        params = core.section_replicate(params, patch_layer_original, int(num_copies.value), float(dis_y.value),
+                                        float(dis_z.value), position, replicate_pattern_dropdown.value,
+                                        replicate_copies_dropdown.value,
+                                        num_columns=int(num_columns.value), angle=float(rep_angle.value),
+                                        center_y=float(center_y.value), center_z=float(center_z.value))
+    except ValueError as e:
+        code_params_output.value = f"Error: {e}"
+        return
+
     # Show the section with the replicate element
-    params_string = str(params).replace("[[", "[\n[")
-    params_string = params_string.replace("], [", "],\n[")
-    params_string = params_string.replace("]]", "]\n]")
-    
-    replicate_params_output.value = params_string
-    
-    # Show the section with replicate element
+    replicate_params_output.value = core.format_section(params)
     show_section_replicate()
 
 
 # Function to add replicate definition
 def replicate(change=None):
     # Verify that the element selected is a element
-    selected_patch_layer = edit_patch_layer_dropdown.value
-    if selected_patch_layer == '-':
+    selected_patch_layer = selected_element()[1]
+    if selected_patch_layer is None:
         code_params_output.value = "Error: Select a rect patch to replicate."
         return
     
-    # Disable the button
-    replicate_button.disabled = True
-    
-    # Disable the other buttons
-    cover_button.disabled = True
-    add_section_button.disabled = True
-    add_patch_layer_button.disabled = True
-    refresh_button.disabled = True
-    video_button.disabled = True
-    code_button.disabled = True
-    CP_button.disabled = True
-    material_button.disabled = True
-    center_button.disabled = True
-    edit_patch_layer_button.disabled = True
-    edit_patch_layer_dropdown.disabled = True
-    cancel_patch_layer_button.disabled = True
-    section_params_output.disabled = True
-    
-    # Update button description
-    save_replicate_button.description = 'Save'
+    # Disable the actions on the section while the replicate is defined
+    set_ui_mode('replicate')
     
     # Show widgets of interest
+    build_replicate_panel()
+    show_replicate_panel()
+    
+    # Calculate the section with the replicate element and show it
+    fiber_section_replicate()
+
+
+# Function to show the widgets of the replicate pattern selected
+def show_replicate_panel(change=None):
     button_box_cover = widgets.HBox([save_replicate_button, cancel_replicate_button])
-    text_box_repli_1 = widgets.VBox([num_copies], layout=widgets.Layout(width='100px'))
-    text_box_repli_2 = widgets.VBox([dis_y, dis_z], layout=widgets.Layout(width='100px'))
+    if replicate_pattern_dropdown.value == 'grid':
+        text_box_repli_1 = widgets.VBox([num_copies, num_columns], layout=widgets.Layout(width='100px'))
+        text_box_repli_2 = widgets.VBox([dis_y, dis_z], layout=widgets.Layout(width='100px'))
+    elif replicate_pattern_dropdown.value == 'polar':
+        text_box_repli_1 = widgets.VBox([num_copies, rep_angle], layout=widgets.Layout(width='100px'))
+        text_box_repli_2 = widgets.VBox([center_y, center_z], layout=widgets.Layout(width='100px'))
+    else:
+        text_box_repli_1 = widgets.VBox([num_copies], layout=widgets.Layout(width='100px'))
+        text_box_repli_2 = widgets.VBox([dis_y, dis_z], layout=widgets.Layout(width='100px'))
     text_box_repli = widgets.HBox([text_box_repli_1, text_box_repli_2])
     text_replicate_out = widgets.HTML(value="Section with Replicates:", layout=widgets.Layout(margin="9px 0 0 2px"))
     text_replicate_out.style.font_size = '14px'
-    model_widgets.children = [replicate_instructions_button, text_box_repli,
+    model_widgets.children = [replicate_instructions_button, replicate_pattern_dropdown, replicate_copies_dropdown,
+        text_box_repli,
         button_box_cover, text_replicate_out, replicate_params_output]
-    
-    # Calculate the section with the replicate element and show it
+
+
+# Function to change the replicate pattern
+def change_replicate_pattern(change=None):
+    show_replicate_panel()
     fiber_section_replicate()
 
 
+# %%%% [03-02-03] TRANSFORM
+# Function to obtain the positions of the elements of a scope ('selected', 'filtered' or 'all')
+def scope_positions(scope):
+    """
+    Returns:
+        list: Positions of the selected element or of the filtered elements, or None for all the elements.
+    """
+    if scope == 'selected':
+        position = selected_element()[0]
+        if position is None:
+            raise ValueError("Select an element in the list 'Edit Patch/Layer'.")
+        return [position]
+    if scope == 'filtered':
+        return EI.filter_elements(indexed_elements(), **element_filters()).tolist()
+    return None
+
+
+# Function to calculate the section with the elements transformed and show it
+def fiber_section_transform(change=None):
+    if ui_state['mode'] != 'transform':
+        return
+    try:
+        params = indexed_section()
+        params = core.transform_section(params, graphic_unit_dropdown.value,
+                                        scope_positions(transform_scope_dropdown.value),
+                                        float(tr_angle.value), tr_mirror_dropdown.value, float(tr_dy.value),
+                                        float(tr_dz.value), (float(tr_cy.value), float(tr_cz.value)))
+    except ValueError as e:
+        code_params_output.value = f"Error: {e}"
+        return
+    transform_params_output.value = core.format_section(params)
+    show_section(section=params)
+    code_params_output.value = "Transform the elements and save the section using the button 'Save'"
+
+
+# Function to define the rotation, mirror and displacement of elements
+def transform(change=None):
+    set_ui_mode('transform')
+    build_transform_panel()
+    text_box_tr_1 = widgets.VBox([tr_angle, tr_dy, tr_cy], layout=widgets.Layout(width='100px'))
+    text_box_tr_2 = widgets.VBox([tr_mirror_dropdown, tr_dz, tr_cz], layout=widgets.Layout(width='100px'))
+    text_transform_out = widgets.HTML(value="Section transformed:", layout=widgets.Layout(margin="9px 0 0 2px"))
+    text_transform_out.style.font_size = '14px'
+    model_widgets.children = [transform_scope_dropdown, widgets.HBox([text_box_tr_1, text_box_tr_2]),
+                              widgets.HBox([save_transform_button, cancel_transform_button]), text_transform_out,
+                              transform_params_output]
+    code_params_output.value = """Transform the elements: the point p is moved to M (p - c) + c + (dy, dz).
+- M: mirror ('y -> -y' or 'z -> -z') and then rotation 'angle' [deg] from y to z, around c = (c_y, c_z).
+- dy, dz and c are in the Graphic Unit. A rect patch rotated an angle that is not a multiple of 90 deg is written
+  as a quad patch.
+'Apply to' transforms the selected element, the elements of the filters of the list 'Edit Patch/Layer' or all
+the elements."""
+    fiber_section_transform()
+
+
+# Function to save or cancel the transform
+def save_transform(button):
+    if button is save_transform_button:
+        set_section_text(transform_params_output.value)
+    model_widgets.children = []
+    set_ui_mode('idle')
+    show_section()
+
+
+# %%%% [03-02-03] MESH
+# Section with the subdivisions of the mesh panel (None if the parameters are not valid)
+mesh_state = {'section': None}
+
+
+# Function to calculate the subdivisions of the patches and estimate the number of fibers (without plotting)
+def estimate_mesh(change=None):
+    mesh_state['section'] = None
+    if ui_state['mode'] != 'mesh':
+        return
+    try:
+        section = indexed_section()
+        value = float(mesh_value_input.value)
+        options = {'fiber_size': value} if mesh_mode_dropdown.value == 'size' else {'max_fibers': int(value)}
+        meshed, fiber_size, n_fibers = core.auto_mesh(section, graphic_unit_dropdown.value,
+                                                      positions=scope_positions(mesh_scope_dropdown.value), **options)
+    except ValueError as e:
+        mesh_estimate_text.value = f"<span style='color:red'>{e}</span>"
+        return
+    mesh_state['section'] = meshed
+    mesh_estimate_text.value = (f"Fibers: {FT.fiber_count(section)} &rarr; <b>{n_fibers}</b><br>"
+                                f"Fiber size: {fiber_size:.4g} {graphic_unit_dropdown.value}")
+
+
+# Function to show the section with the new subdivisions
+def preview_mesh(change=None):
+    if mesh_state['section'] is not None:
+        show_section(section=mesh_state['section'])
+        code_params_output.value = "Save the subdivisions of the patches using the button 'Save'"
+
+
+# Function to change the parameter of the mesh (fiber size or number of fibers)
+def change_mesh_mode(change=None):
+    if mesh_mode_dropdown.value == 'size':
+        # A fiber size of 1/20 of the section
+        boxes = indexed_elements()['bbox']
+        boxes = boxes[~(boxes != boxes).any(axis=1)]
+        size = 1.0
+        if len(boxes):
+            size = max(boxes[:, 2].max() - boxes[:, 0].min(), boxes[:, 3].max() - boxes[:, 1].min()) / 20.0
+        mesh_value_input.description = 'size:'
+        mesh_value_input.value = f"{size:.3g}"
+    else:
+        mesh_value_input.description = 'fibers:'
+        mesh_value_input.value = str(FT.fiber_count(indexed_section()))
+    estimate_mesh()
+
+
+# Function to define the subdivisions of the patches automatically
+def mesh(change=None):
+    try:
+        indexed_section()
+    except ValueError:
+        code_params_output.value = "Error: Check the actual section parameters."
+        return
+    set_ui_mode('mesh')
+    build_mesh_panel()
+    text_mesh = widgets.HTML(value="Mesh density:")
+    text_mesh.style.font_size = '14px'
+    text_coarsen = widgets.HTML(value="Coarse fibers (OpenSeesPy):", layout=widgets.Layout(margin="9px 0 0 2px"))
+    text_coarsen.style.font_size = '14px'
+    model_widgets.children = [text_mesh, mesh_scope_dropdown, mesh_mode_dropdown, mesh_value_input,
+                              mesh_estimate_text,
+                              widgets.HBox([preview_mesh_button, save_mesh_button, cancel_mesh_button]),
+                              text_coarsen, widgets.HBox([coarsen_tolerance_input, export_fibers_button])]
+    code_params_output.value = """Choose the subdivisions of the patches (nFibY/nFibZ, numSubdivIJ/numSubdivJK,
+numSubdivCirc/numSubdivRad) from:
+- fiber size: maximum size of the fibers, in the Graphic Unit.
+- fiber budget: maximum number of fibers of the section (with the layers and the patches that are not changed).
+The number of fibers is estimated without plotting the section; 'Preview' plots it and 'Save' writes it.
+'Export' writes the fibers of the section as ops.fiber commands, joining the fibers of each matTag with a
+maximum relative error 'tol' in Iz, Iy and Iyz (the area and the first moments don't change).
+'Apply to' changes the selected patch, the patches of the filters of the list 'Edit Patch/Layer' or all the
+patches."""
+    change_mesh_mode()
+
+
+# Function to write the fibers of the section, coarsened, as commands of OpenSeesPy
+def export_coarse_fibers(change=None):
+    # Section with the subdivisions of the panel, or the actual section
+    section = mesh_state['section'] if mesh_state['section'] is not None else indexed_section()
+    try:
+        fibers = FT.fiber_table(core.convert_units(section, graphic_unit_dropdown.value))
+        coarse = CO.coarsen_fibers(fibers, float(coarsen_tolerance_input.value))
+    except ValueError as e:
+        code_params_output.value = f"Error: {e}"
+        return
+    sec_tag, GJ = (section[0][2], section[0][4]) if section and section[0][0] == 'section' else (1, 1.0e6)
+    code_params_output.value = CO.fiber_commands(coarse, sec_tag, GJ, graphic_unit_dropdown.value,
+                                                 n_original=len(fibers['y']))
+
+
+# Function to save or cancel the mesh
+def save_mesh(button):
+    if button is save_mesh_button and mesh_state['section'] is not None:
+        section = mesh_state['section']
+        set_section_text(core.format_section(section), section)
+    model_widgets.children = []
+    set_ui_mode('idle')
+    show_section()
+
+
+# %%%% [03-02-03] CHECK
+# Function to check the overlaps, gaps and bars outside the patches (see S01_GUI01_A20_SectionCheck.py)
+def check_fiber_section(button=None):
+    try:
+        section = indexed_section()
+    except ValueError:
+        code_params_output.value = "Error: Check the actual section parameters."
+        return
+    graphic_unit = graphic_unit_dropdown.value
+    try:
+        check = SC.check_section(core.convert_units(section, graphic_unit))
+    except (ValueError, TypeError, IndexError, KeyError) as e:
+        code_params_output.value = f"Error in the check of the section: {e}"
+        return
+
+    # Section with the elements with problems highlighted, and the report in the output window
+    show_highlighted_section(section, check['positions'])
+    code_params_output.value = SC.check_report(check, section, graphic_unit)
+
+
 # %%%% [03-02-03] COVER 
 # Function to save the cover definition
 def save_cover(change=None):
     # Copy the value in the cover parameters output into the section parameters output
-    section_params_output.value = cover_params_output.value
+    set_section_text(cover_params_output.value)
 
     # Hide the cover parameters
     model_widgets.children = []
     
-    # Enable the button
-    cover_button.disabled = False
-    
-    # Enable the other buttons
-    replicate_button.disabled = False
-    add_section_button.disabled = False
-    add_patch_layer_button.disabled = False
-    refresh_button.disabled = False
-    video_button.disabled = False
-    code_button.disabled = False
-    CP_button.disabled = False
-    material_button.disabled = False
-    center_button.disabled = False
-    edit_patch_layer_button.disabled = False
-    edit_patch_layer_dropdown.disabled = False
-    cancel_patch_layer_button.disabled = False
-    section_params_output.disabled = False
+    # Enable the actions on the section
+    set_ui_mode('idle')
     
     # Show the section
     with out:
         out.clear_output()
         show_section()
 
-    # Update button description
-    save_cover_button.description = '-'
-
 
 # Function to cancel the cover definition
 def delete_cover(change=None):
     # Hide the cover parameters
     model_widgets.children = []
     
-    # Enable the button
-    cover_button.disabled = False
-    
-    # Enable the other buttons
-    replicate_button.disabled = False
-    add_section_button.disabled = False
-    add_patch_layer_button.disabled = False
-    refresh_button.disabled = False
-    video_button.disabled = False
-    code_button.disabled = False
-    CP_button.disabled = False
-    material_button.disabled = False
-    center_button.disabled = False
-    edit_patch_layer_button.disabled = False
-    edit_patch_layer_dropdown.disabled = False
-    cancel_patch_layer_button.disabled = False
-    section_params_output.disabled = False
+    # Enable the actions on the section
+    set_ui_mode('idle')
     
     # Show the section
     with out:
         out.clear_output()
         show_section()
-    
-    # Update button description
-    save_cover_button.description = '-'
 
 
 # Function to show the cover instructions
 def cover_instructions(change=None):
-    code_params_output.value = "Define the cover parameters"
+    code_params_output.value = """Define the cover parameters.
+- rect and quad patches: cov_L, cov_R, cov_U and cov_B (in a quad patch, next to the sides IJ, KL, JK and LI).
+- circ patches: cov_i and cov_e (next to the inner and outer radius).
+'Apply to' adds the cover to the selected patch, to all the patches with its matTag, or to all the patches of
+the section in one operation. The patches with cover are written at the end of the section."""
 
 
 # Function to show the section created
 def show_section_cover(change=None):
     try:
-        params = eval(cover_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = core.parse_section(cover_params_output.value)
+    except ValueError:
         actual = cover_params_output.value
         cover_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
     # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
     graphic_unit = graphic_unit_dropdown.value
-
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    params = core.convert_units(params, graphic_unit)
 
     with out:
         # See list to plot programmer window
@@ -1534,319 +1245,49 @@ def show_section_cover(change=None):
 
 # Function auxiliar to modify the fiber section with cover
 def fiber_section_cover(change=None):
-    
-    # Get the patch to edit
-    patch_original = edit_patch_layer_dropdown.value
-    patch_original_recover = patch_original  # Save the patch or layer to edit to recover it later
-    # Transform the string to a list
-    patch_original = eval(patch_original)
-    
-    # Obtain the units of the patch or layer
-    if graphic_unit_dropdown.value == '-':
-        unit = '-'
-    else:
-        parts = patch_original[6].split('*')
-        unit = parts[1]
-    
-    # Function to add unit to the section definition.
-    def unit_patch_layer(value, unit_x, coef):
-        if unit_x == "-":
-            return value
-        else:
-            if coef == 1:
-                return str(value) + f"*{unit_x}"
-            if coef >= 2:
-                return str(value) + f"*{unit_x}**{coef}"
-    
-    # Delete the unit from the values of the patch or layer to operate
-    for term in patch_original:
-        if isinstance(term, str) and '*' in term:
-            parts = term.split('*')
-            patch_original[patch_original.index(term)] = parts[0]
-    
-    # Add cover to the patch rect
-    patch_layer_type = patch_original[0]
-    type_element = patch_original[1]
-    
-    if patch_layer_type == 'patch' and type_element == 'rect':
-        # Get cover parameters
-        cov_Left = float(cov_L.value)
-        cov_Right = float(cov_R.value)
-        cov_Up = float(cov_U.value)
-        cov_Below = float(cov_B.value)
-        
-        # Get the original rect patch parameters
-        matTag = int(patch_original[2])
-        nFibY = int(patch_original[3])
-        nFibZ = int(patch_original[4])
-        y0 = float(patch_original[5])
-        z0 = float(patch_original[6])
-        y1 = float(patch_original[7])
-        z1 = float(patch_original[8])
-        
-        # Modify the original rect patch
-        patch_modificado = [['patch', 'rect', matTag, nFibY, nFibZ, 
-                             unit_patch_layer(y0 + cov_Below, unit, 1), 
-                             unit_patch_layer(z0 + cov_Left, unit, 1), 
-                             unit_patch_layer(y1 - cov_Up, unit, 1), 
-                             unit_patch_layer(z1 - cov_Right, unit, 1)]]
-
-        # Add the cover to the rect patch
-        # Left
-        if cov_Left > 0:
-            patch_modificado.append(['patch', 'rect', matTag+1, nFibY, 1, 
-                                    unit_patch_layer(y0 + cov_Below, unit, 1), 
-                                    unit_patch_layer(z0, unit, 1), 
-                                    unit_patch_layer(y1 - cov_Up, unit, 1), 
-                                    unit_patch_layer(z0 + cov_Left, unit, 1)])
-        # Rigth
-        if cov_Right > 0:
-            patch_modificado.append(['patch', 'rect', matTag+1, nFibY, 1, 
-                                    unit_patch_layer(y0 + cov_Below, unit, 1), 
-                                    unit_patch_layer(z1 - cov_Right, unit, 1), 
-                                    unit_patch_layer(y1 - cov_Up, unit, 1), 
-                                    unit_patch_layer(z1, unit, 1)])
-        # Below
-        if cov_Below > 0:
-            patch_modificado.append(['patch', 'rect', matTag+1, 1, nFibZ, 
-                                    unit_patch_layer(y0, unit, 1), 
-                                    unit_patch_layer(z0, unit, 1), 
-                                    unit_patch_layer(y0 + cov_Below, unit, 1), 
-                                    unit_patch_layer(z1, unit, 1)])
-        # Up
-        if cov_Up > 0:
-            patch_modificado.append(['patch', 'rect', matTag+1, 1, nFibZ, 
-                                    unit_patch_layer(y1 - cov_Up, unit, 1), 
-                                    unit_patch_layer(y0, unit, 1), 
-                                    unit_patch_layer(y1, unit, 1), 
-                                    unit_patch_layer(z1, unit, 1)])
-
-
-    elif patch_layer_type == 'patch' and type_element == 'quad':
-        # Get cover parameters
-        cov_Left = float(cov_L.value)
-        cov_Right = float(cov_R.value)
-        cov_Up = float(cov_U.value)
-        cov_Below = float(cov_B.value)
-        
-        # Get the original quad patch parameters
-        matTag = int(patch_original[2])
-        numSubdivIJ = int(patch_original[3])
-        numSubdivJK = int(patch_original[4])
-        yI = float(patch_original[5])
-        zI = float(patch_original[6])
-        yJ = float(patch_original[7])
-        zJ = float(patch_original[8])
-        yK = float(patch_original[9])
-        zK = float(patch_original[10])
-        yL = float(patch_original[11])
-        zL = float(patch_original[12])
-        
-        # Calculate the points of cover between the original points.
-        # The quad element is defined by the point I, J, K, L draw
-        # in the counter-clockwise direction.
-        # The left cover is between the points I and J.
-        # The up cover is between the points J and K.
-        # The right cover is between the points K and L.
-        # The below cover is between the points L and I.
-        # The coordinates of the points are (y, z).
-        # Function to calculate the distance between two points.
-        def distance_between_points(y1, z1, y2, z2):
-            return ((y2 - y1)**2 + (z2 - z1)**2)**0.5
-        # Calculate the coordinate of a point between two points, and a distance dist to the first point.
-        def point_between_points(y1, z1, y2, z2, dist):
-            total_dist = distance_between_points(y1, z1, y2, z2)
-            y = y1 + (y2 - y1) * dist / total_dist
-            z = z1 + (z2 - z1) * dist / total_dist
-            return y, z
-        # Calculate the coordinates of the points of the cover.
-        # Points in the IJ side
-        dist_IJ = distance_between_points(yI, zI, yJ, zJ)
-        yIJ_U, zIJ_U = point_between_points(yI, zI, yJ, zJ, dist_IJ-cov_Up)
-        yIJ_B, zIJ_B = point_between_points(yI, zI, yJ, zJ, cov_Below)
-        # Points in the LK side
-        dist_LK = distance_between_points(yL, zL, yK, zK)
-        yLK_U, zLK_U = point_between_points(yL, zL, yK, zK, dist_LK-cov_Up)
-        yLK_B, zLK_B = point_between_points(yL, zL, yK, zK, cov_Below)
-        
-        # Points between the IJ_U and LK_U points
-        dist_IJ_LK_U = distance_between_points(yIJ_U, zIJ_U, yLK_U, zLK_U)
-        yIJ_LK_U_L, zIJ_LK_U_L = point_between_points(yIJ_U, zIJ_U, yLK_U, zLK_U, cov_Left)
-        yIJ_LK_U_R, zIJ_LK_U_R = point_between_points(yIJ_U, zIJ_U, yLK_U, zLK_U, dist_IJ_LK_U-cov_Right)
-        # Points between the IJ_B and LK_B points
-        dist_IJ_LK_B = distance_between_points(yIJ_B, zIJ_B, yLK_B, zLK_B)
-        yIJ_LK_B_L, zIJ_LK_B_L = point_between_points(yIJ_B, zIJ_B, yLK_B, zLK_B, cov_Left)
-        yIJ_LK_B_R, zIJ_LK_B_R = point_between_points(yIJ_B, zIJ_B, yLK_B, zLK_B, dist_IJ_LK_B-cov_Right)
-
-        # Round the coordinates
-        num_decimals = 4
-        yIJ_U = round(yIJ_U, num_decimals)
-        zIJ_U = round(zIJ_U, num_decimals)
-        yIJ_B = round(yIJ_B, num_decimals)
-        zIJ_B = round(zIJ_B, num_decimals)
-        yLK_U = round(yLK_U, num_decimals)
-        zLK_U = round(zLK_U, num_decimals)
-        yLK_B = round(yLK_B, num_decimals)
-        zLK_B = round(zLK_B, num_decimals)
-        yIJ_LK_U_L = round(yIJ_LK_U_L, num_decimals)
-        zIJ_LK_U_L = round(zIJ_LK_U_L, num_decimals)
-        yIJ_LK_U_R = round(yIJ_LK_U_R, num_decimals)
-        zIJ_LK_U_R = round(zIJ_LK_U_R, num_decimals)
-        yIJ_LK_B_L = round(yIJ_LK_B_L, num_decimals)
-        zIJ_LK_B_L = round(zIJ_LK_B_L, num_decimals)
-        yIJ_LK_B_R = round(yIJ_LK_B_R, num_decimals)
-        zIJ_LK_B_R = round(zIJ_LK_B_R, num_decimals)
+    # Get the patch to edit, and its position in the section
+    position, patch_original = selected_element()
+
+    # Get cover parameters (each patch uses the cover of its type, the cover of an instance is added to its base
+    # element)
+    cover = {'left': float(cov_L.value), 'right': float(cov_R.value), 'up': float(cov_U.value),
+             'below': float(cov_B.value), 'inner': float(cover_i.value), 'outer': float(cover_e.value)}
 
-        
-        # Modify the original quad patch
-        patch_modificado = [['patch', 'quad', matTag, numSubdivIJ, numSubdivJK,
-                            unit_patch_layer(yIJ_LK_B_L, unit, 1),
-                            unit_patch_layer(zIJ_LK_B_L, unit, 1),
-                            unit_patch_layer(yIJ_LK_U_L, unit, 1), 
-                            unit_patch_layer(zIJ_LK_U_L, unit, 1), 
-                            unit_patch_layer(yIJ_LK_U_R, unit, 1), 
-                            unit_patch_layer(zIJ_LK_U_R, unit, 1),
-                            unit_patch_layer(yIJ_LK_B_R, unit, 1),
-                            unit_patch_layer(zIJ_LK_B_R, unit, 1)]]
-        
-        # Add the cover to the quad patch
-        # Left
-        if cov_Left > 0:
-            patch_modificado.append(['patch', 'quad', matTag+1, numSubdivIJ, 1, 
-                                    unit_patch_layer(yIJ_B, unit, 1),
-                                    unit_patch_layer(zIJ_B, unit, 1),
-                                    unit_patch_layer(yIJ_U, unit, 1),
-                                    unit_patch_layer(zIJ_U, unit, 1),
-                                    unit_patch_layer(yIJ_LK_U_L, unit, 1),
-                                    unit_patch_layer(zIJ_LK_U_L, unit, 1),
-                                    unit_patch_layer(yIJ_LK_B_L, unit, 1),
-                                    unit_patch_layer(zIJ_LK_B_L, unit, 1)])
-                                    
-        # Rigth
-        if cov_Right > 0:
-            patch_modificado.append(['patch', 'quad', matTag+1, numSubdivIJ, 1, 
-                                    unit_patch_layer(yIJ_LK_B_R, unit, 1),
-                                    unit_patch_layer(zIJ_LK_B_R, unit, 1),
-                                    unit_patch_layer(yIJ_LK_U_R, unit, 1),
-                                    unit_patch_layer(zIJ_LK_U_R, unit, 1),
-                                    unit_patch_layer(yLK_U, unit, 1),
-                                    unit_patch_layer(zLK_U, unit, 1),
-                                    unit_patch_layer(yLK_B, unit, 1),
-                                    unit_patch_layer(zLK_B, unit, 1)])
-                                     
-        # Below
-        if cov_Below > 0:
-            patch_modificado.append(['patch', 'quad', matTag+1, 1, numSubdivJK,
-                                    unit_patch_layer(yI, unit, 1), 
-                                    unit_patch_layer(zI, unit, 1), 
-                                    unit_patch_layer(yIJ_B, unit, 1),
-                                    unit_patch_layer(zIJ_B, unit, 1),
-                                    unit_patch_layer(yLK_B, unit, 1),
-                                    unit_patch_layer(zLK_B, unit, 1),
-                                    unit_patch_layer(yL, unit, 1),
-                                    unit_patch_layer(zL, unit, 1)])
-                                    
-        # Up
-        if cov_Up > 0:
-            patch_modificado.append(['patch', 'quad', matTag+1, 1, numSubdivJK,
-                                    unit_patch_layer(yIJ_U, unit, 1),
-                                    unit_patch_layer(zIJ_U, unit, 1),
-                                    unit_patch_layer(yJ, unit, 1),
-                                    unit_patch_layer(zJ, unit, 1),
-                                    unit_patch_layer(yK, unit, 1),
-                                    unit_patch_layer(zK, unit, 1),
-                                    unit_patch_layer(yLK_U, unit, 1),
-                                    unit_patch_layer(zLK_U, unit, 1)])
-    
-    elif patch_layer_type == 'patch' and type_element == 'circ':
-        
-        # Get cover parameters
-        cover_ini = float(cover_i.value)
-        cover_end = float(cover_e.value)
-        
-        # Get the original circ patch parameters
-        matTag = int(patch_original[2])
-        numSubdivCirc = int(patch_original[3])
-        numSubdivRad = int(patch_original[4])
-        yc = float(patch_original[5])
-        zc = float(patch_original[6])
-        r_ini = float(patch_original[7])
-        r_end = float(patch_original[8])
-        ang_ini = float(patch_original[9])
-        ang_end = float(patch_original[10])
-        
-        # Modify the original circ patch
-        patch_modificado = [['patch', 'circ', matTag, numSubdivCirc, numSubdivRad, 
-                             unit_patch_layer(yc, unit, 1), 
-                             unit_patch_layer(zc, unit, 1), 
-                             unit_patch_layer(r_ini + cover_ini, unit, 1),
-                             unit_patch_layer(r_end - cover_end, unit, 1),
-                             unit_patch_layer(ang_ini, unit, 1),
-                             unit_patch_layer(ang_end, unit, 1)]]
-        
-        # Add the cover to the circ patch
-        # Inner cover
-        if cover_ini > 0:
-            patch_modificado.append(['patch', 'circ', matTag+1, numSubdivCirc, 1, 
-                                    unit_patch_layer(yc, unit, 1), 
-                                    unit_patch_layer(zc, unit, 1), 
-                                    unit_patch_layer(r_ini, unit, 1),
-                                    unit_patch_layer(r_ini + cover_ini, unit, 1),
-                                    unit_patch_layer(ang_ini, unit, 1),
-                                    unit_patch_layer(ang_end, unit, 1)])
-        # Outer cover
-        if cover_end > 0:
-            patch_modificado.append(['patch', 'circ', matTag+1, numSubdivCirc, 1, 
-                                    unit_patch_layer(yc, unit, 1), 
-                                    unit_patch_layer(zc, unit, 1), 
-                                    unit_patch_layer(r_end - cover_end, unit, 1),
-                                    unit_patch_layer(r_end, unit, 1),
-                                    unit_patch_layer(ang_ini, unit, 1),
-                                    unit_patch_layer(ang_end, unit, 1)])
-        
-    else:
-        cover_params_output.value = "Error: The cover can only be added to a patch."
-        return
-    
-    # Delete the patch or layer to edit from the section
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = core.parse_section(section_params_output.value)
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
-    for item in params:
-        if str(item) == patch_original_recover:
-            params.remove(item)
-            break
-    
-    # Add the new patch or layer to the section
-    params = params + patch_modificado
-    
-    # Show the actual section with the new patch or layer
-    params_string = str(params).replace("[[", "[\n[")
-    params_string = params_string.replace("], [", "],\n[")
-    params_string = params_string.replace("]]", "]\n]")
-    
-    cover_params_output.value = params_string
-    
+    # Replace the patch (or all the patches of the selection) by the patches with cover
+    try:
+        if cover_scope_dropdown.value == 'selected':
+            params = core.section_cover(params, patch_original, position, **cover)
+        else:
+            base = patch_original[1] if patch_original[0] == 'instance' else patch_original
+            mat_tag = base[2] if cover_scope_dropdown.value == 'mat_tag' else None
+            params = core.section_cover_patches(params, mat_tag, **cover)
+    except ValueError as e:
+        cover_params_output.value = f"Error: {e}"
+        return
+
     # Show the section with cover
+    cover_params_output.value = core.format_section(params)
     show_section_cover()
 
 
 # Function to add cover to the section
 def Cover(change=None):
     # Verify that the element selected is a element
-    selected_patch = edit_patch_layer_dropdown.value
-    if selected_patch == '-':
+    selected_patch = selected_element()[1]
+    if selected_patch is None:
         code_params_output.value = "Error: Select a rect patch to add the cover."
         return
     
-    # Verify that the element is a rect patch.
-    selected_patch = eval(selected_patch)
+    # Verify that the element is a rect patch (the cover of an instance is added to its base element).
+    if selected_patch[0] == 'instance':
+        selected_patch = selected_patch[1]
     patch_layer_type = selected_patch[0]
     type_element = selected_patch[1]
     # If the element is not a rect patch or quad patch, show an error message
@@ -1855,165 +1296,83 @@ def Cover(change=None):
         return
     
     # CREATE COVER
-    # Disable the button
-    cover_button.disabled = True
-    
-    # Disable the other buttons
-    replicate_button.disabled = True
-    add_section_button.disabled = True
-    add_patch_layer_button.disabled = True
-    refresh_button.disabled = True
-    video_button.disabled = True
-    code_button.disabled = True
-    CP_button.disabled = True
-    material_button.disabled = True
-    center_button.disabled = True
-    edit_patch_layer_button.disabled = True
-    edit_patch_layer_dropdown.disabled = True
-    cancel_patch_layer_button.disabled = True
-    section_params_output.disabled = True
-    
-    # Update description of the button
-    save_cover_button.description = 'Save'
+    # Disable the actions on the section while the cover is defined
+    set_ui_mode('cover')
     
     # Show widgets of interest
-    button_box_cover = widgets.HBox([save_cover_button, delete_cover_button])
-    if type_element == 'rect' or type_element == 'quad':
-        text_box_cover_1 = widgets.VBox([cov_L, cov_R], layout=widgets.Layout(width='100px'))
-        text_box_cover_2 = widgets.VBox([cov_U, cov_B], layout=widgets.Layout(width='100px'))
-        text_box_cover = widgets.HBox([text_box_cover_1, text_box_cover_2])
-        text_cover_out = widgets.HTML(value="Section with Cover:", layout=widgets.Layout(margin="9px 0 0 2px"))
-        text_cover_out.style.font_size = '14px'
-        model_widgets.children = [cover_instructions_button, text_box_cover,
-            button_box_cover, text_cover_out, cover_params_output]
-    
-    elif type_element == 'circ':
-        text_box_cover_1 = widgets.VBox([cover_i], layout=widgets.Layout(width='100px'))
-        text_box_cover_2 = widgets.VBox([cover_e], layout=widgets.Layout(width='100px'))
-        text_box_cover = widgets.HBox([text_box_cover_1, text_box_cover_2])
-        text_cover_out = widgets.HTML(value="Section with Cover:", layout=widgets.Layout(margin="9px 0 0 2px"))
-        text_cover_out.style.font_size = '14px'
-        model_widgets.children = [cover_instructions_button, text_box_cover,
-            button_box_cover, text_cover_out, cover_params_output]
+    build_cover_panel()
+    show_cover_panel()
     
     # Calculate the section with cover and show it
     fiber_section_cover()
 
 
+# Function to show the widgets of the cover of the selected patch, or of all the types of patches
+def show_cover_panel(change=None):
+    selected_patch = selected_element()[1]
+    if selected_patch[0] == 'instance':
+        selected_patch = selected_patch[1]
+    covers = []
+    if cover_scope_dropdown.value != 'selected' or selected_patch[1] in ['rect', 'quad']:
+        covers.append(widgets.HBox([widgets.VBox([cov_L, cov_R], layout=widgets.Layout(width='100px')),
+                                    widgets.VBox([cov_U, cov_B], layout=widgets.Layout(width='100px'))]))
+    if cover_scope_dropdown.value != 'selected' or selected_patch[1] == 'circ':
+        covers.append(widgets.HBox([widgets.VBox([cover_i], layout=widgets.Layout(width='100px')),
+                                    widgets.VBox([cover_e], layout=widgets.Layout(width='100px'))]))
+    button_box_cover = widgets.HBox([save_cover_button, delete_cover_button])
+    text_cover_out = widgets.HTML(value="Section with Cover:", layout=widgets.Layout(margin="9px 0 0 2px"))
+    text_cover_out.style.font_size = '14px'
+    model_widgets.children = [cover_instructions_button, cover_scope_dropdown] + covers + [
+        button_box_cover, text_cover_out, cover_params_output]
+
+
+# Function to change the patches with cover
+def change_cover_scope(change=None):
+    if save_cover_button.description == 'Save':
+        show_cover_panel()
+        fiber_section_cover()
+
+
 # %%%% [03-02-03] SHOW_VIDEO
 # Function to show video of the section
 def show_video(change=None):
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
-    # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
+    # Remove unit annotations from the plot parameters (the frames show each copy of the instances)
     graphic_unit = graphic_unit_dropdown.value
-
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    params = core.expand_instances(core.convert_units(params, graphic_unit))
 
     with out:
         # See list to plot programmer window
         # programmer_output.value = str(params)
         out.clear_output(wait=True)
 
-        add_section_button.description = '-'
-        add_patch_layer_button.description = '-'
-        refresh_button.description = '-'
-        code_button.description = '-'
-        cover_button.description = '-'
-        replicate_button.description = '-'
-        CP_button.description = '-'
-        material_button.description = '-'
-        center_button.description = '-'
-        cancel_patch_layer_button.description = '-'
-        edit_patch_layer_button.description = '-'
-        video_button.description = '>>Frames...'
+        # Disable the actions on the section while the video is created
+        set_ui_mode('video')
         code_params_output.value = "Creating frames..."
-        add_section_button.disabled = True
-        add_patch_layer_button.disabled = True
-        refresh_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        center_button.disabled = True
-        material_button.disabled = True
-        cancel_patch_layer_button.disabled = True
-        edit_patch_layer_button.disabled = True
-        element_type_dropdown.disabled = True
-        patch_layer_type_dropdown.disabled = True
-        unit_dropdown.disabled = True
-        secTag_input.disabled = True
-        GJ_input.disabled = True
         model_widgets.children = []
 
-        xlabel_x = f'z [{graphic_unit}]'
-        ylabel_x = f'y [{graphic_unit}]'
-        opsv1.foto_fiber_section(params,
-                                 r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fotogramas_Video", xlabel_x, ylabel_x)  # Crea fotogramas para video.
-        FPS = 15
-        video_button.description = '>>Video...'
-        code_params_output.value = "Creating video..."
-        vid.video(r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fotogramas_Video",
-                  r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fib_Sec_GUI01_fps_" + f"{FPS}.mp4",
-                  FPS)
-        display(Video(filename=f"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fib_Sec_GUI01_fps_{FPS}.mp4", width=640,
-                      height=450))
-
-        add_section_button.description = 'Delete Section'
-        add_patch_layer_button.description = 'Add'
-        refresh_button.description = 'MatTag'
-        video_button.description = video_button.description = 'Video'
-        code_button.description = 'Code'
-        cover_button.description = 'Cover'
-        replicate_button.description = 'Replicate'
-        material_button.description = 'Strength'
-        center_button.description = 'Center'
-        CP_button.description = 'Calculate CP'
-        cancel_patch_layer_button.description = 'Copy'
-        edit_patch_layer_button.description = 'Edit'
-        add_section_button.disabled = False
-        add_patch_layer_button.disabled = False
-        refresh_button.disabled = False
-        code_button.disabled = False
-        cover_button.disabled = False
-        replicate_button.disabled = False
-        CP_button.disabled = False
-        material_button.disabled = False
-        center_button.disabled = False
-        cancel_patch_layer_button.disabled = False
-        edit_patch_layer_button.disabled = False
-        element_type_dropdown.disabled = False
-        patch_layer_type_dropdown.disabled = False
-        unit_dropdown.disabled = False
-        update_input_widgets()
+        try:
+            xlabel_x = f'z [{graphic_unit}]'
+            ylabel_x = f'y [{graphic_unit}]'
+            opsv1.foto_fiber_section(params,
+                                     r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fotogramas_Video", xlabel_x, ylabel_x)  # Crea fotogramas para video.
+            FPS = 15
+            video_button.description = '>>Video...'
+            code_params_output.value = "Creating video..."
+            import S01_GUI01_A03_Video as vid
+            vid.video(r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fotogramas_Video",
+                      r"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fib_Sec_GUI01_fps_" + f"{FPS}.mp4",
+                      FPS)
+            display(Video(filename=f"C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Fib_Sec_GUI01_fps_{FPS}.mp4", width=640,
+                          height=450))
+        finally:
+            set_ui_mode('idle')
         code_params_output.value = "Video created successfully"
 
 
@@ -2021,145 +1380,36 @@ def show_video(change=None):
 # Function to update code for section
 def show_code(change=None):
     try:
-        section = eval(section_params_output.value)
-        if not isinstance(section, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        section = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
-    # Find all unique units in the section list
-    units = set()
-    for item in section:
-        for subitem in item:
-            if isinstance(subitem, str) and '*' in subitem:
-                unit = subitem.split('*')[1]
-                units.add(unit)
-
-    # Create a dictionary for each unique unit with an empty placeholder
-    unit_placeholders = {unit: '' for unit in units}
-
-    # Add a string "$" for recover ' in special elements.
-    special = ['section', 'Fiber', 'patch', 'rect', 'quad', 'circ', 'layer', 'straight', '-GJ']
-    for item in section:
-        for i in range(len(item)):
-            if item[i] in special:
-                item[i] = str('$' + item[i].replace("'", "") + '$')
-
-    # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
-    graphic_unit = graphic_unit_dropdown.value
-
-    # Create the template
-    template = """import opsvis as opsv
-import matplotlib.pyplot as plt
-"""
-    # Write the units to use in the definition of the section.
-    for unit in unit_placeholders:
-        factor = unit_factors_new[graphic_unit][unit]
-        template += f"{unit} = {factor} # Complete this field according the units of your code.\n"
-
-    # Write the section parameters
-    for index, item in enumerate(section):
-        item_str = str(item).replace("'", "")
-        item_str = item_str.replace("$", "'")
-        if index == 0:
-            template += f"\nsection = [{item_str},\n"
-        elif index != 0 and index != len(section) - 1:
-            template += " " * 11 + f"{item_str},\n"
-        else:
-            template += " " * 11 + f"{item_str}]\n"
-
-    # Template code
-    template += """
-opsv.plot_fiber_section(section)        # Display section
-plt.axis('equal')
-plt.savefig(r'img_CP.png')              # Save image
-
-# Define section in Openseespy. Remember define materials before define the section
-opsv.fib_sec_list_to_cmds(section_CP)"""
-    code_params_output.value = template
+    code_params_output.value = core.section_code(section, graphic_unit_dropdown.value)
 
 
 # %%%% [03-02-04] DEFINE_MATERIAL
 # Function to define material strength
 def define_material(change=None):
     if material_button.description == 'Strength':
-        material_button.description = 'Save'
-        material_button.style.button_color = 'green'
-        element_type_dropdown.disabled = True
-        patch_layer_type_dropdown.disabled = True
-        add_section_button.disabled = True
-        add_patch_layer_button.disabled = True
-        refresh_button.disabled = True
-        video_button.disabled = True
-        code_button.disabled = True
-        cover_button.disabled = True
-        replicate_button.disabled = True
-        CP_button.disabled = True
-        center_button.disabled = True
-        secTag_input.disabled = True
-        GJ_input.disabled = True
-        unit_dropdown.disabled = True
+        set_ui_mode('material')
 
         # Widgets to define model
         text_strength = widgets.HTML(value="Material Strength (MatTag): ")
         text_strength.style.font_size = '14px'
-        new_widgets = [f_1_input, f_2_input, f_3_input, f_4_input, f_5_input, f_6_input, f_7_input, f_8_input,
-                       f_9_input, f_10_input, f_11_input, f_12_input, f_13_input, f_14_input, f_15_input, f_16_input,
-                       f_17_input, f_18_input, f_19_input, f_20_input, f_21_input]
+        new_widgets = build_material_panel()
         model_widgets.children = [text_strength] + new_widgets
         # Message to user
         code_params_output.value = "Define the material strength in the input boxes"
 
     else:
-        material_button.description = 'Strength'
-        material_button.style.button_color = None
         # Save the material strength in a .txt file how a dictionary
-        strength_dict = {
-            '1': float(f_1_input.value),
-            '2': float(f_2_input.value),
-            '3': float(f_3_input.value),
-            '4': float(f_4_input.value),
-            '5': float(f_5_input.value),
-            '6': float(f_6_input.value),
-            '7': float(f_7_input.value),
-            '8': float(f_8_input.value),
-            '9': float(f_9_input.value),
-            '10': float(f_10_input.value),
-            '11': float(f_11_input.value),
-            '12': float(f_12_input.value),
-            '13': float(f_13_input.value),
-            '14': float(f_14_input.value),
-            '15': float(f_15_input.value),
-            '16': float(f_16_input.value),
-            '17': float(f_17_input.value),
-            '18': float(f_18_input.value),
-            '19': float(f_19_input.value),
-            '20': float(f_20_input.value),
-            '21': float(f_21_input.value)
-        }
+        strength_dict = {str(tag): float(widget_x.value)
+                         for tag, widget_x in enumerate(build_material_panel(), start=1)}
         with open(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Material_Strength.txt', 'w') as outFile:
             outFile.write(str(strength_dict))
 
-        element_type_dropdown.disabled = False
-        patch_layer_type_dropdown.disabled = False
-        add_section_button.disabled = False
-        add_patch_layer_button.disabled = False
-        refresh_button.disabled = False
-        video_button.disabled = False
-        code_button.disabled = False
-        cover_button.disabled = False
-        replicate_button.disabled = False
-        CP_button.disabled = False
-        center_button.disabled = False
-        unit_dropdown.disabled = False
+        set_ui_mode('idle')
         
         # Clear the widgets
         model_widgets.children = []
@@ -2171,7 +1421,10 @@ def define_material(change=None):
 # %%%% [03-02-05] CALCULATE_CP
 # Function to calculate the plastic centroid
 def call_calculate_cp(fib_sec, materials):
-    adjusted_fib_sec = CP.Seccion_CP(fib_sec, materials)
+    # Only the elements added or edited since the last calculation are discretized again
+    SS.sync_section(section_state, fib_sec)
+    plastic_centroid = SS.plastic_centroid(section_state, materials)
+    adjusted_fib_sec = CP.Seccion_CP(fib_sec, materials, plastic_centroid)
     return adjusted_fib_sec
 
 
@@ -2179,69 +1432,34 @@ def call_calculate_cp(fib_sec, materials):
 def calculate_CP(change=None):
     # Get the section defined by the user using the GUI, and transform it into a list
     try:
-        section = eval(section_params_output.value)
-        if not isinstance(section, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        section = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
-    # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
-    graphic_unit = graphic_unit_dropdown.value
-
     # Replace the string of the unit with a conversion factor
-    section_values = section
-    for item in section_values:
-        for i in range(len(item)):
-            if isinstance(item[i], str) and '*' in item[i]:
-                parts = item[i].split('*')  # Split the string into value and unit
-                value = float(parts[0])  # Convert the value to float
-                unit_str = parts[1]  # Get the conversion factor for the unit
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in item[i]:
-                    factor = factor ** 2
-                item[i] = value * factor  # Convert the value to the desired unit
+    graphic_unit = graphic_unit_dropdown.value
+    section_values = core.convert_units(section, graphic_unit)
 
     # Get the material strength from the dictionary defined in the .txt file
     with open(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Material_Strength.txt', 'r') as file:
         strength_dict = eval(file.read())
 
-    # Obtain the section in the CP
-    cp_section = call_calculate_cp(section_values, strength_dict)
+    # Obtain the section in the CP (a ValueError is raised if a matTag of the section doesn't have strength)
+    try:
+        cp_section = RC.cached(result_cache, section_values, strength_dict, 'CP',
+                               lambda: call_calculate_cp(section_values, strength_dict))
+    except ValueError as e:
+        code_params_output.value = f"Error: {e} Define the strength of the materials with 'Strength'."
+        return
 
     # Add the units to the cp_section. The units are in the same place that was in the original section.
-    try:
-        section = eval(section_params_output.value)
-        if not isinstance(section, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
-        raise ValueError("Invalid list format")
-
-    for item in section:
-        for i in range(len(item)):
-            if isinstance(item[i], str) and '*' in item[i]:
-                value = cp_section[section.index(item)][i]  # Get the value from the cp_section
-                unit_str = '*' + graphic_unit
-                # Check if the unit is squared
-                if '**2' in item[i]:
-                    unit_str = '*' + graphic_unit + '**2'
-                cp_section[section.index(item)][i] = str(value) + unit_str
+    cp_section = core.restore_units(cp_section, section, graphic_unit)
 
     # Display the section around the plastic centroid
-    cp_section_string = str(cp_section).replace("[[", "[\n[")
-    cp_section_string = cp_section_string.replace("], [", "],\n[")
-    cp_section_string = cp_section_string.replace("]]", "]\n]")
     code_params_output.value = f"""Section in PC: (Copy & paste in 'Fiber Section'. Then press 'MatTag')
-{cp_section_string}"""
+{core.format_section(cp_section)}"""
 
 
 # %%%% [03-02-06] SHOW_INSTRUCTIONS
@@ -2266,6 +1484,22 @@ N.7.- Copy the section created and paste in the box Fiber Section. Then, show th
 N.8.- Show the section code using the button 'Code'
 N.9.- Show the center of the fiber section using the button 'Center'.
 N.10.- 'Center' also create a .txt file with the center of the fiber section.
+N.11.- Filter the elements of the list 'Edit Patch/Layer' by type, matTag and zone (ymin, zmin, ymax, zmax), and
+       change the page of the list with the buttons '<' and '>'.
+N.12.- 'Replicate' with Copies 'instance' writes one element and the list of its copies. 'Code' and 'Center'
+       write each copy.
+N.13.- 'Template' creates a whole section (rectangular, circular, T, box or wall with boundary elements) with
+       cover and bars, or a steel shape (W, HSS, Pipe or C) of the table Steel_Shapes.csv. The parameters are in
+       the Graphic Unit (areas in unit**2); the bars are in the limit of the cover, and fiber_size is the size
+       of the fibers.
+N.14.- 'Transform' rotates, mirrors and displaces the selected element, the filtered elements or all the
+       elements.
+N.15.- 'Mesh' chooses the subdivisions of the patches from a fiber size or a maximum number of fibers, and
+       shows the number of fibers before plotting the section. 'Export' writes fewer fibers (ops.fiber) with a
+       maximum error 'tol' in the moments of inertia of each matTag.
+N.16.- 'Check' finds the patches that overlap (area counted twice), the small gaps between patches (less than 1%
+       of the size of the section) and the bars outside the patches. The elements are highlighted in the section
+       and listed in the output window.
 """
 
 
@@ -2273,59 +1507,49 @@ N.10.- 'Center' also create a .txt file with the center of the fiber section.
 # Function to show the center fiber section
 def show_center_section(change=None):
     try:
-        params = eval(section_params_output.value)
-        if not isinstance(params, list):
-            raise ValueError("Invalid list format")
-    except Exception as e:
+        params = indexed_section()
+    except ValueError:
         actual = section_params_output.value
         section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
         return
 
     # Remove unit annotations from the plot parameters
-    unit_factors_new = {
-        'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-        'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-        'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-        'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-        'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-    }
     graphic_unit = graphic_unit_dropdown.value
+    params = core.convert_units(params, graphic_unit)
 
-    for param in params:
-        for i in range(len(param)):
-            if isinstance(param[i], str) and '*' in param[i]:
-                # Split the string into value and unit
-                parts = param[i].split('*')
-                # Convert the value to float
-                value = float(parts[0])
-                # Get the conversion factor for the unit
-                unit_str = parts[1]
-                factor = unit_factors_new[graphic_unit][unit_str]
-                # Check if the unit is squared
-                if '**2' in param[i]:
-                    factor = factor ** 2
-                # Convert the value to the desired unit
-                param[i] = value * factor
+    # Center table and image saved in the cache (the labels of the image depend on the graphic unit)
+    center_result = RC.cache_get(result_cache, params, {}, 'center', graphic_unit)
 
     with out:
         # See list to plot programmer window
         # programmer_output.value = str(params)
         out.clear_output(wait=True)
-        xlabel_x = f'z [{graphic_unit}]'
-        ylabel_x = f'y [{graphic_unit}]'
-        center_fiber_patch, center_fiber_straight, center_fiber_circle, center_fiber_wedge = CF.plot_center_fiber_section(params, xlabel_x, ylabel_x)
-        plt.axis('equal')
-        plt.savefig(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Center_Fib_Sec_GUI01.png')
-        plt.close()
+        if center_result is None:
+            import S01_GUI01_A05_CenterFiber as CF
+            xlabel_x = f'z [{graphic_unit}]'
+            ylabel_x = f'y [{graphic_unit}]'
+            center_fiber_patch, center_fiber_straight, center_fiber_circle, center_fiber_wedge = CF.plot_center_fiber_section(core.expand_instances(params), xlabel_x, ylabel_x)
+            plt.axis('equal')
+            plt.savefig(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Center_Fib_Sec_GUI01.png')
+            plt.close()
+
+            # Create a dictionary with the center of the fiber section
+            center_fiber_dict = {
+                'center_fiber_patch': center_fiber_patch,
+                'center_fiber_straight': center_fiber_straight,
+                'center_fiber_circle': center_fiber_circle,
+                'center_fiber_wedge': center_fiber_wedge
+            }
+            with open(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Center_Fib_Sec_GUI01.png', 'rb') as file:
+                RC.cache_put(result_cache, params, {}, 'center', {'centers': center_fiber_dict, 'png': file.read()},
+                             graphic_unit)
+        else:
+            center_fiber_dict = center_result['centers']
+            with open(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Center_Fib_Sec_GUI01.png', 'wb') as file:
+                file.write(center_result['png'])
         display(Image(filename=r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Center_Fib_Sec_GUI01.png'))
 
-    # Create a dictionary in a .txt file with the center of the fiber section
-    center_fiber_dict = {
-        'center_fiber_patch': center_fiber_patch,
-        'center_fiber_straight': center_fiber_straight,
-        'center_fiber_circle': center_fiber_circle,
-        'center_fiber_wedge': center_fiber_wedge
-    }
+    # Save the dictionary in a .txt file with the center of the fiber section
     with open(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Center_Fiber_Section.txt', 'w') as file:
         file.write(str(center_fiber_dict))
 
@@ -2384,6 +1608,23 @@ edit_patch_layer_dropdown = Dropdown(
     layout=widgets.Layout(width='424px', margin='-3px 0 0 6px')
 )
 
+# Widgets to filter the elements of the edit_patch_layer_dropdown (type, matTag and zone) and change the page
+filter_type_dropdown = Dropdown(
+    options=['All'] + EI.ELEMENT_TYPES,
+    value='All',
+    disabled=True,
+    layout=widgets.Layout(width='115px', margin='2px 0 0 6px')
+)
+filter_mat_input = Text(value='', placeholder='matTag', continuous_update=False, disabled=True,
+                        layout=widgets.Layout(width='55px', margin='2px 0 0 2px'))
+filter_bbox_input = Text(value='', placeholder='ymin, zmin, ymax, zmax', continuous_update=False, disabled=True,
+                         layout=widgets.Layout(width='140px', margin='2px 0 0 2px'))
+previous_page_button = widgets.Button(description='<', disabled=True, layout=widgets.Layout(width='28px'))
+next_page_button = widgets.Button(description='>', disabled=True, layout=widgets.Layout(width='28px'))
+page_text = widgets.HTML(value="1/1 (0)", layout=widgets.Layout(width='62px', margin='2px 0 0 4px'))
+element_picker_widgets = [filter_type_dropdown, filter_mat_input, filter_bbox_input, previous_page_button,
+                          next_page_button]
+
 # Dropdown for set the zoom in the fiber section
 zoom_dropdown = Dropdown(
     options=['1', '1.25', '1.50', '1.75', '2', '2.25', '2.50', '2.75', '3'],
@@ -2442,46 +1683,147 @@ numFiber_input = IntText(value=5, description='numFiber:', layout=layout_var)
 areaFiber_input = Text(value='1.0', description='As:', continuous_update=False, layout=layout_var)
 radius_input = Text(value='20.0', description='radius:', continuous_update=False, layout=layout_var)
 
-# Extra widgets for material strength
-f_1_input = Text(value='250.0', description='f_1:', continuous_update=False, layout=layout_var_2)
-f_2_input = Text(value='0.0', description='f_2:', continuous_update=False, layout=layout_var_2)
-f_3_input = Text(value='0.0', description='f_3:', continuous_update=False, layout=layout_var_2)
-f_4_input = Text(value='0.0', description='f_4:', continuous_update=False, layout=layout_var_2)
-f_5_input = Text(value='0.0', description='f_5:', continuous_update=False, layout=layout_var_2)
-f_6_input = Text(value='0.0', description='f_6:', continuous_update=False, layout=layout_var_2)
-f_7_input = Text(value='0.0', description='f_7:', continuous_update=False, layout=layout_var_2)
-f_8_input = Text(value='0.0', description='f_8:', continuous_update=False, layout=layout_var_2)
-f_9_input = Text(value='0.0', description='f_9:', continuous_update=False, layout=layout_var_2)
-f_10_input = Text(value='0.0', description='f_10:', continuous_update=False, layout=layout_var_2)
-f_11_input = Text(value='0.0', description='f_11:', continuous_update=False, layout=layout_var_2)
-f_12_input = Text(value='0.0', description='f_12:', continuous_update=False, layout=layout_var_2)
-f_13_input = Text(value='0.0', description='f_13:', continuous_update=False, layout=layout_var_2)
-f_14_input = Text(value='0.0', description='f_14:', continuous_update=False, layout=layout_var_2)
-f_15_input = Text(value='0.0', description='f_15:', continuous_update=False, layout=layout_var_2)
-f_16_input = Text(value='0.0', description='f_16:', continuous_update=False, layout=layout_var_2)
-f_17_input = Text(value='0.0', description='f_17:', continuous_update=False, layout=layout_var_2)
-f_18_input = Text(value='0.0', description='f_18:', continuous_update=False, layout=layout_var_2)
-f_19_input = Text(value='0.0', description='f_19:', continuous_update=False, layout=layout_var_2)
-f_20_input = Text(value='0.0', description='f_20:', continuous_update=False, layout=layout_var_2)
-f_21_input = Text(value='0.0', description='f_21:', continuous_update=False, layout=layout_var_2)
-
-# Widgets to define the cover in rect patch and quad
+# Extra widgets for material strength, cover and replicate. These panels are built the first time that they are
+# shown (build_material_panel, build_cover_panel and build_replicate_panel) to reduce the start time of the GUI.
 layout_cover = widgets.Layout(width='135px', margin='0 0 0 -40px')
-cov_L = Text(value='1.0', description='cov_L:', continuous_update=False, layout=layout_cover)
-cov_R = Text(value='1.0', description='cov_R:', continuous_update=False, layout=layout_cover)
-cov_U = Text(value='1.0', description='cov_U:', continuous_update=False, layout=layout_cover)
-cov_B = Text(value='1.0', description='cov_B:', continuous_update=False, layout=layout_cover)
-
-# Widgets to define the cover in circ patch
-cover_e = Text(value='1.0', description='cov_e:', continuous_update=False, layout=layout_cover)
-cover_i = Text(value='1.0', description='cov_i:', continuous_update=False, layout=layout_cover)
-
-# Widgets to define the replicate in straight layer
 layout_replicate = widgets.Layout(width='135px', margin='0 0 0 -40px')
-num_copies = IntText(value=1, description='#_rep:', layout=layout_replicate)
-dis_y = Text(value='40.0', description='dis_y:', continuous_update=False, layout=layout_replicate)
-dis_z = Text(value='0.0', description='dis_z:', continuous_update=False, layout=layout_replicate)
-
+material_inputs = []
+cov_L = cov_R = cov_U = cov_B = cover_e = cover_i = cover_scope_dropdown = None
+num_copies = dis_y = dis_z = None
+replicate_pattern_dropdown = num_columns = rep_angle = center_y = center_z = replicate_copies_dropdown = None
+template_kind_dropdown = template_params_input = cancel_template_button = None
+transform_scope_dropdown = tr_angle = tr_mirror_dropdown = tr_dy = tr_dz = tr_cy = tr_cz = None
+save_transform_button = cancel_transform_button = transform_params_output = None
+mesh_scope_dropdown = mesh_mode_dropdown = mesh_value_input = mesh_estimate_text = None
+preview_mesh_button = save_mesh_button = cancel_mesh_button = coarsen_tolerance_input = export_fibers_button = None
+
+
+# Function to build the widgets of the material strength (f_1 to f_21)
+def build_material_panel():
+    if not material_inputs:
+        for tag in range(1, 22):
+            material_inputs.append(Text(value='250.0' if tag == 1 else '0.0', description=f'f_{tag}:',
+                                        continuous_update=False, layout=layout_var_2))
+        for widget_x in material_inputs:
+            observe_widget(widget_x)
+    return material_inputs
+
+
+# Function to build the widgets to define the cover in rect, quad and circ patch
+def build_cover_panel():
+    global cov_L, cov_R, cov_U, cov_B, cover_e, cover_i, cover_scope_dropdown
+    if cov_L is None:
+        # Patches with cover: the selected patch, the patches with its matTag or all the patches
+        cover_scope_dropdown = Dropdown(options=[('selected patch', 'selected'), ('same matTag', 'mat_tag'),
+                                                 ('all patches', 'all')], value='selected',
+                                        description='Apply to:', layout=widgets.Layout(width='197px'))
+        cov_L = Text(value='1.0', description='cov_L:', continuous_update=False, layout=layout_cover)
+        cov_R = Text(value='1.0', description='cov_R:', continuous_update=False, layout=layout_cover)
+        cov_U = Text(value='1.0', description='cov_U:', continuous_update=False, layout=layout_cover)
+        cov_B = Text(value='1.0', description='cov_B:', continuous_update=False, layout=layout_cover)
+        cover_e = Text(value='1.0', description='cov_e:', continuous_update=False, layout=layout_cover)
+        cover_i = Text(value='1.0', description='cov_i:', continuous_update=False, layout=layout_cover)
+        for widget_x in [cov_L, cov_R, cov_U, cov_B, cover_i, cover_e]:
+            observe_widget_cover_fiber_section(widget_x)
+        cover_scope_dropdown.observe(change_cover_scope, names='value')
+
+
+# Function to build the widgets to define the replicate
+def build_replicate_panel():
+    global num_copies, dis_y, dis_z, replicate_pattern_dropdown, num_columns, rep_angle, center_y, center_z
+    global replicate_copies_dropdown
+    if num_copies is None:
+        replicate_pattern_dropdown = Dropdown(options=['linear', 'grid', 'polar'], value='linear',
+                                              description='Pattern:', layout=widgets.Layout(width='197px'))
+        # Copies written as elements, or as one instance (base element and list of copies)
+        replicate_copies_dropdown = Dropdown(options=[('elements', False), ('instance', True)], value=False,
+                                             description='Copies:', layout=widgets.Layout(width='197px'))
+        num_copies = IntText(value=1, description='#_rep:', layout=layout_replicate)
+        dis_y = Text(value='40.0', description='dis_y:', continuous_update=False, layout=layout_replicate)
+        dis_z = Text(value='0.0', description='dis_z:', continuous_update=False, layout=layout_replicate)
+        # Grid: num_copies + 1 rows (dis_y) and num_columns + 1 columns (dis_z)
+        num_columns = IntText(value=1, description='#_col:', layout=layout_replicate)
+        # Polar: num_copies rotated rep_angle [deg] around (center_y, center_z)
+        rep_angle = Text(value='90.0', description='angle:', continuous_update=False, layout=layout_replicate)
+        center_y = Text(value='0.0', description='c_y:', continuous_update=False, layout=layout_replicate)
+        center_z = Text(value='0.0', description='c_z:', continuous_update=False, layout=layout_replicate)
+        for widget_x in [num_copies, dis_y, dis_z, num_columns, rep_angle, center_y, center_z]:
+            observe_widget_replicate_fiber_section(widget_x)
+        replicate_pattern_dropdown.observe(change_replicate_pattern, names='value')
+        replicate_copies_dropdown.observe(change_replicate_pattern, names='value')
+
+
+# Function to build the widgets of the transform (rotation, mirror and displacement)
+def build_transform_panel():
+    global transform_scope_dropdown, tr_angle, tr_mirror_dropdown, tr_dy, tr_dz, tr_cy, tr_cz
+    global save_transform_button, cancel_transform_button, transform_params_output
+    if transform_scope_dropdown is None:
+        transform_scope_dropdown = Dropdown(options=[('selected element', 'selected'),
+                                                     ('filtered elements', 'filtered'), ('all elements', 'all')],
+                                            value='all', description='Apply to:', layout=widgets.Layout(width='197px'))
+        tr_mirror_dropdown = Dropdown(options=[('-', None), ('y -> -y', 'y'), ('z -> -z', 'z')], value=None,
+                                      layout=widgets.Layout(width='95px', margin='2px 0 2px 3px'))
+        tr_angle = Text(value='0.0', description='angle:', continuous_update=False, layout=layout_replicate)
+        tr_dy = Text(value='0.0', description='dy:', continuous_update=False, layout=layout_replicate)
+        tr_dz = Text(value='0.0', description='dz:', continuous_update=False, layout=layout_replicate)
+        tr_cy = Text(value='0.0', description='c_y:', continuous_update=False, layout=layout_replicate)
+        tr_cz = Text(value='0.0', description='c_z:', continuous_update=False, layout=layout_replicate)
+        save_transform_button = widgets.Button(description='Save', layout=widgets.Layout(width='95px'))
+        save_transform_button.style.button_color = 'green'
+        cancel_transform_button = widgets.Button(description='Cancel', layout=widgets.Layout(width='95px'))
+        cancel_transform_button.style.button_color = 'red'
+        transform_params_output = Textarea(value='', disabled=True,
+                                           layout=widgets.Layout(width='195px', height='205px'))
+        for widget_x in [transform_scope_dropdown, tr_mirror_dropdown, tr_angle, tr_dy, tr_dz, tr_cy, tr_cz]:
+            widget_x.observe(fiber_section_transform, names='value')
+        save_transform_button.on_click(save_transform)
+        cancel_transform_button.on_click(save_transform)
+
+
+# Function to build the widgets of the mesh density (the estimate is updated while the value is written)
+def build_mesh_panel():
+    global mesh_scope_dropdown, mesh_mode_dropdown, mesh_value_input, mesh_estimate_text
+    global preview_mesh_button, save_mesh_button, cancel_mesh_button, coarsen_tolerance_input, export_fibers_button
+    if mesh_scope_dropdown is None:
+        mesh_scope_dropdown = Dropdown(options=[('selected patch', 'selected'), ('filtered elements', 'filtered'),
+                                                ('all patches', 'all')], value='all', description='Apply to:',
+                                       layout=widgets.Layout(width='197px'))
+        mesh_mode_dropdown = Dropdown(options=[('fiber size', 'size'), ('fiber budget', 'budget')], value='size',
+                                      description='Target:', layout=widgets.Layout(width='197px'))
+        mesh_value_input = Text(value='1.0', description='size:', continuous_update=True,
+                                layout=widgets.Layout(width='197px'))
+        mesh_estimate_text = widgets.HTML(value='', layout=widgets.Layout(margin='4px 0 4px 4px'))
+        preview_mesh_button = widgets.Button(description='Preview', layout=widgets.Layout(width='63px'))
+        save_mesh_button = widgets.Button(description='Save', layout=widgets.Layout(width='63px'))
+        save_mesh_button.style.button_color = 'green'
+        cancel_mesh_button = widgets.Button(description='Cancel', layout=widgets.Layout(width='62px'))
+        cancel_mesh_button.style.button_color = 'red'
+        # Maximum relative error of the second moments of the coarse fibers
+        coarsen_tolerance_input = Text(value='0.01', description='tol:', continuous_update=False,
+                                       layout=widgets.Layout(width='130px'))
+        export_fibers_button = widgets.Button(description='Export', layout=widgets.Layout(width='63px'))
+        export_fibers_button.on_click(export_coarse_fibers)
+        for widget_x in [mesh_scope_dropdown, mesh_value_input]:
+            widget_x.observe(estimate_mesh, names='value')
+        mesh_mode_dropdown.observe(change_mesh_mode, names='value')
+        preview_mesh_button.on_click(preview_mesh)
+        save_mesh_button.on_click(save_mesh)
+        cancel_mesh_button.on_click(save_mesh)
+
+
+# Function to build the widgets of the templates (one parameter 'name = value' per line)
+def build_template_panel():
+    global template_kind_dropdown, template_params_input, cancel_template_button
+    if template_kind_dropdown is None:
+        template_kind_dropdown = Dropdown(options=list(TP.TEMPLATES), value='rectangular', description='Type:',
+                                          layout=widgets.Layout(width='197px'))
+        template_params_input = Textarea(value='', continuous_update=False,
+                                         layout=widgets.Layout(width='197px', height='250px'))
+        cancel_template_button = widgets.Button(description='Cancel', layout=widgets.Layout(width='197px'))
+        cancel_template_button.style.button_color = 'red'
+        template_kind_dropdown.observe(change_template_kind, names='value')
+        template_params_input.observe(template_section_preview, names='value')
+        cancel_template_button.on_click(cancel_template)
 
 
 # %%% [04-02] ZIP WDGT
@@ -2502,10 +1844,14 @@ unit_dropdown.observe(update_input_widgets, names='value')
 
 # ADD SECTION
 # Button to add section.
-add_section_button_layout = widgets.Layout(width='197px', height='27px', margin='3px 0 9px 0')
+add_section_button_layout = widgets.Layout(width='122px', height='27px', margin='3px 0 9px 0')
 add_section_button = widgets.Button(description='Add Section', layout=add_section_button_layout)
 add_section_button.style.button_color = 'green'
 add_section_button.on_click(add_section_definition)
+# Button to create the section with a template
+template_button_layout = widgets.Layout(width='71px', height='27px', margin='3px 0 9px 4px')
+template_button = widgets.Button(description='Template', layout=template_button_layout)
+template_button.on_click(define_template)
 
 # ADD PATCH/LAYER
 # Button to add patch/layer.
@@ -2590,12 +1936,24 @@ center_button.on_click(show_center_section)
 
 # PLASTIC CENTROID
 # Button to calculate the plastic centroid
-CP_button_layout = widgets.Layout(width='101px')  # con 5 82px
+CP_button_layout = widgets.Layout(width='94px')  # con 5 82px
 CP_button = widgets.Button(description='-', layout=CP_button_layout)
 CP_button.disabled = True
 CP_button.on_click(calculate_CP)
+# Button to rotate, mirror and displace elements
+transform_button = widgets.Button(description='-', layout=widgets.Layout(width='72px'))
+transform_button.disabled = True
+transform_button.on_click(transform)
+# Button to choose the mesh density of the patches
+mesh_button = widgets.Button(description='-', layout=widgets.Layout(width='54px'))
+mesh_button.disabled = True
+mesh_button.on_click(mesh)
+# Button to check the overlaps, gaps and bars outside the patches
+check_button = widgets.Button(description='-', layout=widgets.Layout(width='52px'))
+check_button.disabled = True
+check_button.on_click(check_fiber_section)
 # Button to define the material strength
-materia_button_layout = widgets.Layout(width='101px')  # con 5 82px
+materia_button_layout = widgets.Layout(width='94px')  # con 5 82px
 material_button = widgets.Button(description='-', layout=materia_button_layout)
 material_button.disabled = True
 material_button.on_click(define_material)
@@ -2630,13 +1988,7 @@ widgets_list = [
     yI_input, zI_input, yJ_input, zJ_input, yK_input,
     zK_input, yL_input, zL_input, yc_input, zc_input,
     r_ini_input, r_end_input, ang_ini_input, ang_end_input,
-    areaFiber_input, radius_input,
-    f_1_input, f_2_input, f_3_input, f_4_input, f_5_input, f_6_input, f_7_input, f_8_input,
-    f_9_input, f_10_input, f_11_input, f_12_input, f_13_input, f_14_input, f_15_input, f_16_input,
-    f_17_input, f_18_input, f_19_input, f_20_input, f_21_input,
-    cov_L, cov_R, cov_U, cov_B,
-    cover_i, cover_e,
-    num_copies, dis_y, dis_z
+    areaFiber_input, radius_input
 ]
 
 # Widgets in the GUI that affect the graphic
@@ -2666,15 +2018,6 @@ int_widgets_list = [
     numFiber_input, material_tag_input
 ]
 
-# Widgets in the GUI that affect the cover graphic
-widgets_cover = [
-    cov_L, cov_R, cov_U, cov_B, cover_i, cover_e
-]
-
-# Widgets in the GUI that affect the replicate graphic
-widgets_replicate = [
-    num_copies, dis_y, dis_z
-]
 
     
 # Helper function to observe the widgets that must be integers
@@ -2851,6 +2194,12 @@ def observe_dropdown_zoom(dropdown_x):
             show_section_cover()
         elif save_replicate_button == 'Save':
             show_section_replicate()
+        elif template_button.description == 'Create':
+            template_section_preview()
+        elif ui_state['mode'] == 'transform':
+            fiber_section_transform()
+        elif ui_state['mode'] == 'mesh':
+            preview_mesh()
         else:
             show_section()
     dropdown_x.observe(handler_6, names='value')
@@ -2865,10 +2214,6 @@ for widget in int_widgets_list:
 for widget in widgets_list:
     if widget in widgets_section_patch_layer:
         observe_widget_fiber_section(widget)
-    elif widget in widgets_cover:
-        observe_widget_cover_fiber_section(widget)
-    elif widget in widgets_replicate:
-        observe_widget_replicate_fiber_section(widget)
     else:
         observe_widget(widget)
 
@@ -2883,7 +2228,47 @@ for dropdown in dropdowns_visualization:
 
 # %%% [04-09] OBSERVE DROPDOWN EDIT PATCH/LAYER
 # Observe changes in the textareas and modify the options in related widgets
-section_params_output.observe(update_edit_patch_layer_options, names='value')
+section_params_output.observe(section_text_changed, names='value')
+
+# Function to show the section with some elements highlighted
+def show_highlighted_section(section, positions):
+    """
+    Args:
+        section (list): Section list (with units).
+        positions (list): Positions of the elements to highlight.
+    """
+    # Assign material tag = 21 to higligth the patches or layers
+    # The 21 element of matcolor define the color of the patch or layer highlight
+    params = [list(item) for item in section]
+    for position in positions:
+        if position >= len(params):
+            continue
+        if params[position][0] == 'instance':
+            # All the copies of an instance are highlighted
+            params[position][1] = list(params[position][1])
+            params[position][1][2] = 21
+        elif params[position][0] in ['patch', 'layer']:
+            params[position][2] = 21
+
+    # Graph the section with the patches or layers higligth equal to show_section()
+
+    # Remove unit annotations from the plot parameters
+    graphic_unit = graphic_unit_dropdown.value
+    params = core.convert_units(params, graphic_unit)
+
+    with out:
+        # See list to plot programmer window
+        # programmer_output.value = str(params)
+        out.clear_output(wait=True)
+        xlabel_x = f'z [{graphic_unit}]'
+        ylabel_x = f'y [{graphic_unit}]'
+        zoom = float(zoom_dropdown.value)
+        opsv1.plot_fiber_section(params, xlabel_x, ylabel_x, zoom=zoom)
+        plt.axis('equal')
+        plt.savefig(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Fib_Sec_GUI01.png')
+        plt.close()
+        display(Image(filename=r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Fib_Sec_GUI01.png'))
+
 
 # Function to identify the patch or layer selected in the edit_patch_layer_dropdown
 def update_patch_layer_image(change):
@@ -2891,65 +2276,18 @@ def update_patch_layer_image(change):
     # Higligth the patch or layer selected in the edit_patch_layer_dropdown
     if edit_patch_layer_dropdown.value != '-':
         
-        # Make a list with the actual fiber section
+        # Actual fiber section
         try:
-            params = eval(section_params_output.value)
-            if not isinstance(params, list):
-                raise ValueError("Invalid list format")
-        except Exception as e:
+            params = indexed_section()
+        except ValueError:
             actual = section_params_output.value
             section_params_output.value = str(actual) + "\nError: Check the actual section parameters."
             return
         
-        # Find the element that is selected in the edit_patch_layer_dropdown
-        patch_layer_higligth = eval(edit_patch_layer_dropdown.value)
-        for item in params:
-            if item == patch_layer_higligth:
-                
-                # Assign material tag = 21 to higligth the patch or layer 
-                item[2] = 21
-                # The 21 element of matcolor define the color of the patch or layer highlight
-        
-        # Graph the section with the patch or layer higligth equal to show_section()
-        
-        # Remove unit annotations from the plot parameters
-        unit_factors_new = {
-            'm': {'m': 1, 'cm': 0.01, 'mm': 0.001, 'ft': 0.3048, 'IN': 0.0254},
-            'cm': {'m': 100, 'cm': 1, 'mm': 0.1, 'ft': 30.48, 'IN': 2.54},
-            'mm': {'m': 1000, 'cm': 10, 'mm': 1, 'ft': 304.8, 'IN': 25.4},
-            'ft': {'m': 3.2808399, 'cm': 0.032808399, 'mm': 0.00328084, 'ft': 1, 'IN': 0.0833333},
-            'IN': {'m': 39.370079, 'cm': 0.39370079, 'mm': 0.039370079, 'ft': 12, 'IN': 1}
-        }
-        graphic_unit = graphic_unit_dropdown.value
-
-        for param in params:
-            for i in range(len(param)):
-                if isinstance(param[i], str) and '*' in param[i]:
-                    # Split the string into value and unit
-                    parts = param[i].split('*')
-                    # Convert the value to float
-                    value = float(parts[0])
-                    # Get the conversion factor for the unit
-                    unit_str = parts[1]
-                    factor = unit_factors_new[graphic_unit][unit_str]
-                    # Check if the unit is squared
-                    if '**2' in param[i]:
-                        factor = factor ** 2
-                    # Convert the value to the desired unit
-                    param[i] = value * factor
-
-        with out:
-            # See list to plot programmer window
-            # programmer_output.value = str(params)
-            out.clear_output(wait=True)
-            xlabel_x = f'z [{graphic_unit}]'
-            ylabel_x = f'y [{graphic_unit}]'
-            zoom = float(zoom_dropdown.value)
-            opsv1.plot_fiber_section(params, xlabel_x, ylabel_x, zoom=zoom)
-            plt.axis('equal')
-            plt.savefig(r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Fib_Sec_GUI01.png')
-            plt.close()
-            display(Image(filename=r'C_GUI01_Fiber_Section/C_GUI01_Fiber_Section/Secciones/Fib_Sec_GUI01.png'))
+        position = edit_patch_layer_dropdown.value
+        if position >= len(params):
+            return
+        show_highlighted_section(params, [position])
         code_params_output.value = "Section created successfully"
         
             
@@ -2958,6 +2296,144 @@ def update_patch_layer_image(change):
 # to show the patch or layer selected
 edit_patch_layer_dropdown.observe(update_patch_layer_image, names='value')
 
+# Filters and pages of the elements in the edit_patch_layer_dropdown
+for widget_x in [filter_type_dropdown, filter_mat_input, filter_bbox_input]:
+    widget_x.observe(filter_element_options, names='value')
+previous_page_button.on_click(change_element_page)
+next_page_button.on_click(change_element_page)
+
+
+# %%% [04-10] UI MODES
+# State of the widgets in each mode of the interface. Each widget has the attributes to set ('button_color' is an
+# attribute of the style of the button). The modes are applied with set_ui_mode.
+# Buttons of the actions in the fiber section, with their description when a section is defined
+tool_buttons = {refresh_button: 'MatTag', video_button: 'Video', code_button: 'Code', cover_button: 'Cover',
+                replicate_button: 'Replicate', material_button: 'Strength', CP_button: 'Solve PC',
+                center_button: 'Center', transform_button: 'Transform', mesh_button: 'Mesh',
+                check_button: 'Check'}
+section_buttons = [add_section_button, add_patch_layer_button, cancel_patch_layer_button, edit_patch_layer_button]
+definition_dropdowns = [element_type_dropdown, patch_layer_type_dropdown, unit_dropdown]
+
+
+# Function to create the state of a mode from a base mode and the changes
+def merge_ui_states(base, *changes):
+    states = {widget_x: dict(attrs) for widget_x, attrs in base.items()}
+    for change in changes:
+        for widget_x, attrs in change.items():
+            states.setdefault(widget_x, {}).update(attrs)
+    return states
+
+
+# Section defined, without actions in progress
+ui_idle = merge_ui_states(
+    {add_section_button: {'description': 'Delete Section', 'disabled': False, 'button_color': 'red'},
+     add_patch_layer_button: {'description': 'Define', 'disabled': False, 'button_color': None},
+     cancel_patch_layer_button: {'description': 'Copy', 'disabled': False, 'button_color': None},
+     edit_patch_layer_button: {'description': 'Edit', 'disabled': False, 'button_color': None},
+     material_button: {'button_color': None},
+     template_button: {'description': 'Template', 'disabled': True, 'button_color': None},
+     save_cover_button: {'description': '-'},
+     save_replicate_button: {'description': '-'},
+     edit_patch_layer_dropdown: {'disabled': False},
+     section_params_output: {'disabled': False},
+     zoom_dropdown: {'disabled': False},
+     fiber_plot_dropdown: {'disabled': False},
+     graphic_unit_dropdown: {'disabled': True},
+     secTag_input: {'disabled': True},
+     GJ_input: {'disabled': True}},
+    {button: {'description': description, 'disabled': False} for button, description in tool_buttons.items()},
+    {dropdown: {'disabled': True} for dropdown in definition_dropdowns},
+    {widget_x: {'disabled': False} for widget_x in element_picker_widgets})
+
+# All the actions on the section disabled
+ui_locked = {widget_x: {'disabled': True} for widget_x in section_buttons + list(tool_buttons)
+             + [edit_patch_layer_dropdown] + element_picker_widgets}
+
+UI_MODES = {
+    # Without section
+    'empty': merge_ui_states(
+        ui_idle,
+        {button: {'description': '-', 'disabled': True} for button in section_buttons[1:] + list(tool_buttons)},
+        {widget_x: {'disabled': True} for widget_x in element_picker_widgets},
+        {add_section_button: {'description': 'Add Section', 'button_color': 'green'},
+         template_button: {'disabled': False},
+         zoom_dropdown: {'disabled': True},
+         fiber_plot_dropdown: {'disabled': True},
+         graphic_unit_dropdown: {'disabled': False},
+         secTag_input: {'disabled': False},
+         GJ_input: {'disabled': False}}),
+    'idle': ui_idle,
+    # Definition of a patch or layer (new, edited or copied)
+    'editing': merge_ui_states(
+        ui_idle, ui_locked,
+        {add_patch_layer_button: {'description': 'Save', 'disabled': False, 'button_color': 'green'},
+         cancel_patch_layer_button: {'description': 'Delete', 'disabled': False, 'button_color': 'red'},
+         edit_patch_layer_button: {'description': 'Hide', 'disabled': False, 'button_color': 'blue'}},
+        {dropdown: {'disabled': False} for dropdown in definition_dropdowns}),
+    # Definition of a patch or layer, with the new element hidden
+    'editing_hidden': merge_ui_states(
+        ui_idle, ui_locked,
+        {edit_patch_layer_button: {'description': 'Show', 'disabled': False, 'button_color': 'magenta'},
+         add_patch_layer_button: {'description': 'Save', 'button_color': 'green'},
+         cancel_patch_layer_button: {'description': 'Delete', 'button_color': 'red'}}),
+    'cover': merge_ui_states(
+        ui_idle, ui_locked,
+        {section_params_output: {'disabled': True},
+         save_cover_button: {'description': 'Save'}}),
+    'replicate': merge_ui_states(
+        ui_idle, ui_locked,
+        {section_params_output: {'disabled': True},
+         save_replicate_button: {'description': 'Save'}}),
+    'transform': merge_ui_states(
+        ui_idle, ui_locked,
+        {section_params_output: {'disabled': True}}),
+    'mesh': merge_ui_states(
+        ui_idle, ui_locked,
+        {section_params_output: {'disabled': True}}),
+    'material': merge_ui_states(
+        ui_idle, ui_locked,
+        {material_button: {'description': 'Save', 'disabled': False, 'button_color': 'green'}}),
+    # Creation of the frames and the video
+    'video': merge_ui_states(
+        ui_idle, ui_locked,
+        {button: {'description': '-'} for button in section_buttons + list(tool_buttons)},
+        {video_button: {'description': '>>Frames...'}}),
+}
+# Preview of a template (without section)
+UI_MODES['template'] = merge_ui_states(
+    UI_MODES['empty'],
+    {add_section_button: {'disabled': True},
+     template_button: {'description': 'Create', 'button_color': 'green'},
+     graphic_unit_dropdown: {'disabled': True},
+     section_params_output: {'disabled': True},
+     zoom_dropdown: {'disabled': False},
+     fiber_plot_dropdown: {'disabled': False}})
+
+# Actual mode of the interface
+ui_state = {'mode': 'empty'}
+
+
+# Function to apply a mode of the interface
+def set_ui_mode(mode):
+    """
+    Set the attributes of all the widgets of the mode. The changes of each widget (and of its style) are sent to
+    the browser together when the mode is applied, in one message per widget, instead of one message for each
+    attribute. The attributes that don't change are not sent.
+    """
+    states = UI_MODES[mode]
+    with ExitStack() as stack:
+        for widget_x, attrs in states.items():
+            stack.enter_context(widget_x.hold_sync())
+            if 'button_color' in attrs:
+                stack.enter_context(widget_x.style.hold_sync())
+        for widget_x, attrs in states.items():
+            for name, value in attrs.items():
+                target = widget_x.style if name == 'button_color' else widget_x
+                if getattr(target, name) != value:
+                    setattr(target, name, value)
+    ui_state['mode'] = mode
+
+
 # %% [05] LAYOUT
 # Layout of the interface
 
@@ -2974,7 +2450,7 @@ text3 = widgets.HTML(
     value="<i>Inspired by plotSection matlab function (D. Vamvatsikos) and Opsvis library (S. Kokot). GUI developed by M. Ortiz.<i>",
     layout=widgets.Layout(width='700px', margin="0 0 0 2px"))
 text3.style.font_size = '14px'
-text_section_pc = widgets.HTML(value="<i>Calculate Plastic Centroid:</i>", layout=widgets.Layout(width='164px', margin="4px 0 0 57px"))
+text_section_pc = widgets.HTML(value="<i>PC:</i>", layout=widgets.Layout(width='30px', margin="4px 0 0 8px"))
 text_section_pc.style.font_size = '14px'
 text_section = widgets.HTML(value="Define Section:", layout=widgets.Layout(margin="0px 0 0 2px"))
 text_section.style.font_size = '14px'
@@ -2985,9 +2461,10 @@ text_edit_fiber_section.style.font_size = '14px'
 
 # %%% [05-01] INTERFACE
 button_box_1 = HBox([add_patch_layer_button, cancel_patch_layer_button, edit_patch_layer_button])
-button_box_2 = HBox([text_section_pc, material_button, CP_button])
+button_box_2 = HBox([transform_button, mesh_button, check_button, text_section_pc, material_button, CP_button])
+section_button_box = HBox([add_section_button, template_button])
 section_inputs_list = [instructions_button, text_section, graphic_unit_dropdown, secTag_input, GJ_input,
-                       add_section_button, text_patch_layer, element_type_dropdown, patch_layer_type_dropdown, 
+                       section_button_box, text_patch_layer, element_type_dropdown, patch_layer_type_dropdown, 
                        unit_dropdown, button_box_1, text_edit_fiber_section]
 section_widgets.children = section_inputs_list
 
@@ -2998,7 +2475,10 @@ medium_input_2 = HBox([cover_button, replicate_button, code_button, refresh_butt
 zoom_dropdown_box = HBox([zoom_dropdown], layout=widgets.Layout(margin="0 0 0 0"))
 fiber_plot_dropdown_box = HBox([fiber_plot_dropdown], layout=widgets.Layout(margin="0 0 0 0"))
 text_box = HBox([text, fiber_plot_dropdown_box, zoom_dropdown_box])
-left_side = VBox([title_input, upper_input, edit_patch_layer_dropdown, text_box, medium_input_2, button_box_2, section_params_output])
+element_picker_box = HBox([filter_type_dropdown, filter_mat_input, filter_bbox_input, previous_page_button, page_text,
+                           next_page_button])
+left_side = VBox([title_input, upper_input, edit_patch_layer_dropdown, element_picker_box, text_box, medium_input_2,
+                  button_box_2, section_params_output])
 right_side = VBox([out], layout=widgets.Layout(width='660px', height='806px'))
 interface = HBox([left_side, right_side])
 interface2 = VBox([interface, text2, code_params_output, text3])